@@ -0,0 +1,175 @@
+"""
+Global API call quotas (config.API_CALL_LIMIT per external API).
+
+Each worker process reserves calls from the shared `api_usage` counter in
+blocks of API_QUOTA_LEASE_SIZE, using one atomic UPDATE that can never push the
+count past the limit. The calls in a block are then handed out from memory, so
+most outbound requests cost no database round trip at all. With
+API_QUOTA_WINDOW_SECONDS set, the counter resets once the window since
+`last_reset` has elapsed, and leftover calls from the previous window are
+discarded.
+
+Usage:
+    async with api_quota.reserve("anthropic"):
+        message = await client.messages.create(...)
+
+A call is only given back to the local bucket when the block fails before the
+request could reach the provider (connection, connect-timeout or pool errors).
+Anything else, including cancellation of an abandoned hedge or a stream the
+client walked away from, keeps the call counted, since the provider may already
+have billed it. Unused calls are returned to the global count by stop().
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Optional
+import anyio
+import httpx
+import database
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when an API's global call limit has been reached."""
+
+
+# Transport errors raised before any request bytes are sent
+_NEVER_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def request_never_sent(error: BaseException) -> bool:
+    """True if error (or an error it wraps, e.g. anthropic.APIConnectionError) shows the request was never sent."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, _NEVER_SENT_ERRORS):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class _Bucket:
+    """Calls this process has reserved for one API but not yet used."""
+
+    def __init__(self):
+        self.tokens = 0
+        self.window_start: Optional[datetime] = None
+        self.expires_at: Optional[float] = None  # monotonic time the reserved block stops being valid
+        self.lock = asyncio.Lock()
+        # Metrics
+        self.calls = 0
+        self.refunds = 0
+        self.rejections = 0
+        self.leases = 0
+        self.leased_calls = 0
+        self.global_count: Optional[int] = None
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+
+_buckets: dict[str, _Bucket] = {}
+
+
+def _bucket(api_name: str) -> _Bucket:
+    bucket = _buckets.get(api_name)
+    if bucket is None:
+        bucket = _buckets[api_name] = _Bucket()
+    return bucket
+
+
+def get_api_quota_stats() -> dict:
+    """Return per-API usage, leasing and rejection counts for this process."""
+    return {
+        "limit": config.API_CALL_LIMIT,
+        "window_seconds": config.API_QUOTA_WINDOW_SECONDS,
+        "lease_size": config.API_QUOTA_LEASE_SIZE,
+        "apis": {
+            api_name: {
+                "calls": bucket.calls,
+                "refunds": bucket.refunds,
+                "rejections": bucket.rejections,
+                "local_tokens": bucket.tokens,
+                "leases": bucket.leases,
+                "leased_calls": bucket.leased_calls,
+                "global_count": bucket.global_count,
+            }
+            for api_name, bucket in _buckets.items()
+        },
+    }
+
+
+async def _lease(api_name: str, bucket: _Bucket):
+    """Reserve the next block of calls from the global counter."""
+    result = await database.reserve_api_calls(
+        api_name,
+        config.API_QUOTA_LEASE_SIZE,
+        config.API_CALL_LIMIT,
+        config.API_QUOTA_WINDOW_SECONDS
+    )
+    if result is None:
+        return
+    bucket.leases += 1
+    bucket.leased_calls += result['granted']
+    bucket.global_count = result['call_count']
+    bucket.tokens = result['granted']
+    bucket.window_start = result['window_start']
+    remaining = result['window_remaining_seconds']
+    bucket.expires_at = time.monotonic() + remaining if remaining is not None else None
+
+
+async def acquire(api_name: str):
+    """Take one call from the quota, leasing a new block if needed. Raises QuotaExceededError."""
+    bucket = _bucket(api_name)
+    async with bucket.lock:
+        if bucket.expired():
+            # Calls left over from a window that has since reset
+            bucket.tokens = 0
+        if bucket.tokens <= 0:
+            await _lease(api_name, bucket)
+        if bucket.tokens <= 0:
+            bucket.rejections += 1
+            raise QuotaExceededError(
+                f"{api_name.capitalize()} API call limit reached ({config.API_CALL_LIMIT} calls). Please try again later."
+            )
+        bucket.tokens -= 1
+        bucket.calls += 1
+
+
+def refund(api_name: str):
+    """Give back a call that was acquired but not made successfully."""
+    bucket = _bucket(api_name)
+    if not bucket.expired():
+        bucket.tokens += 1
+    bucket.calls -= 1
+    bucket.refunds += 1
+
+
+@asynccontextmanager
+async def reserve(api_name: str) -> AsyncIterator[None]:
+    """Hold one call of an API's quota for the block; refunded only if the request was never sent."""
+    await acquire(api_name)
+    try:
+        yield
+    except BaseException as e:
+        if request_never_sent(e):
+            refund(api_name)
+        raise
+
+
+async def stop():
+    """Return this process's unused calls to the global counters (call before closing the pool)."""
+    with anyio.CancelScope(shield=True):
+        for api_name, bucket in _buckets.items():
+            if bucket.tokens > 0 and bucket.window_start is not None and not bucket.expired():
+                try:
+                    await database.release_api_calls(api_name, bucket.tokens, bucket.window_start)
+                except Exception:
+                    logger.exception(f"Failed to release {bucket.tokens} unused {api_name} calls")
+                    continue
+                bucket.tokens = 0
@@ -0,0 +1,208 @@
+"""
+Query plan benchmark for the managed secondary indexes (database.MANAGED_INDEXES).
+
+Builds a synthetic dataset in a scratch schema (default: 20k topics, 1M
+arguments, 2M votes, 300k comments), runs each hot query path with
+EXPLAIN (ANALYZE, BUFFERS) before and after creating the indexes, and prints the
+plans plus mean latency over repeated runs. The scratch schema is dropped at the
+end, so it is safe to point at a development database.
+
+Run from the backend directory:
+    python -m benchmarks.index_plans --arguments 1000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from psycopg import AsyncConnection
+
+# Add parent directory to path for database/config imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import database
+
+SCHEMA = "bench_indexes"
+
+# Same column layout as the application tables (foreign keys omitted for load speed)
+TABLES = [
+    """CREATE TABLE topics (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        proposition TEXT NOT NULL,
+        created_by TEXT NOT NULL,
+        user_id UUID,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )""",
+    """CREATE TABLE arguments (
+        id SERIAL PRIMARY KEY,
+        topic_id UUID NOT NULL,
+        side TEXT NOT NULL,
+        title TEXT NOT NULL,
+        content TEXT NOT NULL,
+        author TEXT NOT NULL,
+        user_id UUID,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        validity_score INTEGER,
+        votes INTEGER DEFAULT 0
+    )""",
+    """CREATE TABLE votes (
+        id SERIAL PRIMARY KEY,
+        argument_id INTEGER NOT NULL,
+        user_id UUID NOT NULL,
+        vote_type TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(argument_id, user_id)
+    )""",
+    """CREATE TABLE comments (
+        id SERIAL PRIMARY KEY,
+        argument_id INTEGER NOT NULL,
+        comment TEXT NOT NULL,
+        user_id UUID,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )""",
+    """CREATE TABLE jobs (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        job_type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        user_id UUID
+    )""",
+]
+
+USER_COUNT = 50_000
+
+# (label, SQL, parameter query) - parameters are sampled from the synthetic data
+QUERIES = [
+    (
+        "topic page arguments by validity",
+        "SELECT * FROM arguments WHERE topic_id = %s ORDER BY validity_score DESC NULLS LAST, created_at DESC",
+        "SELECT topic_id FROM arguments ORDER BY random() LIMIT 1",
+    ),
+    (
+        "topic arguments in submission order",
+        "SELECT * FROM arguments WHERE topic_id = %s ORDER BY created_at ASC",
+        "SELECT topic_id FROM arguments ORDER BY random() LIMIT 1",
+    ),
+    (
+        "votes for an argument",
+        "SELECT vote_type FROM votes WHERE argument_id = %s",
+        "SELECT argument_id FROM votes ORDER BY random() LIMIT 1",
+    ),
+    (
+        "comment thread",
+        "SELECT id, argument_id, comment, created_at FROM comments WHERE argument_id = %s ORDER BY created_at ASC",
+        "SELECT argument_id FROM comments ORDER BY random() LIMIT 1",
+    ),
+    (
+        "user topic count",
+        "SELECT COUNT(*) FROM topics WHERE user_id = %s",
+        "SELECT user_id FROM topics ORDER BY random() LIMIT 1",
+    ),
+    (
+        "user argument count",
+        "SELECT COUNT(*) FROM arguments WHERE user_id = %s",
+        "SELECT user_id FROM arguments ORDER BY random() LIMIT 1",
+    ),
+]
+
+
+async def _load(conn: AsyncConnection, topic_count: int, argument_count: int, comment_count: int):
+    """Create the scratch schema and fill it with synthetic rows."""
+    await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    await conn.execute(f"CREATE SCHEMA {SCHEMA}")
+    await conn.execute(f"SET search_path TO {SCHEMA}, public")
+    for ddl in TABLES:
+        await conn.execute(ddl)
+
+    started = time.perf_counter()
+    await conn.execute("""
+        INSERT INTO topics (proposition, created_by, user_id, created_at)
+        SELECT 'Proposition ' || g, 'bench', md5((g %% %s)::text)::uuid,
+               now() - make_interval(secs => g)
+        FROM generate_series(1, %s) g
+    """, (USER_COUNT, topic_count))
+    await conn.execute("""
+        INSERT INTO arguments (topic_id, side, title, content, author, user_id, created_at, validity_score)
+        SELECT t.ids[1 + (g %% array_length(t.ids, 1))],
+               CASE WHEN g %% 2 = 0 THEN 'pro' ELSE 'con' END,
+               'Argument ' || g, repeat('lorem ipsum ', 20), 'bench',
+               md5((g %% %s)::text)::uuid,
+               now() - make_interval(secs => g),
+               CASE WHEN g %% 10 = 0 THEN NULL ELSE 1 + g %% 5 END
+        FROM generate_series(1, %s) g,
+             (SELECT array_agg(id) AS ids FROM topics) t
+    """, (USER_COUNT, argument_count))
+    await conn.execute("""
+        INSERT INTO votes (argument_id, user_id, vote_type)
+        SELECT a.id, md5(((a.id * 7 + n) %% %s)::text)::uuid,
+               CASE WHEN n = 1 THEN 'upvote' ELSE 'downvote' END
+        FROM arguments a, generate_series(1, 2) n
+    """, (USER_COUNT,))
+    await conn.execute("""
+        INSERT INTO comments (argument_id, comment, user_id, created_at)
+        SELECT 1 + (g * 7919) %% %s, 'Comment ' || g, md5((g %% %s)::text)::uuid,
+               now() - make_interval(secs => g)
+        FROM generate_series(1, %s) g
+    """, (argument_count, USER_COUNT, comment_count))
+    await conn.execute("ANALYZE")
+    print(f"Loaded synthetic data in {time.perf_counter() - started:.1f}s")
+
+
+async def _measure(conn: AsyncConnection, runs: int) -> dict[str, tuple[str, float]]:
+    """Return {label: (plan text, mean latency in ms)} for every query path."""
+    results = {}
+    for label, sql, param_sql in QUERIES:
+        cursor = await conn.execute(param_sql)
+        param = (await cursor.fetchone())[0]
+
+        cursor = await conn.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", (param,))
+        plan = "\n".join(row[0] for row in await cursor.fetchall())
+
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            cursor = await conn.execute(sql, (param,))
+            await cursor.fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+        results[label] = (plan, statistics.mean(timings))
+    return results
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, default=20_000)
+    parser.add_argument("--arguments", type=int, default=1_000_000)
+    parser.add_argument("--comments", type=int, default=300_000)
+    parser.add_argument("--runs", type=int, default=20, help="timed executions per query")
+    parser.add_argument("--keep", action="store_true", help="leave the scratch schema in place")
+    args = parser.parse_args()
+
+    async with await AsyncConnection.connect(database.CONNINFO, autocommit=True) as conn:
+        try:
+            await _load(conn, args.topics, args.arguments, args.comments)
+            before = await _measure(conn, args.runs)
+
+            started = time.perf_counter()
+            for extension in database.MANAGED_EXTENSIONS:
+                await conn.execute(f"CREATE EXTENSION IF NOT EXISTS {extension} SCHEMA public")
+            for name, table, definition in database.MANAGED_INDEXES:
+                await conn.execute(f"CREATE INDEX CONCURRENTLY {name} ON {table} {definition}")
+            await conn.execute("ANALYZE")
+            print(f"Built {len(database.MANAGED_INDEXES)} indexes in {time.perf_counter() - started:.1f}s")
+            after = await _measure(conn, args.runs)
+
+            for label, _, _ in QUERIES:
+                print(f"\n=== {label} ===")
+                print(f"--- before ({before[label][1]:.2f} ms mean) ---\n{before[label][0]}")
+                print(f"--- after ({after[label][1]:.2f} ms mean) ---\n{after[label][0]}")
+
+            print(f"\nSummary (mean ms over {args.runs} runs):")
+            for label, _, _ in QUERIES:
+                print(f"  {label:<40} {before[label][1]:>10.2f} -> {after[label][1]:>8.2f}")
+        finally:
+            if not args.keep:
+                await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark for structured output parsing.
+
+Times validating a record_verdict tool call straight into ValidityAssessment
+against the shared text fallback (llm_gateway.parse_structured_text) on the
+reply shapes Claude produces when it answers in text instead: bare JSON, fenced
+JSON, JSON wrapped in prose, and malformed JSON. Prints microseconds per parse
+and how many samples the fallback rejects. No network or database access.
+
+Run from the backend directory:
+    python -m benchmarks.structured_parsing --iterations 20000
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+# Add parent directory to path for llm_gateway/fact_checker imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import llm_gateway
+from fact_checker import ValidityAssessment
+
+TOOL_INPUT = {
+    "is_relevant": True,
+    "validity_score": 4,
+    "reasoning": 'Two independent sources report the figure; one calls it "preliminary".',
+    "key_urls": ["https://example.org/a", "https://example.org/b", "https://example.org/c"],
+}
+
+BARE = json.dumps(TOOL_INPUT)
+
+TEXT_SAMPLES = {
+    "bare json": BARE,
+    "fenced json": f"```json\n{BARE}\n```",
+    "prose-wrapped json": f"Here is my verdict:\n{BARE}\nLet me know if you need more detail.",
+    "unescaped quotes": BARE.replace('\\"preliminary\\"', '"preliminary"'),
+    "truncated": BARE[:len(BARE) // 2],
+}
+
+
+def _parses(text: str) -> bool:
+    try:
+        llm_gateway.parse_structured_text(text, ValidityAssessment)
+        return True
+    except ValueError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    seconds = timeit.timeit(lambda: ValidityAssessment.model_validate(TOOL_INPUT), number=args.iterations)
+    print(f"{'tool call input':<22} {seconds / args.iterations * 1e6:>8.2f} us/parse")
+
+    rejected = 0
+    for label, text in TEXT_SAMPLES.items():
+        ok = _parses(text)
+        rejected += not ok
+        seconds = timeit.timeit(lambda: _parses(text), number=args.iterations)
+        print(f"{label:<22} {seconds / args.iterations * 1e6:>8.2f} us/parse  {'ok' if ok else 'rejected'}")
+
+    print(f"fallback rejected {rejected}/{len(TEXT_SAMPLES)} text samples")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Concurrency benchmark for vote toggling.
+
+Creates a throwaway topic, one argument and a set of users, then has every user
+click upvote/downvote at random, all at once, including bursts of simultaneous
+clicks from the same user. Afterwards arguments.votes must equal the sum
+recomputed from the votes table. Prints throughput and latency percentiles, then
+deletes everything it created.
+
+Run from the backend directory against a development database:
+    python -m benchmarks.vote_concurrency --users 200 --clicks 10
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add parent directory to path for database/config imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import database
+
+
+async def _setup(user_count: int) -> tuple[str, int, list[uuid.UUID]]:
+    """Create the benchmark topic, argument and users."""
+    user_ids = [uuid.uuid4() for _ in range(user_count)]
+    for user_id in user_ids:
+        await database.get_or_create_user_profile(
+            user_id=user_id,
+            email=f"{user_id}@bench.invalid",
+            username=f"bench-{user_id}"
+        )
+    topic = await database.create_topic("Vote concurrency benchmark", "bench")
+    argument_id = await database.create_argument(
+        topic_id=topic['id'],
+        side='pro',
+        title="Benchmark argument",
+        content="Benchmark argument",
+        author="bench"
+    )
+    return topic['id'], argument_id, user_ids
+
+
+async def _teardown(topic_id: str, user_ids: list[uuid.UUID]):
+    """Delete the benchmark topic (cascades to arguments and votes) and users."""
+    async with database.get_cursor() as cursor:
+        await cursor.execute("DELETE FROM topics WHERE id = %s", (topic_id,))
+        await cursor.execute(
+            "DELETE FROM user_profiles WHERE id = ANY(%s)",
+            ([str(user_id) for user_id in user_ids],)
+        )
+
+
+async def _check_counter(argument_id: int) -> tuple[int, int]:
+    """Return (arguments.votes, votes recomputed from the votes table)."""
+    async with database.get_cursor() as cursor:
+        await cursor.execute("SELECT votes FROM arguments WHERE id = %s", (argument_id,))
+        counter = (await cursor.fetchone())[0]
+        await cursor.execute(
+            """SELECT COALESCE(SUM(CASE vote_type WHEN 'upvote' THEN 1 ELSE -1 END), 0)
+               FROM votes WHERE argument_id = %s""",
+            (argument_id,)
+        )
+        recount = (await cursor.fetchone())[0]
+    return counter, recount
+
+
+async def _voter(argument_id: int, user_id: uuid.UUID, clicks: int, burst: int, latencies: list[float]):
+    """Click votes for one user; every burst clicks are fired simultaneously."""
+    for _ in range(0, clicks, burst):
+        async def click():
+            vote = random.choice([database.upvote_argument, database.downvote_argument])
+            started = time.perf_counter()
+            await vote(argument_id, user_id)
+            latencies.append(time.perf_counter() - started)
+        await asyncio.gather(*(click() for _ in range(burst)))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100, help="number of simulated voters")
+    parser.add_argument("--clicks", type=int, default=10, help="vote clicks per voter")
+    parser.add_argument("--burst", type=int, default=2, help="simultaneous clicks per voter")
+    args = parser.parse_args()
+
+    await database.open_pool()
+    topic_id = None
+    user_ids: list[uuid.UUID] = []
+    try:
+        topic_id, argument_id, user_ids = await _setup(args.users)
+        latencies: list[float] = []
+
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            _voter(argument_id, user_id, args.clicks, args.burst, latencies)
+            for user_id in user_ids
+        ))
+        elapsed = time.perf_counter() - started
+
+        counter, recount = await _check_counter(argument_id)
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(f"{len(latencies)} votes in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} votes/s)")
+        print(f"latency p50={quantiles[49] * 1000:.1f}ms p95={quantiles[94] * 1000:.1f}ms p99={quantiles[98] * 1000:.1f}ms")
+        print(f"arguments.votes={counter} recount={recount} -> {'OK' if counter == recount else 'MISMATCH'}")
+        if counter != recount:
+            sys.exit(1)
+    finally:
+        if topic_id:
+            await _teardown(topic_id, user_ids)
+        await database.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,26 +1,20 @@
-import json
-from typing import List, Dict
-from anthropic import Anthropic
+from typing import AsyncIterator, List, Dict
+import llm_gateway
 import database
 from config import config
+from models import SummaryResponse
+from utils.json_stream import JsonObjectStream
+from utils.single_flight import single_flight
 
-# Initialize Claude client using immutable config
-client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+# Use immutable config values (Claude calls go through llm_gateway)
 MODEL = config.CLAUDE_MODEL_STANDARD
-API_CALL_LIMIT = config.API_CALL_LIMIT
 
-def generate_summary(proposition: str, pro_arguments: List[Dict], con_arguments: List[Dict]) -> Dict:
-    """
-    Generate overall summary, consensus view, and timeline view using Claude.
-    
-    Args:
-        proposition: The debate proposition
-        pro_arguments: List of pro arguments with 'title' and 'content'
-        con_arguments: List of con arguments with 'title' and 'content'
-    
-    Returns:
-        Dictionary with 'overall_summary', 'consensus_view', and 'timeline_view'
-    """
+# Tool used to return the analysis (schema: SummaryResponse)
+SUMMARY_TOOL_NAME = "record_analysis"
+SUMMARY_TOOL_DESCRIPTION = "Record the summary, consensus view and timeline for the debate."
+
+def _summary_prompt(proposition: str, pro_arguments: List[Dict], con_arguments: List[Dict]) -> str:
+    """Build the analysis prompt for a debate."""
     # Format pro arguments
     pro_text = "\n\n".join([
         f"Title: {arg['title']}\nContent: {arg['content']}"
@@ -33,7 +27,7 @@ def generate_summary(proposition: str, pro_arguments: List[Dict], con_arguments:
         for arg in con_arguments
     ]) if con_arguments else "None"
     
-    prompt = f"""You are analyzing a debate on: {proposition}
+    return f"""You are analyzing a debate on: {proposition}
 
 PRO arguments:
 {pro_text}
@@ -44,53 +38,104 @@ CON arguments:
 Generate three things (do NOT create new arguments, only synthesize existing):
 1. OVERALL SUMMARY (2-3 paragraphs): What is this debate about? Main themes?
 2. CONSENSUS VIEW (1-2 paragraphs): What do both sides agree on?
-3. TIMELINE VIEW: Chronological narrative based on arguments. Array of {{"period": "...", "description": "..."}}
+3. TIMELINE VIEW: Chronological narrative based on arguments, as a list of entries each with a period and a description
 
-Return JSON only: {{"overall_summary": "...", "consensus_view": "...", "timeline_view": [...]}}"""
+Record the result with the record_analysis tool."""
+
+async def generate_summary(proposition: str, pro_arguments: List[Dict], con_arguments: List[Dict]) -> Dict:
+    """
+    Generate overall summary, consensus view, and timeline view using Claude.
+    
+    Args:
+        proposition: The debate proposition
+        pro_arguments: List of pro arguments with 'title' and 'content'
+        con_arguments: List of con arguments with 'title' and 'content'
+    
+    Returns:
+        Dictionary with 'overall_summary', 'consensus_view', and 'timeline_view'
+    """
+    prompt = _summary_prompt(proposition, pro_arguments, con_arguments)
 
     try:
-        # Check API limit before making call
-        if not database.check_api_limit("anthropic", API_CALL_LIMIT):
-            raise RuntimeError("Anthropic API call limit reached (750 calls). Please try again later.")
-        
-        message = client.messages.create(
+        analysis = await llm_gateway.structured(
+            prompt,
+            SummaryResponse,
             model=MODEL,
             max_tokens=4096,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            tool_name=SUMMARY_TOOL_NAME,
+            tool_description=SUMMARY_TOOL_DESCRIPTION
         )
+        return analysis.model_dump()
         
-        # Increment counter after successful call
-        database.increment_api_call_count("anthropic")
-        
-        # Extract text from response
-        response_text = message.content[0].text.strip()
-        
-        # Try to parse JSON from the response
-        # Claude might wrap JSON in markdown code blocks
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-        
-        result = json.loads(response_text)
-        
-        # Validate structure
-        if not all(key in result for key in ['overall_summary', 'consensus_view', 'timeline_view']):
-            raise ValueError("Missing required fields in Claude response")
-        
-        if not isinstance(result['timeline_view'], list):
-            raise ValueError("timeline_view must be a list")
-        
-        return result
-        
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse JSON from Claude response: {e}")
+    except llm_gateway.StructuredOutputError as e:
+        raise ValueError(f"Failed to parse Claude response: {e}")
     except Exception as e:
         raise RuntimeError(f"Claude API error: {e}")
 
 
+async def summarize_topic(topic_id: str, topic_data: Dict) -> Dict:
+    """
+    Generate and save the analysis for a topic.
+    Concurrent requests for the same topic (in any worker) share one Claude call.
+    
+    Args:
+        topic_id: The topic UUID
+        topic_data: Topic dict from database.get_topic_with_arguments
+    
+    Returns:
+        Dictionary with 'overall_summary', 'consensus_view', and 'timeline_view'
+    """
+    async def compute() -> Dict:
+        result = await generate_summary(
+            proposition=topic_data['proposition'],
+            pro_arguments=topic_data['pro_arguments'],
+            con_arguments=topic_data['con_arguments']
+        )
+        await database.update_topic_analysis(
+            topic_id=topic_id,
+            overall_summary=result['overall_summary'],
+            consensus_view=result['consensus_view'],
+            timeline_view=result['timeline_view']
+        )
+        return result
+    
+    return await single_flight("generate_summary", topic_id, compute)
+
+
+async def stream_summary(topic_id: str, topic_data: Dict) -> AsyncIterator[Dict]:
+    """
+    Generate the analysis for a topic, yielding each part as soon as Claude has written it:
+    {"event": "overall_summary" | "consensus_view", "text": ...},
+    {"event": "timeline_entry", "period": ..., "description": ...}, and finally
+    {"event": "done", **analysis} once the complete result is validated and saved.
+    Raises ValueError if the streamed reply doesn't match SummaryResponse.
+    """
+    prompt = _summary_prompt(topic_data['proposition'], topic_data['pro_arguments'], topic_data['con_arguments'])
+    decoder = JsonObjectStream()
+    fields: Dict = {}
+    async for fragment in llm_gateway.stream_tool_input(
+        prompt,
+        SummaryResponse,
+        model=MODEL,
+        max_tokens=4096,
+        tool_name=SUMMARY_TOOL_NAME,
+        tool_description=SUMMARY_TOOL_DESCRIPTION
+    ):
+        for kind, key, value in decoder.feed(fragment):
+            if kind == "field":
+                fields[key] = value
+                if key in ("overall_summary", "consensus_view"):
+                    yield {"event": key, "text": value}
+            elif key == "timeline_view" and isinstance(value, dict):
+                yield {"event": "timeline_entry", **value}
+
+    if not decoder.finished:
+        raise ValueError("Claude stopped before finishing the analysis")
+    analysis = SummaryResponse.model_validate(fields).model_dump()
+    await database.update_topic_analysis(
+        topic_id=topic_id,
+        overall_summary=analysis['overall_summary'],
+        consensus_view=analysis['consensus_view'],
+        timeline_view=analysis['timeline_view']
+    )
+    yield {"event": "done", **analysis}
@@ -34,9 +34,37 @@ class _ImmutableConfig:
         '_db_name',
         '_db_user',
         '_db_password',
+        '_db_pool_min_size',
+        '_db_pool_max_size',
+        '_db_pool_timeout',
         '_supabase_url',
         '_supabase_anon_key',
         '_supabase_jwt_secret',
+        '_auth_remote_fallback',
+        '_auth_token_cache_ttl_seconds',
+        '_auth_token_cache_max_entries',
+        '_profile_cache_ttl_seconds',
+        '_profile_cache_max_entries',
+        '_llm_timeout_seconds',
+        '_search_timeout_seconds',
+        '_llm_deadline_seconds',
+        '_llm_max_retries',
+        '_llm_retry_base_seconds',
+        '_llm_hedge_after_seconds',
+        '_job_worker_concurrency',
+        '_job_poll_interval_seconds',
+        '_topic_refresh_failure_backoff_seconds',
+        '_verdict_cache_ttl_seconds',
+        '_verdict_cache_max_entries',
+        '_evidence_cache_ttl_seconds',
+        '_fact_check_batch_concurrency',
+        '_anthropic_max_concurrency',
+        '_tavily_max_concurrency',
+        '_vote_buffer_enabled',
+        '_vote_flush_interval_seconds',
+        '_single_flight_lease_seconds',
+        '_api_quota_window_seconds',
+        '_api_quota_lease_size',
         '_initialized',
     )
     
@@ -72,11 +100,53 @@ class _ImmutableConfig:
         object.__setattr__(self, '_db_name', os.getenv("DB_NAME", "postgres"))
         object.__setattr__(self, '_db_user', os.getenv("DB_USER", "postgres"))
         object.__setattr__(self, '_db_password', os.getenv("DB_PASSWORD"))
+        object.__setattr__(self, '_db_pool_min_size', int(os.getenv("DB_POOL_MIN_SIZE", "2")))
+        object.__setattr__(self, '_db_pool_max_size', int(os.getenv("DB_POOL_MAX_SIZE", "10")))
+        object.__setattr__(self, '_db_pool_timeout', float(os.getenv("DB_POOL_TIMEOUT", "30")))
         
         # Supabase configuration
         object.__setattr__(self, '_supabase_url', os.getenv("SUPABASE_URL"))
         object.__setattr__(self, '_supabase_anon_key', os.getenv("SUPABASE_ANON_KEY"))
         object.__setattr__(self, '_supabase_jwt_secret', os.getenv("SUPABASE_JWT_SECRET"))
+        object.__setattr__(self, '_auth_remote_fallback', os.getenv("AUTH_REMOTE_FALLBACK", "false").lower() in ("1", "true", "yes"))
+        object.__setattr__(self, '_auth_token_cache_ttl_seconds', int(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", "300")))
+        object.__setattr__(self, '_auth_token_cache_max_entries', int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "4096")))
+        object.__setattr__(self, '_profile_cache_ttl_seconds', int(os.getenv("PROFILE_CACHE_TTL_SECONDS", "120")))
+        object.__setattr__(self, '_profile_cache_max_entries', int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "4096")))
+        
+        # Outbound API timeouts
+        object.__setattr__(self, '_llm_timeout_seconds', float(os.getenv("LLM_TIMEOUT_SECONDS", "60")))
+        object.__setattr__(self, '_search_timeout_seconds', float(os.getenv("SEARCH_TIMEOUT_SECONDS", "20")))
+        object.__setattr__(self, '_llm_deadline_seconds', float(os.getenv("LLM_DEADLINE_SECONDS", "120")))
+        object.__setattr__(self, '_llm_max_retries', int(os.getenv("LLM_MAX_RETRIES", "3")))
+        object.__setattr__(self, '_llm_retry_base_seconds', float(os.getenv("LLM_RETRY_BASE_SECONDS", "0.5")))
+        object.__setattr__(self, '_llm_hedge_after_seconds', float(os.getenv("LLM_HEDGE_AFTER_SECONDS", "0")))
+        
+        # Background job worker
+        object.__setattr__(self, '_job_worker_concurrency', int(os.getenv("JOB_WORKER_CONCURRENCY", "4")))
+        object.__setattr__(self, '_job_poll_interval_seconds', float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1")))
+        object.__setattr__(self, '_topic_refresh_failure_backoff_seconds', int(os.getenv("TOPIC_REFRESH_FAILURE_BACKOFF_SECONDS", "600")))
+        object.__setattr__(self, '_single_flight_lease_seconds', int(os.getenv("SINGLE_FLIGHT_LEASE_SECONDS", "120")))
+        
+        # Fact-check verdict cache
+        object.__setattr__(self, '_verdict_cache_ttl_seconds', int(os.getenv("VERDICT_CACHE_TTL_SECONDS", str(7 * 24 * 3600))))
+        object.__setattr__(self, '_verdict_cache_max_entries', int(os.getenv("VERDICT_CACHE_MAX_ENTRIES", "2048")))
+        
+        # Evidence search cache
+        object.__setattr__(self, '_evidence_cache_ttl_seconds', int(os.getenv("EVIDENCE_CACHE_TTL_SECONDS", str(3 * 24 * 3600))))
+        
+        # Concurrency budgets for outbound API calls (per worker process)
+        object.__setattr__(self, '_fact_check_batch_concurrency', int(os.getenv("FACT_CHECK_BATCH_CONCURRENCY", "4")))
+        object.__setattr__(self, '_anthropic_max_concurrency', int(os.getenv("ANTHROPIC_MAX_CONCURRENCY", "8")))
+        object.__setattr__(self, '_tavily_max_concurrency', int(os.getenv("TAVILY_MAX_CONCURRENCY", "4")))
+        
+        # API quota reservation
+        object.__setattr__(self, '_api_quota_window_seconds', int(os.getenv("API_QUOTA_WINDOW_SECONDS", "0")))
+        object.__setattr__(self, '_api_quota_lease_size', int(os.getenv("API_QUOTA_LEASE_SIZE", "10")))
+        
+        # Write-behind vote counters
+        object.__setattr__(self, '_vote_buffer_enabled', os.getenv("VOTE_BUFFER_ENABLED", "false").lower() in ("1", "true", "yes"))
+        object.__setattr__(self, '_vote_flush_interval_seconds', float(os.getenv("VOTE_FLUSH_INTERVAL_SECONDS", "1")))
         
         # Mark initialization complete
         object.__setattr__(self, '_initialized', True)
@@ -148,6 +218,21 @@ class _ImmutableConfig:
         """Get the database password."""
         return self._db_password
     
+    @property
+    def DB_POOL_MIN_SIZE(self) -> int:
+        """Minimum number of pooled database connections kept open."""
+        return self._db_pool_min_size
+    
+    @property
+    def DB_POOL_MAX_SIZE(self) -> int:
+        """Maximum number of pooled database connections."""
+        return self._db_pool_max_size
+    
+    @property
+    def DB_POOL_TIMEOUT(self) -> float:
+        """Seconds to wait for a pooled connection before failing."""
+        return self._db_pool_timeout
+    
     # =========================================================================
     # Supabase Configuration (Immutable Properties)
     # =========================================================================
@@ -167,6 +252,31 @@ class _ImmutableConfig:
         """Get the Supabase JWT secret."""
         return self._supabase_jwt_secret
     
+    @property
+    def AUTH_REMOTE_FALLBACK(self) -> bool:
+        """Ask Supabase to verify tokens that cannot be verified locally."""
+        return self._auth_remote_fallback
+    
+    @property
+    def AUTH_TOKEN_CACHE_TTL_SECONDS(self) -> int:
+        """Upper bound on how long a verified token is cached (never past its expiry)."""
+        return self._auth_token_cache_ttl_seconds
+    
+    @property
+    def AUTH_TOKEN_CACHE_MAX_ENTRIES(self) -> int:
+        """Maximum verified tokens kept in each worker's cache."""
+        return self._auth_token_cache_max_entries
+    
+    @property
+    def PROFILE_CACHE_TTL_SECONDS(self) -> int:
+        """How long a resolved user profile is cached per worker."""
+        return self._profile_cache_ttl_seconds
+    
+    @property
+    def PROFILE_CACHE_MAX_ENTRIES(self) -> int:
+        """Maximum user profiles kept in each worker's cache."""
+        return self._profile_cache_max_entries
+    
     # =========================================================================
     # API Rate Limits (Immutable Constants)
     # =========================================================================
@@ -176,6 +286,122 @@ class _ImmutableConfig:
         """Global API call limit per service (immutable)."""
         return 750
     
+    @property
+    def API_QUOTA_WINDOW_SECONDS(self) -> int:
+        """Length of the API call limit window; 0 means the count never resets."""
+        return self._api_quota_window_seconds
+    
+    @property
+    def API_QUOTA_LEASE_SIZE(self) -> int:
+        """API calls each worker process reserves from the global quota at a time."""
+        return self._api_quota_lease_size
+    
+    # =========================================================================
+    # Outbound API Timeouts (Immutable Properties)
+    # =========================================================================
+    
+    @property
+    def LLM_TIMEOUT_SECONDS(self) -> float:
+        """Per-attempt timeout for Claude requests."""
+        return self._llm_timeout_seconds
+    
+    @property
+    def LLM_DEADLINE_SECONDS(self) -> float:
+        """Total time budget for a Claude call, including retries."""
+        return self._llm_deadline_seconds
+    
+    @property
+    def LLM_MAX_RETRIES(self) -> int:
+        """Retries for a Claude call after a 429, 5xx or connection error."""
+        return self._llm_max_retries
+    
+    @property
+    def LLM_RETRY_BASE_SECONDS(self) -> float:
+        """Base delay for jittered exponential backoff between Claude retries."""
+        return self._llm_retry_base_seconds
+    
+    @property
+    def LLM_HEDGE_AFTER_SECONDS(self) -> float:
+        """Send a duplicate Claude request if the first hasn't answered by then; 0 disables hedging."""
+        return self._llm_hedge_after_seconds
+    
+    @property
+    def SEARCH_TIMEOUT_SECONDS(self) -> float:
+        """Per-call timeout for Tavily search requests."""
+        return self._search_timeout_seconds
+    
+    @property
+    def FACT_CHECK_BATCH_CONCURRENCY(self) -> int:
+        """Arguments verified in parallel by one verify-all batch."""
+        return self._fact_check_batch_concurrency
+    
+    @property
+    def ANTHROPIC_MAX_CONCURRENCY(self) -> int:
+        """Maximum in-flight Claude requests per worker process."""
+        return self._anthropic_max_concurrency
+    
+    @property
+    def TAVILY_MAX_CONCURRENCY(self) -> int:
+        """Maximum in-flight Tavily searches per worker process."""
+        return self._tavily_max_concurrency
+    
+    # =========================================================================
+    # Voting (Immutable Properties)
+    # =========================================================================
+    
+    @property
+    def VOTE_BUFFER_ENABLED(self) -> bool:
+        """Buffer vote counter updates in memory and flush them in batches."""
+        return self._vote_buffer_enabled
+    
+    @property
+    def VOTE_FLUSH_INTERVAL_SECONDS(self) -> float:
+        """How often buffered vote counter deltas are written to Postgres."""
+        return self._vote_flush_interval_seconds
+    
+    # =========================================================================
+    # Background Jobs (Immutable Properties)
+    # =========================================================================
+    
+    @property
+    def JOB_WORKER_CONCURRENCY(self) -> int:
+        """Number of jobs each worker process runs concurrently."""
+        return self._job_worker_concurrency
+    
+    @property
+    def JOB_POLL_INTERVAL_SECONDS(self) -> float:
+        """Seconds a worker sleeps when the job queue is empty."""
+        return self._job_poll_interval_seconds
+    
+    @property
+    def TOPIC_REFRESH_FAILURE_BACKOFF_SECONDS(self) -> int:
+        """Seconds after a failed topic refresh before viewing the topic queues another."""
+        return self._topic_refresh_failure_backoff_seconds
+    
+    @property
+    def SINGLE_FLIGHT_LEASE_SECONDS(self) -> int:
+        """How long a single-flight lease lasts without renewal; holders renew it every third of this."""
+        return self._single_flight_lease_seconds
+    
+    # =========================================================================
+    # Caching (Immutable Properties)
+    # =========================================================================
+    
+    @property
+    def VERDICT_CACHE_TTL_SECONDS(self) -> int:
+        """How long a cached fact-check verdict stays valid."""
+        return self._verdict_cache_ttl_seconds
+    
+    @property
+    def VERDICT_CACHE_MAX_ENTRIES(self) -> int:
+        """Maximum verdicts kept in each worker's in-process cache."""
+        return self._verdict_cache_max_entries
+    
+    @property
+    def EVIDENCE_CACHE_TTL_SECONDS(self) -> int:
+        """How long cached Tavily search results stay valid."""
+        return self._evidence_cache_ttl_seconds
+    
     # =========================================================================
     # Model Configuration (Immutable Constants)
     # =========================================================================
@@ -1,10 +1,14 @@
-import psycopg2
+from contextlib import asynccontextmanager
 from datetime import timezone
-from psycopg2.extras import RealDictCursor
 from datetime import datetime
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from uuid import UUID
 import json
+from psycopg import AsyncConnection, AsyncCursor
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row, tuple_row
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool
 from config import config
 
 # Database connection parameters from immutable config
@@ -14,18 +18,64 @@ DB_NAME = config.DB_NAME
 DB_USER = config.DB_USER
 DB_PASSWORD = config.DB_PASSWORD
 
-def get_db_connection():
-    """Get a database connection."""
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        database=DB_NAME,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        sslmode='require',
-        connect_timeout=10
-    )
-    return conn
+# Shared asyncio connection pool: TLS handshakes happen once per pooled connection,
+# not once per query, and waiting on Postgres never blocks the event loop.
+# Connections are health-checked on checkout. Opened/closed by open_pool()/close_pool().
+CONNINFO = make_conninfo(
+    host=DB_HOST,
+    port=DB_PORT,
+    dbname=DB_NAME,
+    user=DB_USER,
+    password=DB_PASSWORD,
+    sslmode='require',
+    connect_timeout=10
+)
+
+pool = AsyncConnectionPool(
+    conninfo=CONNINFO,
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    timeout=config.DB_POOL_TIMEOUT,
+    check=AsyncConnectionPool.check_connection,
+    name="debately",
+    open=False
+)
+
+async def open_pool():
+    """Open the connection pool (call once the event loop is running)."""
+    await pool.open()
+
+async def close_pool():
+    """Close the connection pool and all its connections."""
+    await pool.close()
+
+@asynccontextmanager
+async def get_cursor(dict_rows: bool = False) -> AsyncIterator[AsyncCursor]:
+    """
+    Check out a pooled connection and yield a cursor.
+    Commits when the block exits cleanly, rolls back on error, and always
+    returns the connection to the pool.
+    """
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row if dict_rows else tuple_row) as cursor:
+            yield cursor
+
+def get_pool_stats() -> dict:
+    """Return connection pool size and wait metrics."""
+    stats = pool.get_stats()
+    return {
+        'pool_min': stats.get('pool_min'),
+        'pool_max': stats.get('pool_max'),
+        'pool_size': stats.get('pool_size'),
+        'pool_available': stats.get('pool_available'),
+        'requests_waiting': stats.get('requests_waiting', 0),
+        'requests_num': stats.get('requests_num', 0),
+        'requests_queued': stats.get('requests_queued', 0),
+        'requests_wait_ms': stats.get('requests_wait_ms', 0),
+        'requests_errors': stats.get('requests_errors', 0),
+        'connections_errors': stats.get('connections_errors', 0),
+        'connections_lost': stats.get('connections_lost', 0),
+    }
 
 def _format_datetime_to_iso(dt) -> Optional[str]:
     """Convert datetime object to ISO format string."""
@@ -35,115 +85,102 @@ def _format_datetime_to_iso(dt) -> Optional[str]:
         return dt.isoformat()
     return str(dt) if dt else None
 
-def init_db():
+async def init_db():
     """Initialize the database with tables."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Create user_profiles table first (referenced by other tables)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS user_profiles (
-            id UUID PRIMARY KEY,
-            username TEXT UNIQUE NOT NULL,
-            email TEXT NOT NULL,
-            avatar_url TEXT,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # Create topics table (using UUID for id)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS topics (
-            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            proposition TEXT NOT NULL,
-            created_by TEXT NOT NULL,
-            user_id UUID,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            overall_summary TEXT,
-            consensus_view TEXT,
-            timeline_view TEXT,
-            FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL
-        )
-    """)
-    
-    # Create arguments table (topic_id is UUID)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS arguments (
-            id SERIAL PRIMARY KEY,
-            topic_id UUID NOT NULL,
-            side TEXT NOT NULL CHECK(side IN ('pro', 'con')),
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            sources TEXT,
-            author TEXT NOT NULL,
-            user_id UUID,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE,
-            FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS comments (
-            id SERIAL PRIMARY KEY,
-            argument_id INTEGER NOT NULL,
-            comment TEXT NOT NULL,
-            user_id UUID,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (argument_id) REFERENCES arguments(id) ON DELETE CASCADE,
-            FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL
-        )
-    """)
-    
-    # Create api_usage table for tracking global API call limits
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS api_usage (
-            id SERIAL PRIMARY KEY,
-            api_name TEXT UNIQUE NOT NULL,
-            call_count INTEGER NOT NULL DEFAULT 0,
-            last_reset TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
-    
+    async with get_cursor() as cursor:
+        # Create user_profiles table first (referenced by other tables)
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS user_profiles (
+                id UUID PRIMARY KEY,
+                username TEXT UNIQUE NOT NULL,
+                email TEXT NOT NULL,
+                avatar_url TEXT,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Create topics table (using UUID for id)
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS topics (
+                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                proposition TEXT NOT NULL,
+                created_by TEXT NOT NULL,
+                user_id UUID,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                overall_summary TEXT,
+                consensus_view TEXT,
+                timeline_view TEXT,
+                FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL
+            )
+        """)
+
+        # Create arguments table (topic_id is UUID)
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS arguments (
+                id SERIAL PRIMARY KEY,
+                topic_id UUID NOT NULL,
+                side TEXT NOT NULL CHECK(side IN ('pro', 'con')),
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                sources TEXT,
+                author TEXT NOT NULL,
+                user_id UUID,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE,
+                FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL
+            )
+        """)
+
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS comments (
+                id SERIAL PRIMARY KEY,
+                argument_id INTEGER NOT NULL,
+                comment TEXT NOT NULL,
+                user_id UUID,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (argument_id) REFERENCES arguments(id) ON DELETE CASCADE,
+                FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL
+            )
+        """)
+
+        # Create api_usage table for tracking global API call limits
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_usage (
+                id SERIAL PRIMARY KEY,
+                api_name TEXT UNIQUE NOT NULL,
+                call_count INTEGER NOT NULL DEFAULT 0,
+                last_reset TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
     # Run migration to add user_id columns if they don't exist
-    migrate_add_user_id_columns()
-    
+    await migrate_add_user_id_columns()
+
     # Run migration to create votes table if it doesn't exist
-    migrate_create_votes_table()
-
-def ensure_argument_matches_table():
-    """Ensure the argument_matches table exists (safe to call repeatedly)."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS argument_matches (
-            id SERIAL PRIMARY KEY,
-            topic_id UUID NOT NULL,
-            pro_id INTEGER NOT NULL,
-            con_id INTEGER NOT NULL,
-            reason TEXT,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
-        )
-    """)
-    conn.commit()
-    cursor.close()
-    conn.close()
+    await migrate_create_votes_table()
+
+async def migrate_create_argument_matches_table():
+    """Create the argument_matches table if it doesn't exist."""
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS argument_matches (
+                id SERIAL PRIMARY KEY,
+                topic_id UUID NOT NULL,
+                pro_id INTEGER NOT NULL,
+                con_id INTEGER NOT NULL,
+                reason TEXT,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (topic_id) REFERENCES topics(id) ON DELETE CASCADE
+            )
+        """)
 
-def get_topic(topic_id: str) -> Optional[dict]:
+async def get_topic(topic_id: str) -> Optional[dict]:
     """Get a topic by UUID."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute("SELECT * FROM topics WHERE id = %s", (topic_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute("SELECT * FROM topics WHERE id = %s", (topic_id,))
+        row = await cursor.fetchone()
+
     if row:
         topic = dict(row)
         topic['id'] = str(topic['id'])  # Convert UUID to string
@@ -151,21 +188,17 @@ def get_topic(topic_id: str) -> Optional[dict]:
         return topic
     return None
 
-def create_topic(proposition: str, created_by: str, user_id: Optional[UUID] = None) -> dict:
+async def create_topic(proposition: str, created_by: str, user_id: Optional[UUID] = None) -> dict:
     """Create a new topic and return the full topic data."""
     import uuid as uuid_module
     topic_uuid = str(uuid_module.uuid4())
-    
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute(
-        "INSERT INTO topics (id, proposition, created_by, user_id, created_at) VALUES (%s, %s, %s, %s, %s) RETURNING *",
-        (topic_uuid, proposition, created_by, str(user_id) if user_id else None, datetime.now(timezone.utc))
-    )
-    row = cursor.fetchone()
-    conn.commit()
-    cursor.close()
-    conn.close()
+
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute(
+            "INSERT INTO topics (id, proposition, created_by, user_id, created_at) VALUES (%s, %s, %s, %s, %s) RETURNING *",
+            (topic_uuid, proposition, created_by, str(user_id) if user_id else None, datetime.now(timezone.utc))
+        )
+        row = await cursor.fetchone()
     if row:
         topic = dict(row)
         topic['id'] = str(topic['id'])  # Convert UUID to string
@@ -173,178 +206,227 @@ def create_topic(proposition: str, created_by: str, user_id: Optional[UUID] = No
         return topic
     return None
 
-def get_all_topics() -> list:
-    """Get all topics with pro/con counts and validity metrics."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    # First get basic topic info with counts
-    cursor.execute("""
-        SELECT 
-            t.id,
-            t.proposition,
-            t.created_by,
-            t.created_at,
-            COUNT(CASE WHEN a.side = 'pro' THEN 1 END) as pro_count,
-            COUNT(CASE WHEN a.side = 'con' THEN 1 END) as con_count
-        FROM topics t
-        LEFT JOIN arguments a ON t.id = a.topic_id
-        GROUP BY t.id, t.proposition, t.created_by, t.created_at
-        ORDER BY t.created_at DESC
-    """)
-    
-    topics = [dict(row) for row in cursor.fetchall()]
-    
-    # Convert datetime to ISO string and calculate validity metrics for each topic
+# Trigram indexes can only narrow down substring matches of at least three characters
+SEARCH_MIN_LENGTH = 3
+
+async def get_topics_page(
+    limit: int,
+    after: Optional[tuple[datetime, UUID]] = None,
+    controversy_level: Optional[str] = None,
+    min_validity: Optional[float] = None,
+    created_by: Optional[str] = None,
+    search: Optional[str] = None
+) -> list:
+    """
+    Get one page of topics (newest first) with pro/con counts and validity metrics.
+
+    Uses keyset pagination on (created_at, id): `after` is the (created_at, id) of the
+    last topic on the previous page. Stats are the columns maintained on topics by the
+    maintain_topic_stats trigger, so every filter is a plain WHERE on the topic row:
+    unfiltered, created_by and controversy_level pages walk an index in keyset order
+    and cost the same at any depth; min_validity uses the avg_validity index, so its
+    cost follows the number of matching topics. `search` is a case-insensitive
+    substring match on the proposition served by the idx_topics_proposition_trgm
+    trigram index, so rare or non-matching terms don't scan the table; terms need
+    at least SEARCH_MIN_LENGTH characters for the index to apply.
+    Returns up to limit + 1 rows so callers can tell whether another page exists.
+    """
+    conditions = []
+    params: list = []
+    if after:
+        conditions.append("(created_at, id) < (%s, %s)")
+        params.extend(after)
+    if created_by:
+        conditions.append("created_by = %s")
+        params.append(created_by)
+    if controversy_level:
+        conditions.append("controversy_level = %s")
+        params.append(controversy_level)
+    if min_validity is not None:
+        conditions.append("avg_validity >= %s")
+        params.append(min_validity)
+    if search:
+        # Escape LIKE wildcards so the term matches literally
+        conditions.append("proposition ILIKE %s")
+        params.append("%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    params.append(limit + 1)
+
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute(f"""
+            SELECT
+                id,
+                proposition,
+                created_by,
+                created_at,
+                pro_count,
+                con_count,
+                ROUND(pro_validity_sum::numeric / NULLIF(pro_validity_count, 0), 1)::float AS pro_avg_validity,
+                ROUND(con_validity_sum::numeric / NULLIF(con_validity_count, 0), 1)::float AS con_avg_validity,
+                avg_validity::float AS avg_validity,
+                controversy_level
+            FROM topics
+            {where_clause}
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s
+        """, params)
+        topics = [dict(row) for row in await cursor.fetchall()]
+
     for topic in topics:
         topic['id'] = str(topic['id'])  # Convert UUID to string
         topic['created_at'] = _format_datetime_to_iso(topic.get('created_at'))
-        topic_id = topic['id']
-        
-        # Get average validity for PRO arguments
-        cursor.execute("""
-            SELECT AVG(validity_score) as avg_validity
-            FROM arguments
-            WHERE topic_id = %s AND side = 'pro' AND validity_score IS NOT NULL
-        """, (topic_id,))
-        pro_avg_result = cursor.fetchone()
-        pro_avg = pro_avg_result['avg_validity'] if pro_avg_result and pro_avg_result['avg_validity'] is not None else None
-        if pro_avg is not None:
-            topic['pro_avg_validity'] = float(round(pro_avg, 1))
-        else:
-            topic['pro_avg_validity'] = None
-        
-        # Get average validity for CON arguments
-        cursor.execute("""
-            SELECT AVG(validity_score) as avg_validity
-            FROM arguments
-            WHERE topic_id = %s AND side = 'con' AND validity_score IS NOT NULL
-        """, (topic_id,))
-        con_avg_result = cursor.fetchone()
-        con_avg = con_avg_result['avg_validity'] if con_avg_result and con_avg_result['avg_validity'] is not None else None
-        if con_avg is not None:
-            topic['con_avg_validity'] = float(round(con_avg, 1))
-        else:
-            topic['con_avg_validity'] = None
-        
-        # Calculate controversy level (only when there are more than 6 arguments)
-        pro_count = topic['pro_count']
-        con_count = topic['con_count']
-        total_count = pro_count + con_count
-        
-        if total_count == 0 or total_count <= 6:
-            topic['controversy_level'] = None
-        else:
-            # Calculate balance ratio (closer to 0.5 = more balanced/contested)
-            balance_ratio = min(pro_count, con_count) / total_count if total_count > 0 else 0
-            
-            if balance_ratio >= 0.4:
-                # Highly balanced (40%+ on both sides)
-                topic['controversy_level'] = "Highly Contested"
-            elif balance_ratio >= 0.25:
-                # Moderately balanced (25-40% on smaller side)
-                topic['controversy_level'] = "Moderately Contested"
-            else:
-                # One-sided (less than 25% on smaller side)
-                topic['controversy_level'] = "Clear Consensus"
-    
-    cursor.close()
-    conn.close()
     return topics
 
-def get_topic_with_arguments(topic_id: str) -> Optional[dict]:
+# Topic detail document assembled by Postgres in one round trip. Argument objects carry
+# exactly the ArgumentResponse fields; unflushed vote buffer deltas are joined in from
+# the delta arrays, and user_votes is only built when a user id is given.
+TOPIC_DETAIL_SQL = """
+    WITH args AS (
+        SELECT a.side, a.validity_score, a.created_at,
+               json_build_object(
+                   'id', a.id,
+                   'topic_id', a.topic_id,
+                   'side', a.side,
+                   'title', a.title,
+                   'content', a.content,
+                   'sources', a.sources,
+                   'author', a.author,
+                   'created_at', a.created_at,
+                   'validity_score', a.validity_score,
+                   'validity_reasoning', a.validity_reasoning,
+                   'validity_checked_at', a.validity_checked_at,
+                   'key_urls', COALESCE(a.key_urls, '[]'::jsonb),
+                   'votes', COALESCE(a.votes, 0) + COALESCE(d.delta, 0)
+               ) AS doc
+        FROM arguments a
+        LEFT JOIN unnest(%(delta_ids)s::int[], %(delta_values)s::int[]) AS d(argument_id, delta)
+            ON d.argument_id = a.id
+        WHERE a.topic_id = %(topic_id)s
+    )
+    SELECT
+        json_build_object(
+            'id', t.id,
+            'proposition', t.proposition,
+            'created_by', t.created_by,
+            'created_at', t.created_at,
+            'pro_arguments', COALESCE(
+                (SELECT json_agg(doc ORDER BY validity_score DESC NULLS LAST, created_at DESC)
+                 FROM args WHERE side = 'pro'),
+                '[]'::json),
+            'con_arguments', COALESCE(
+                (SELECT json_agg(doc ORDER BY validity_score DESC NULLS LAST, created_at DESC)
+                 FROM args WHERE side = 'con'),
+                '[]'::json),
+            'overall_summary', t.overall_summary,
+            'consensus_view', t.consensus_view,
+            'timeline_view', t.timeline_view,
+            'user_votes', CASE WHEN %(user_id)s::uuid IS NULL THEN NULL ELSE COALESCE(
+                (SELECT json_object_agg(v.argument_id, v.vote_type)
+                 FROM votes v JOIN arguments a ON a.id = v.argument_id
+                 WHERE v.user_id = %(user_id)s::uuid AND a.topic_id = t.id),
+                '{}'::json) END
+        )::text,
+        EXISTS (SELECT 1 FROM args WHERE validity_score IS NULL),
+        EXISTS (SELECT 1 FROM args WHERE side = 'pro')
+            AND EXISTS (SELECT 1 FROM args WHERE side = 'con')
+            AND (NULLIF(t.overall_summary, '') IS NULL
+                 OR NULLIF(t.consensus_view, '') IS NULL
+                 OR t.timeline_view IS NULL)
+    FROM topics t
+    WHERE t.id = %(topic_id)s
+"""
+
+async def get_topic_detail_json(
+    topic_id: str,
+    user_id: Optional[UUID] = None,
+    vote_deltas: Optional[dict[int, int]] = None
+) -> Optional[tuple[str, bool, bool]]:
+    """
+    Get a topic with its pro/con arguments (sorted by validity score, highest first)
+    as a JSON document built by Postgres in a single query.
+    vote_deltas ({argument_id: delta}) are added to the stored vote counters, and
+    user_votes is included when user_id is given.
+    Returns (json_text, needs_verification, needs_analysis), or None if the topic doesn't exist.
+    """
+    vote_deltas = vote_deltas or {}
+    async with get_cursor() as cursor:
+        await cursor.execute(TOPIC_DETAIL_SQL, {
+            'topic_id': topic_id,
+            'user_id': str(user_id) if user_id else None,
+            'delta_ids': list(vote_deltas.keys()),
+            'delta_values': list(vote_deltas.values()),
+        })
+        row = await cursor.fetchone()
+    return tuple(row) if row else None
+
+async def get_topic_with_arguments(topic_id: str) -> Optional[dict]:
     """Get a topic with its arguments, sorted by validity score (highest first)."""
-    topic = get_topic(topic_id)
-    if not topic:
+    detail = await get_topic_detail_json(topic_id)
+    if not detail:
         return None
-    
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    # Sort by validity_score DESC (nulls last), then created_at DESC
-    cursor.execute("""
-        SELECT * FROM arguments 
-        WHERE topic_id = %s 
-        ORDER BY 
-            CASE WHEN validity_score IS NULL THEN 1 ELSE 0 END,
-            validity_score DESC,
-            created_at DESC
-    """, (topic_id,))
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    
-    arguments = [dict(row) for row in rows]
-    # Parse key_urls JSON and convert timestamps for each argument
-    for arg in arguments:
-        arg['topic_id'] = str(arg['topic_id'])  # Convert UUID to string
-        if arg.get('key_urls'):
-            try:
-                arg['key_urls'] = json.loads(arg['key_urls'])
-            except (json.JSONDecodeError, TypeError):
-                arg['key_urls'] = []
-        else:
-            arg['key_urls'] = []
-        # Convert datetime fields to ISO strings
-        arg['created_at'] = _format_datetime_to_iso(arg.get('created_at'))
-        arg['validity_checked_at'] = _format_datetime_to_iso(arg.get('validity_checked_at'))
-    
-    pro_arguments = [arg for arg in arguments if arg['side'] == 'pro']
-    con_arguments = [arg for arg in arguments if arg['side'] == 'con']
-    
-    # Parse timeline_view if it exists
-    timeline_view = None
-    if topic.get('timeline_view'):
-        try:
-            timeline_view = json.loads(topic['timeline_view'])
-        except (json.JSONDecodeError, TypeError):
-            timeline_view = None
-    
-    return {
-        'id': topic['id'],
-        'proposition': topic['proposition'],
-        'created_by': topic['created_by'],
-        'created_at': _format_datetime_to_iso(topic.get('created_at')),
-        'pro_arguments': pro_arguments,
-        'con_arguments': con_arguments,
-        'overall_summary': topic.get('overall_summary'),
-        'consensus_view': topic.get('consensus_view'),
-        'timeline_view': timeline_view
-    }
+    return json.loads(detail[0])
 
-def create_argument(topic_id: str, side: str, title: str, content: str, author: str, sources: Optional[str] = None, user_id: Optional[UUID] = None) -> int:
+async def create_argument(topic_id: str, side: str, title: str, content: str, author: str, sources: Optional[str] = None, user_id: Optional[UUID] = None) -> int:
     """Create a new argument and return its ID."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        """INSERT INTO arguments (topic_id, side, title, content, sources, author, user_id, created_at) 
-           VALUES (%s, %s, %s, %s, %s, %s, %s, %s) RETURNING id""",
-        (topic_id, side, title, content, sources, author, str(user_id) if user_id else None, datetime.now(timezone.utc))
-    )
-    argument_id = cursor.fetchone()[0]
-    conn.commit()
-    cursor.close()
-    conn.close()
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """INSERT INTO arguments (topic_id, side, title, content, sources, author, user_id, created_at)
+               VALUES (%s, %s, %s, %s, %s, %s, %s, %s) RETURNING id""",
+            (topic_id, side, title, content, sources, author, str(user_id) if user_id else None, datetime.now(timezone.utc))
+        )
+        argument_id = (await cursor.fetchone())[0]
     return argument_id
 
-def get_arguments(topic_id: str, side: Optional[str] = None) -> list:
-    """Get arguments for a topic, optionally filtered by side."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    if side and side in ['pro', 'con']:
-        cursor.execute(
-            "SELECT * FROM arguments WHERE topic_id = %s AND side = %s ORDER BY created_at ASC",
-            (topic_id, side)
-        )
-    else:
-        cursor.execute(
-            "SELECT * FROM arguments WHERE topic_id = %s ORDER BY created_at ASC",
-            (topic_id,)
+async def create_argument_for_job(
+    job_id: str,
+    topic_id: str,
+    side: str,
+    title: str,
+    content: str,
+    author: str,
+    validity_score: int,
+    validity_reasoning: str,
+    key_urls: List[str],
+    sources: Optional[str] = None,
+    user_id: Optional[UUID] = None
+) -> int:
+    """
+    Save a fact-checked argument submitted through a job, with its verdict, and return its ID.
+    The row is keyed on the job, so a job retried after a worker crash returns the
+    argument the first attempt created instead of inserting a duplicate.
+    """
+    now = datetime.now(timezone.utc)
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """INSERT INTO arguments (topic_id, side, title, content, sources, author, user_id, created_at,
+                                      validity_score, validity_reasoning, key_urls, validity_checked_at, job_id)
+               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+               ON CONFLICT (job_id) DO NOTHING
+               RETURNING id""",
+            (topic_id, side, title, content, sources, author, str(user_id) if user_id else None,
+             now, validity_score, validity_reasoning, Jsonb(key_urls) if key_urls else None, now, job_id)
         )
-    
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
+        row = await cursor.fetchone()
+        if row is None:
+            await cursor.execute("SELECT id FROM arguments WHERE job_id = %s", (job_id,))
+            row = await cursor.fetchone()
+    return row[0]
+
+async def get_arguments(topic_id: str, side: Optional[str] = None) -> list:
+    """Get arguments for a topic, optionally filtered by side."""
+    async with get_cursor(dict_rows=True) as cursor:
+        if side and side in ['pro', 'con']:
+            await cursor.execute(
+                "SELECT * FROM arguments WHERE topic_id = %s AND side = %s ORDER BY created_at ASC",
+                (topic_id, side)
+            )
+        else:
+            await cursor.execute(
+                "SELECT * FROM arguments WHERE topic_id = %s ORDER BY created_at ASC",
+                (topic_id,)
+            )
+        rows = await cursor.fetchall()
+
     arguments = [dict(row) for row in rows]
     # Convert datetime to ISO string for each argument
     for arg in arguments:
@@ -353,159 +435,137 @@ def get_arguments(topic_id: str, side: Optional[str] = None) -> list:
         arg['validity_checked_at'] = _format_datetime_to_iso(arg.get('validity_checked_at'))
     return arguments
 
-def get_argument_counts(topic_id: str) -> dict:
+async def get_arguments_pending_verification(topic_id: str, batch_started_at: Optional[datetime] = None) -> list:
+    """
+    Get arguments for a topic that a verify-all batch still has to check.
+    When resuming a batch, arguments verified at or after batch_started_at are skipped.
+    """
+    async with get_cursor(dict_rows=True) as cursor:
+        if batch_started_at:
+            await cursor.execute(
+                """SELECT id, title, content FROM arguments
+                   WHERE topic_id = %s
+                     AND (validity_checked_at IS NULL OR validity_checked_at < %s)
+                   ORDER BY created_at ASC""",
+                (topic_id, batch_started_at)
+            )
+        else:
+            await cursor.execute(
+                "SELECT id, title, content FROM arguments WHERE topic_id = %s ORDER BY created_at ASC",
+                (topic_id,)
+            )
+        rows = await cursor.fetchall()
+    return [dict(row) for row in rows]
+
+async def get_argument_counts(topic_id: str) -> dict:
     """Get pro and con argument counts for a topic."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute("""
-        SELECT 
-            COUNT(CASE WHEN side = 'pro' THEN 1 END) as pro_count,
-            COUNT(CASE WHEN side = 'con' THEN 1 END) as con_count
-        FROM arguments
-        WHERE topic_id = %s
-    """, (topic_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute("""
+            SELECT
+                COUNT(CASE WHEN side = 'pro' THEN 1 END) as pro_count,
+                COUNT(CASE WHEN side = 'con' THEN 1 END) as con_count
+            FROM arguments
+            WHERE topic_id = %s
+        """, (topic_id,))
+        row = await cursor.fetchone()
     return dict(row) if row else {'pro_count': 0, 'con_count': 0}
 
-def update_topic_analysis(topic_id: str, overall_summary: str, consensus_view: str, timeline_view: list):
+async def update_topic_analysis(topic_id: str, overall_summary: str, consensus_view: str, timeline_view: list):
     """Update topic with generated analysis."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    timeline_json = json.dumps(timeline_view) if timeline_view else None
-    cursor.execute(
-        """UPDATE topics 
-           SET overall_summary = %s, consensus_view = %s, timeline_view = %s
-           WHERE id = %s""",
-        (overall_summary, consensus_view, timeline_json, topic_id)
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE topics
+               SET overall_summary = %s, consensus_view = %s, timeline_view = %s
+               WHERE id = %s""",
+            (overall_summary, consensus_view, Jsonb(timeline_view) if timeline_view else None, topic_id)
+        )
 
-def migrate_add_validity_columns():
+async def migrate_add_validity_columns():
     """Add validity-related columns to arguments table if they don't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
+    async with get_cursor() as cursor:
         # Check if columns exist using PostgreSQL information_schema
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
+        await cursor.execute("""
+            SELECT column_name
+            FROM information_schema.columns
             WHERE table_name = 'arguments' AND table_schema = 'public'
         """)
-        columns = [row[0] for row in cursor.fetchall()]
-        
+        columns = [row[0] for row in await cursor.fetchall()]
+
         # Add columns if they don't exist
         if 'validity_score' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN validity_score INTEGER")
+            await cursor.execute("ALTER TABLE arguments ADD COLUMN validity_score INTEGER")
         if 'validity_reasoning' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN validity_reasoning TEXT")
+            await cursor.execute("ALTER TABLE arguments ADD COLUMN validity_reasoning TEXT")
         if 'validity_checked_at' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN validity_checked_at TIMESTAMP")
+            await cursor.execute("ALTER TABLE arguments ADD COLUMN validity_checked_at TIMESTAMP")
         if 'key_urls' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN key_urls TEXT")
-        
-        conn.commit()
-    except Exception as e:
-        # If error occurs, rollback
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def migrate_add_votes_column():
+            await cursor.execute("ALTER TABLE arguments ADD COLUMN key_urls TEXT")
+
+async def migrate_add_votes_column():
     """Add votes column to arguments table if it doesn't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            SELECT column_name
+            FROM information_schema.columns
             WHERE table_name = 'arguments' AND table_schema = 'public'
         """)
-        columns = [row[0] for row in cursor.fetchall()]
-        
+        columns = [row[0] for row in await cursor.fetchall()]
+
         if 'votes' not in columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN votes INTEGER DEFAULT 0")
-            conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def migrate_add_user_id_columns():
+            await cursor.execute("ALTER TABLE arguments ADD COLUMN votes INTEGER DEFAULT 0")
+
+async def migrate_add_user_id_columns():
     """Add user_id UUID columns to topics, arguments, and comments tables if they don't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
+    async with get_cursor() as cursor:
         # Check and add user_id to topics
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
+        await cursor.execute("""
+            SELECT column_name
+            FROM information_schema.columns
             WHERE table_name = 'topics' AND table_schema = 'public'
         """)
-        topic_columns = [row[0] for row in cursor.fetchall()]
+        topic_columns = [row[0] for row in await cursor.fetchall()]
         if 'user_id' not in topic_columns:
-            cursor.execute("ALTER TABLE topics ADD COLUMN user_id UUID")
-            cursor.execute("ALTER TABLE topics ADD CONSTRAINT fk_topics_user FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL")
-        
+            await cursor.execute("ALTER TABLE topics ADD COLUMN user_id UUID")
+            await cursor.execute("ALTER TABLE topics ADD CONSTRAINT fk_topics_user FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL")
+
         # Check and add user_id to arguments
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
+        await cursor.execute("""
+            SELECT column_name
+            FROM information_schema.columns
             WHERE table_name = 'arguments' AND table_schema = 'public'
         """)
-        arg_columns = [row[0] for row in cursor.fetchall()]
+        arg_columns = [row[0] for row in await cursor.fetchall()]
         if 'user_id' not in arg_columns:
-            cursor.execute("ALTER TABLE arguments ADD COLUMN user_id UUID")
-            cursor.execute("ALTER TABLE arguments ADD CONSTRAINT fk_arguments_user FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL")
-        
+            await cursor.execute("ALTER TABLE arguments ADD COLUMN user_id UUID")
+            await cursor.execute("ALTER TABLE arguments ADD CONSTRAINT fk_arguments_user FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL")
+
         # Check and add user_id to comments
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
+        await cursor.execute("""
+            SELECT column_name
+            FROM information_schema.columns
             WHERE table_name = 'comments' AND table_schema = 'public'
         """)
-        comment_columns = [row[0] for row in cursor.fetchall()]
+        comment_columns = [row[0] for row in await cursor.fetchall()]
         if 'user_id' not in comment_columns:
-            cursor.execute("ALTER TABLE comments ADD COLUMN user_id UUID")
-            cursor.execute("ALTER TABLE comments ADD CONSTRAINT fk_comments_user FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL")
-        
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def migrate_create_votes_table():
+            await cursor.execute("ALTER TABLE comments ADD COLUMN user_id UUID")
+            await cursor.execute("ALTER TABLE comments ADD CONSTRAINT fk_comments_user FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL")
+
+async def migrate_create_votes_table():
     """Create votes table if it doesn't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
+    async with get_cursor() as cursor:
         # Check if votes table exists
-        cursor.execute("""
+        await cursor.execute("""
             SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_schema = 'public' 
+                SELECT FROM information_schema.tables
+                WHERE table_schema = 'public'
                 AND table_name = 'votes'
             )
         """)
-        table_exists = cursor.fetchone()[0]
-        
+        table_exists = (await cursor.fetchone())[0]
+
         if not table_exists:
             # Create votes table
-            cursor.execute("""
+            await cursor.execute("""
                 CREATE TABLE votes (
                     id SERIAL PRIMARY KEY,
                     argument_id INTEGER NOT NULL,
@@ -517,356 +577,696 @@ def migrate_create_votes_table():
                     UNIQUE(argument_id, user_id)
                 )
             """)
-            conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def migrate_reset_vote_counts():
-    """Reset all vote counts to 0 for existing arguments (disregard seeded baseline votes)."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Set all vote counts to 0
-        cursor.execute("UPDATE arguments SET votes = 0 WHERE votes IS NOT NULL")
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def get_argument(argument_id: int) -> Optional[dict]:
+
+async def migrate_create_topic_listing_indexes():
+    """Create indexes used by keyset pagination and filtering of the topic listing."""
+    await create_managed_indexes("idx_topics_created_at_id", "idx_topics_created_by_created_at_id")
+
+# Extensions MANAGED_INDEXES depend on, created before any of them is built
+MANAGED_EXTENSIONS = ["pg_trgm"]
+
+# Secondary indexes for hot query paths: (name, table, key columns / options).
+# All are built with CREATE INDEX CONCURRENTLY, so existing tables stay writable.
+# Uniqueness and primary-key indexes already cover votes (argument_id, ...) lookups.
+MANAGED_INDEXES = [
+    # Keyset order for GET /api/topics
+    ("idx_topics_created_at_id", "topics", "(created_at DESC, id DESC)"),
+    # Creator filter, kept in keyset order
+    ("idx_topics_created_by_created_at_id", "topics", "(created_by, created_at DESC, id DESC)"),
+    # Per-user vote lookups for a whole topic (get_user_votes_for_topic)
+    ("idx_votes_user_argument", "votes", "(user_id, argument_id) INCLUDE (vote_type)"),
+    # Topic search, proposition ILIKE '%term%' (get_topics_page); needs pg_trgm
+    ("idx_topics_proposition_trgm", "topics", "USING gin (proposition gin_trgm_ops)"),
+    # Topic page ordering (TOPIC_DETAIL_SQL, get_arguments_sorted_by_validity)
+    ("idx_arguments_topic_validity", "arguments", "(topic_id, validity_score DESC NULLS LAST, created_at DESC)"),
+    # Arguments in submission order (get_arguments, get_arguments_pending_verification)
+    ("idx_arguments_topic_created_at", "arguments", "(topic_id, created_at)"),
+    # Comment threads (get_comments)
+    ("idx_comments_argument_created_at", "comments", "(argument_id, created_at)"),
+    # Contribution counts (get_user_contribution_count)
+    ("idx_topics_user_id", "topics", "(user_id)"),
+    ("idx_arguments_user_id", "arguments", "(user_id)"),
+    ("idx_jobs_user_submissions", "jobs", "(user_id) WHERE job_type = 'submit_argument' AND status IN ('pending', 'running')"),
+]
+
+async def create_index_concurrently(name: str, table: str, definition: str, unique: bool = False):
+    """
+    Build an index (or a unique index) without blocking writes to the table.
+    An invalid index left behind by an interrupted CONCURRENTLY build is dropped and rebuilt.
+    CONCURRENTLY can't run inside a transaction, so this uses its own autocommit connection.
+    """
+    async with await AsyncConnection.connect(CONNINFO, autocommit=True) as conn:
+        cursor = await conn.execute(
+            """SELECT i.indisvalid
+               FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+               WHERE c.relname = %s""",
+            (name,)
+        )
+        row = await cursor.fetchone()
+        if row and row[0]:
+            return
+        if row:
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        await conn.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}"
+        )
+
+async def drop_index_concurrently(name: str):
+    """Drop an index without blocking reads or writes to its table, on its own autocommit connection."""
+    async with await AsyncConnection.connect(CONNINFO, autocommit=True) as conn:
+        await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+async def create_managed_indexes(*names: str):
+    """Build the named MANAGED_INDEXES entries concurrently (all of them if no names are given)."""
+    async with get_cursor() as cursor:
+        for extension in MANAGED_EXTENSIONS:
+            await cursor.execute(f"CREATE EXTENSION IF NOT EXISTS {extension}")
+    for name, table, definition in MANAGED_INDEXES:
+        if not names or name in names:
+            await create_index_concurrently(name, table, definition)
+
+async def migrate_create_hot_path_indexes():
+    """Create the MANAGED_INDEXES set, building each index concurrently."""
+    await create_managed_indexes()
+
+# Rows converted per transaction while backfilling a JSONB column
+JSONB_BACKFILL_BATCH_SIZE = 5000
+
+async def migrate_text_column_to_jsonb(table: str, column: str):
+    """
+    Convert a TEXT column holding JSON to JSONB without a long table rewrite lock.
+    A shadow JSONB column is added and kept in sync by a trigger while existing rows
+    are backfilled in id order, one short transaction per batch; the columns are then
+    swapped in one brief transaction. Malformed or empty JSON becomes NULL.
+    Safe to re-run: an already converted column is left alone and an interrupted
+    backfill starts over.
+    """
+    shadow = f"{column}_jsonb"
+    sync_function = f"{table}_{column}_jsonb_sync"
+
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """SELECT data_type FROM information_schema.columns
+               WHERE table_schema = 'public' AND table_name = %s AND column_name = %s""",
+            (table, column)
+        )
+        row = await cursor.fetchone()
+        if row is None or row[0] == 'jsonb':
+            return
+
+        await cursor.execute("""
+            CREATE OR REPLACE FUNCTION try_jsonb(value TEXT) RETURNS JSONB
+            LANGUAGE plpgsql IMMUTABLE AS $$
+            BEGIN
+                RETURN NULLIF(NULLIF(value, '')::jsonb, 'null'::jsonb);
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+            $$
+        """)
+        await cursor.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {shadow} JSONB")
+        # Writes made during the backfill are mirrored into the shadow column
+        await cursor.execute(f"""
+            CREATE OR REPLACE FUNCTION {sync_function}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                NEW.{shadow} := try_jsonb(NEW.{column});
+                RETURN NEW;
+            END;
+            $$
+        """)
+        await cursor.execute(f"DROP TRIGGER IF EXISTS {sync_function} ON {table}")
+        await cursor.execute(f"""
+            CREATE TRIGGER {sync_function}
+            BEFORE INSERT OR UPDATE OF {column} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {sync_function}()
+        """)
+
+    last_id = None
+    while True:
+        async with get_cursor() as cursor:
+            await cursor.execute(f"""
+                WITH batch AS (
+                    SELECT id FROM {table}
+                    {'' if last_id is None else 'WHERE id > %s'}
+                    ORDER BY id
+                    LIMIT {JSONB_BACKFILL_BATCH_SIZE}
+                )
+                UPDATE {table} AS t
+                SET {shadow} = try_jsonb(t.{column})
+                FROM batch
+                WHERE t.id = batch.id
+                RETURNING t.id
+            """, () if last_id is None else (last_id,))
+            ids = [row[0] for row in await cursor.fetchall()]
+        if not ids:
+            break
+        last_id = max(ids)
+
+    async with get_cursor() as cursor:
+        await cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        await cursor.execute(f"DROP TRIGGER IF EXISTS {sync_function} ON {table}")
+        await cursor.execute(f"DROP FUNCTION IF EXISTS {sync_function}()")
+        await cursor.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        await cursor.execute(f"ALTER TABLE {table} RENAME COLUMN {shadow} TO {column}")
+
+async def migrate_json_columns_to_jsonb():
+    """Store arguments.key_urls and topics.timeline_view as JSONB."""
+    await migrate_text_column_to_jsonb('arguments', 'key_urls')
+    await migrate_text_column_to_jsonb('topics', 'timeline_view')
+    async with get_cursor() as cursor:
+        await cursor.execute("DROP FUNCTION IF EXISTS try_jsonb(TEXT)")
+
+async def migrate_add_topic_stats_columns():
+    """
+    Keep per-topic argument counts and validity totals on the topics row.
+
+    A trigger on arguments applies each insert, delete, and change of side or
+    validity_score as a delta, so the listing reads stats straight from topics
+    instead of aggregating every topic's arguments. controversy_level and
+    avg_validity are generated from the totals and indexed, which lets the listing
+    filters use an index instead of computing stats for the whole table.
+    Adding the generated columns rewrites topics once (topics is small next to arguments).
+    """
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            ALTER TABLE topics
+                ADD COLUMN IF NOT EXISTS pro_count INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS con_count INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS pro_validity_sum INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS pro_validity_count INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS con_validity_sum INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS con_validity_count INTEGER NOT NULL DEFAULT 0
+        """)
+        # Same thresholds as before: only assigned above 6 arguments, by the smaller side's share
+        await cursor.execute("""
+            ALTER TABLE topics
+                ADD COLUMN IF NOT EXISTS controversy_level TEXT GENERATED ALWAYS AS (
+                    CASE
+                        WHEN pro_count + con_count <= 6 THEN NULL
+                        WHEN LEAST(pro_count, con_count)::float / (pro_count + con_count) >= 0.4 THEN 'Highly Contested'
+                        WHEN LEAST(pro_count, con_count)::float / (pro_count + con_count) >= 0.25 THEN 'Moderately Contested'
+                        ELSE 'Clear Consensus'
+                    END
+                ) STORED,
+                ADD COLUMN IF NOT EXISTS avg_validity NUMERIC GENERATED ALWAYS AS (
+                    ROUND((pro_validity_sum + con_validity_sum)::numeric
+                          / NULLIF(pro_validity_count + con_validity_count, 0), 1)
+                ) STORED
+        """)
+        await cursor.execute("""
+            CREATE OR REPLACE FUNCTION maintain_topic_stats() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    UPDATE topics SET
+                        pro_count = pro_count - (OLD.side = 'pro')::int,
+                        con_count = con_count - (OLD.side = 'con')::int,
+                        pro_validity_sum = pro_validity_sum - CASE WHEN OLD.side = 'pro' THEN COALESCE(OLD.validity_score, 0) ELSE 0 END,
+                        pro_validity_count = pro_validity_count - (OLD.side = 'pro' AND OLD.validity_score IS NOT NULL)::int,
+                        con_validity_sum = con_validity_sum - CASE WHEN OLD.side = 'con' THEN COALESCE(OLD.validity_score, 0) ELSE 0 END,
+                        con_validity_count = con_validity_count - (OLD.side = 'con' AND OLD.validity_score IS NOT NULL)::int
+                    WHERE id = OLD.topic_id;
+                END IF;
+                IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                    UPDATE topics SET
+                        pro_count = pro_count + (NEW.side = 'pro')::int,
+                        con_count = con_count + (NEW.side = 'con')::int,
+                        pro_validity_sum = pro_validity_sum + CASE WHEN NEW.side = 'pro' THEN COALESCE(NEW.validity_score, 0) ELSE 0 END,
+                        pro_validity_count = pro_validity_count + (NEW.side = 'pro' AND NEW.validity_score IS NOT NULL)::int,
+                        con_validity_sum = con_validity_sum + CASE WHEN NEW.side = 'con' THEN COALESCE(NEW.validity_score, 0) ELSE 0 END,
+                        con_validity_count = con_validity_count + (NEW.side = 'con' AND NEW.validity_score IS NOT NULL)::int
+                    WHERE id = NEW.topic_id;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        await cursor.execute("DROP TRIGGER IF EXISTS maintain_topic_stats ON arguments")
+        await cursor.execute("""
+            CREATE TRIGGER maintain_topic_stats
+            AFTER INSERT OR DELETE OR UPDATE OF topic_id, side, validity_score ON arguments
+            FOR EACH ROW EXECUTE FUNCTION maintain_topic_stats()
+        """)
+        # Block argument writes until the backfill commits so no delta is counted twice or lost
+        await cursor.execute("LOCK TABLE arguments IN SHARE MODE")
+        await cursor.execute("""
+            UPDATE topics t SET
+                pro_count = s.pro_count,
+                con_count = s.con_count,
+                pro_validity_sum = s.pro_validity_sum,
+                pro_validity_count = s.pro_validity_count,
+                con_validity_sum = s.con_validity_sum,
+                con_validity_count = s.con_validity_count
+            FROM (
+                SELECT
+                    t2.id,
+                    COUNT(a.id) FILTER (WHERE a.side = 'pro') AS pro_count,
+                    COUNT(a.id) FILTER (WHERE a.side = 'con') AS con_count,
+                    COALESCE(SUM(a.validity_score) FILTER (WHERE a.side = 'pro'), 0) AS pro_validity_sum,
+                    COUNT(a.validity_score) FILTER (WHERE a.side = 'pro') AS pro_validity_count,
+                    COALESCE(SUM(a.validity_score) FILTER (WHERE a.side = 'con'), 0) AS con_validity_sum,
+                    COUNT(a.validity_score) FILTER (WHERE a.side = 'con') AS con_validity_count
+                FROM topics t2
+                LEFT JOIN arguments a ON a.topic_id = t2.id
+                GROUP BY t2.id
+            ) s
+            WHERE t.id = s.id
+        """)
+
+    # Controversy filter in keyset order; min_validity ranges
+    await create_index_concurrently(
+        "idx_topics_controversy_created_at_id", "topics", "(controversy_level, created_at DESC, id DESC)"
+    )
+    await create_index_concurrently("idx_topics_avg_validity", "topics", "(avg_validity)")
+
+async def migrate_drop_topic_side_index():
+    """
+    Drop idx_arguments_topic_side. It served the per-page stats aggregate, which the
+    maintained topic stats columns replaced; the topic_id lookups it also matched are
+    covered by idx_arguments_topic_validity and idx_arguments_topic_created_at.
+    """
+    await drop_index_concurrently("idx_arguments_topic_side")
+
+async def migrate_create_topic_search_index():
+    """Create the trigram index behind topic search (see MANAGED_INDEXES)."""
+    await create_managed_indexes("idx_topics_proposition_trgm")
+
+async def migrate_create_jobs_table():
+    """Create the background job queue table if it doesn't exist."""
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                job_type TEXT NOT NULL,
+                payload JSONB NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending'
+                    CHECK(status IN ('pending', 'running', 'done', 'rejected', 'failed')),
+                result JSONB,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                user_id UUID,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES user_profiles(id) ON DELETE SET NULL
+            )
+        """)
+        # Workers only ever scan the pending queue in FIFO order
+        await cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_pending
+            ON jobs (created_at) WHERE status = 'pending'
+        """)
+        # At most one active job per (job_type, dedup_key), so repeated enqueues coalesce
+        await cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS dedup_key TEXT")
+        await cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_active_dedup
+            ON jobs (job_type, dedup_key)
+            WHERE status IN ('pending', 'running') AND dedup_key IS NOT NULL
+        """)
+
+async def migrate_add_argument_job_id():
+    """Key arguments created by submit_argument jobs on the job, so retried jobs can't insert duplicates."""
+    async with get_cursor() as cursor:
+        await cursor.execute("ALTER TABLE arguments ADD COLUMN IF NOT EXISTS job_id UUID")
+    # NULLs are distinct, so arguments created without a job are unaffected
+    await create_index_concurrently("idx_arguments_job_id", "arguments", "(job_id)", unique=True)
+
+async def migrate_create_jobs_latest_by_key_index():
+    """Index for looking up the latest job per (job_type, dedup_key), used by enqueue_job's failure backoff."""
+    await create_index_concurrently(
+        "idx_jobs_dedup_created_at", "jobs", "(job_type, dedup_key, created_at DESC) WHERE dedup_key IS NOT NULL"
+    )
+
+async def migrate_create_verdict_cache_table():
+    """Create the fact-check verdict cache table if it doesn't exist."""
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS fact_check_verdicts (
+                cache_key TEXT PRIMARY KEY,
+                verdict JSONB NOT NULL,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+async def migrate_create_evidence_cache_table():
+    """Create the evidence search cache table if it doesn't exist."""
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS evidence_cache (
+                claim_key TEXT PRIMARY KEY,
+                signature TEXT NOT NULL,
+                results JSONB NOT NULL,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        # Near-duplicate lookups by signature
+        await cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_evidence_cache_signature
+            ON evidence_cache (signature, created_at DESC)
+        """)
+
+async def migrate_create_work_leases_table():
+    """Create the single-flight lease table if it doesn't exist."""
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            CREATE TABLE IF NOT EXISTS work_leases (
+                lease_key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at TIMESTAMP NOT NULL,
+                result JSONB,
+                finished_at TIMESTAMP
+            )
+        """)
+
+async def migrate_add_work_lease_error_column():
+    """Record single-flight failures on the lease so waiting workers can report them."""
+    async with get_cursor() as cursor:
+        await cursor.execute("ALTER TABLE work_leases ADD COLUMN IF NOT EXISTS error TEXT")
+
+async def migrate_create_toggle_vote_function():
+    """
+    Create the record_vote() and toggle_vote() stored functions used by upvote/downvote.
+
+    record_vote() inserts, flips or removes the caller's vote and returns the
+    resulting counter delta; toggle_vote() also applies that delta to
+    arguments.votes, so votes are never recounted. The vote row is locked before
+    it is changed and the counter is a relative update, so concurrent clicks on
+    the same argument (or by the same user) can't lose updates.
+    """
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            CREATE OR REPLACE FUNCTION record_vote(p_argument_id INTEGER, p_user_id UUID, p_vote_type TEXT)
+            RETURNS TABLE (vote_count INTEGER, vote_delta INTEGER, user_vote TEXT) AS $$
+            DECLARE
+                v_weight INTEGER := CASE p_vote_type WHEN 'upvote' THEN 1 ELSE -1 END;
+                v_existing TEXT;
+            BEGIN
+                SELECT COALESCE(votes, 0) INTO vote_count FROM arguments WHERE id = p_argument_id;
+                IF NOT FOUND THEN
+                    RETURN;
+                END IF;
+
+                LOOP
+                    INSERT INTO votes (argument_id, user_id, vote_type)
+                    VALUES (p_argument_id, p_user_id, p_vote_type)
+                    ON CONFLICT (argument_id, user_id) DO NOTHING;
+                    IF FOUND THEN
+                        vote_delta := v_weight;
+                        user_vote := p_vote_type;
+                        EXIT;
+                    END IF;
+
+                    SELECT vote_type INTO v_existing FROM votes
+                    WHERE argument_id = p_argument_id AND user_id = p_user_id
+                    FOR UPDATE;
+                    -- Vote was removed by a concurrent click after our INSERT; try again
+                    CONTINUE WHEN NOT FOUND;
+
+                    IF v_existing = p_vote_type THEN
+                        DELETE FROM votes WHERE argument_id = p_argument_id AND user_id = p_user_id;
+                        vote_delta := -v_weight;
+                        user_vote := NULL;
+                    ELSE
+                        UPDATE votes SET vote_type = p_vote_type
+                        WHERE argument_id = p_argument_id AND user_id = p_user_id;
+                        vote_delta := 2 * v_weight;
+                        user_vote := p_vote_type;
+                    END IF;
+                    EXIT;
+                END LOOP;
+                RETURN NEXT;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        await cursor.execute("""
+            CREATE OR REPLACE FUNCTION toggle_vote(p_argument_id INTEGER, p_user_id UUID, p_vote_type TEXT)
+            RETURNS TABLE (vote_count INTEGER, user_vote TEXT) AS $$
+            DECLARE
+                v_delta INTEGER;
+            BEGIN
+                SELECT r.vote_delta, r.user_vote INTO v_delta, user_vote
+                FROM record_vote(p_argument_id, p_user_id, p_vote_type) r;
+                IF NOT FOUND THEN
+                    RETURN;
+                END IF;
+
+                UPDATE arguments SET votes = COALESCE(votes, 0) + v_delta
+                WHERE id = p_argument_id
+                RETURNING votes INTO vote_count;
+                RETURN NEXT;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+
+async def migrate_resync_vote_counts():
+    """
+    Recompute arguments.votes from the votes table (disregards seeded baseline votes).
+    Counters are maintained by delta from here on, so they must start out matching the votes rows.
+    """
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            UPDATE arguments a
+            SET votes = counts.vote_count
+            FROM (
+                SELECT a2.id,
+                       COALESCE(SUM(CASE v.vote_type WHEN 'upvote' THEN 1 WHEN 'downvote' THEN -1 END), 0) AS vote_count
+                FROM arguments a2
+                LEFT JOIN votes v ON v.argument_id = a2.id
+                GROUP BY a2.id
+            ) counts
+            WHERE a.id = counts.id
+              AND a.votes IS DISTINCT FROM counts.vote_count
+        """)
+
+
+async def get_argument(argument_id: int) -> Optional[dict]:
     """Get a single argument by ID."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute("SELECT * FROM arguments WHERE id = %s", (argument_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
-    
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute("SELECT * FROM arguments WHERE id = %s", (argument_id,))
+        row = await cursor.fetchone()
+
     if row:
         arg = dict(row)
         arg['topic_id'] = str(arg['topic_id'])  # Convert UUID to string
-        # Parse key_urls JSON if it exists
-        if arg.get('key_urls'):
-            try:
-                arg['key_urls'] = json.loads(arg['key_urls'])
-            except (json.JSONDecodeError, TypeError):
-                arg['key_urls'] = []
-        else:
-            arg['key_urls'] = []
+        arg['key_urls'] = arg.get('key_urls') or []  # JSONB arrives as a list
         # Convert datetime fields to ISO strings
         arg['created_at'] = _format_datetime_to_iso(arg.get('created_at'))
         arg['validity_checked_at'] = _format_datetime_to_iso(arg.get('validity_checked_at'))
         return arg
     return None
 
-def update_argument(argument_id: int, title: str, content: str, sources: Optional[str] = None):
+async def update_argument(argument_id: int, title: str, content: str, sources: Optional[str] = None):
     """Update an argument's title, content, and sources."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        """UPDATE arguments 
-           SET title = %s, content = %s, sources = %s
-           WHERE id = %s""",
-        (title, content, sources, argument_id)
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE arguments
+               SET title = %s, content = %s, sources = %s
+               WHERE id = %s""",
+            (title, content, sources, argument_id)
+        )
 
-def update_argument_validity(argument_id: int, validity_score: int, validity_reasoning: str, key_urls: Optional[List[str]] = None):
+async def update_argument_validity(argument_id: int, validity_score: int, validity_reasoning: str, key_urls: Optional[List[str]] = None):
     """Update argument validity fields."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Convert key_urls list to JSON string
-    key_urls_json = json.dumps(key_urls) if key_urls else None
-    
-    cursor.execute(
-        """UPDATE arguments 
-           SET validity_score = %s, validity_reasoning = %s, validity_checked_at = %s, key_urls = %s
-           WHERE id = %s""",
-        (validity_score, validity_reasoning, datetime.now(timezone.utc), key_urls_json, argument_id)
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE arguments
+               SET validity_score = %s, validity_reasoning = %s, validity_checked_at = %s, key_urls = %s
+               WHERE id = %s""",
+            (validity_score, validity_reasoning, datetime.now(timezone.utc), Jsonb(key_urls) if key_urls else None, argument_id)
+        )
+
+async def update_arguments_validity_bulk(verdicts: list[dict]):
+    """
+    Update validity fields for many arguments in one statement.
+    Each verdict dict has argument_id, validity_score, validity_reasoning and key_urls.
+    """
+    if not verdicts:
+        return
 
-def get_arguments_sorted_by_validity(topic_id: str, side: Optional[str] = None) -> list:
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE arguments AS a
+               SET validity_score = v.validity_score,
+                   validity_reasoning = v.validity_reasoning,
+                   validity_checked_at = %s,
+                   key_urls = v.key_urls
+               FROM unnest(%s::int[], %s::int[], %s::text[], %s::jsonb[])
+                   AS v(id, validity_score, validity_reasoning, key_urls)
+               WHERE a.id = v.id""",
+            (
+                datetime.now(timezone.utc),
+                [v['argument_id'] for v in verdicts],
+                [v['validity_score'] for v in verdicts],
+                [v['validity_reasoning'] for v in verdicts],
+                [Jsonb(v['key_urls']) if v.get('key_urls') else None for v in verdicts]
+            )
+        )
+
+async def get_arguments_sorted_by_validity(topic_id: str, side: Optional[str] = None) -> list:
     """Get arguments sorted by validity score (highest first, unverified at end)."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    if side and side in ['pro', 'con']:
-        cursor.execute("""
-            SELECT * FROM arguments 
-            WHERE topic_id = %s AND side = %s
-            ORDER BY 
-                CASE WHEN validity_score IS NULL THEN 1 ELSE 0 END,
-                validity_score DESC,
-                created_at DESC
-        """, (topic_id, side))
-    else:
-        cursor.execute("""
-            SELECT * FROM arguments 
-            WHERE topic_id = %s
-            ORDER BY 
-                CASE WHEN validity_score IS NULL THEN 1 ELSE 0 END,
-                validity_score DESC,
-                created_at DESC
-        """, (topic_id,))
-    
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    
+    async with get_cursor(dict_rows=True) as cursor:
+        if side and side in ['pro', 'con']:
+            await cursor.execute("""
+                SELECT * FROM arguments
+                WHERE topic_id = %s AND side = %s
+                ORDER BY validity_score DESC NULLS LAST, created_at DESC
+            """, (topic_id, side))
+        else:
+            await cursor.execute("""
+                SELECT * FROM arguments
+                WHERE topic_id = %s
+                ORDER BY validity_score DESC NULLS LAST, created_at DESC
+            """, (topic_id,))
+        rows = await cursor.fetchall()
+
     arguments = [dict(row) for row in rows]
-    # Parse key_urls JSON and convert timestamps for each argument
+    # Convert IDs and timestamps for each argument (key_urls JSONB arrives as a list)
     for arg in arguments:
         arg['topic_id'] = str(arg['topic_id'])  # Convert UUID to string
-        if arg.get('key_urls'):
-            try:
-                arg['key_urls'] = json.loads(arg['key_urls'])
-            except (json.JSONDecodeError, TypeError):
-                arg['key_urls'] = []
-        else:
-            arg['key_urls'] = []
+        arg['key_urls'] = arg.get('key_urls') or []
         # Convert datetime fields to ISO strings
         arg['created_at'] = _format_datetime_to_iso(arg.get('created_at'))
         arg['validity_checked_at'] = _format_datetime_to_iso(arg.get('validity_checked_at'))
-    
+
     return arguments
 
-def get_argument_matches(topic_id: str) -> list:
+async def get_argument_matches(topic_id: str) -> list:
     """Get persisted argument matches for a topic."""
-    ensure_argument_matches_table()
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    cursor.execute(
-        "SELECT pro_id, con_id, reason FROM argument_matches WHERE topic_id = %s",
-        (topic_id,)
-    )
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute(
+            "SELECT pro_id, con_id, reason FROM argument_matches WHERE topic_id = %s",
+            (topic_id,)
+        )
+        rows = await cursor.fetchall()
     return [dict(row) for row in rows]
 
-def save_argument_matches(topic_id: str, matches: list):
+async def save_argument_matches(topic_id: str, matches: list):
     """Save argument matches to database."""
-    ensure_argument_matches_table()
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Clear existing matches for this topic
-    cursor.execute("DELETE FROM argument_matches WHERE topic_id = %s", (topic_id,))
-    
-    # Insert new matches
-    for match in matches:
-        cursor.execute(
-            """INSERT INTO argument_matches (topic_id, pro_id, con_id, reason)
-               VALUES (%s, %s, %s, %s)""",
-            (topic_id, match['pro_id'], match['con_id'], match.get('reason'))
-        )
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
+    async with get_cursor() as cursor:
+        # Clear existing matches for this topic
+        await cursor.execute("DELETE FROM argument_matches WHERE topic_id = %s", (topic_id,))
+
+        # Insert new matches
+        for match in matches:
+            await cursor.execute(
+                """INSERT INTO argument_matches (topic_id, pro_id, con_id, reason)
+                   VALUES (%s, %s, %s, %s)""",
+                (topic_id, match['pro_id'], match['con_id'], match.get('reason'))
+            )
 
-def delete_argument_matches_for_topic(topic_id: str):
+async def delete_argument_matches_for_topic(topic_id: str):
     """Delete all argument matches for a topic."""
-    ensure_argument_matches_table()
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM argument_matches WHERE topic_id = %s", (topic_id,))
-    conn.commit()
-    cursor.close()
-    conn.close()
-
-def get_user_vote(argument_id: int, user_id: UUID) -> Optional[str]:
+    async with get_cursor() as cursor:
+        await cursor.execute("DELETE FROM argument_matches WHERE topic_id = %s", (topic_id,))
+
+async def get_user_vote(argument_id: int, user_id: UUID) -> Optional[str]:
     """Get user's vote type for an argument. Returns 'upvote', 'downvote', or None."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute(
+    async with get_cursor() as cursor:
+        await cursor.execute(
             "SELECT vote_type FROM votes WHERE argument_id = %s AND user_id = %s",
             (argument_id, str(user_id))
         )
-        result = cursor.fetchone()
-        return result[0] if result else None
-    finally:
-        cursor.close()
-        conn.close()
+        result = await cursor.fetchone()
+    return result[0] if result else None
 
-def upvote_argument(argument_id: int, user_id: UUID) -> tuple[int, Optional[str]]:
+async def get_user_votes_for_topic(topic_id: str, user_id: UUID) -> dict[int, str]:
+    """Get the user's vote on every argument in a topic as {argument_id: vote_type}."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """SELECT v.argument_id, v.vote_type
+               FROM votes v
+               JOIN arguments a ON a.id = v.argument_id
+               WHERE v.user_id = %s AND a.topic_id = %s""",
+            (str(user_id), topic_id)
+        )
+        rows = await cursor.fetchall()
+    return {argument_id: vote_type for argument_id, vote_type in rows}
+
+async def toggle_vote(argument_id: int, user_id: UUID, vote_type: str) -> Optional[tuple[int, Optional[str]]]:
     """
-    Handle upvote for an argument by a user.
-    Returns tuple of (vote_count, user_vote_status) where user_vote_status is 'upvote', 'downvote', or None.
+    Apply an upvote or downvote click in a single round trip (see toggle_vote() in Postgres).
+    Clicking the same vote again removes it; clicking the other one switches it.
+    Returns (vote_count, user_vote_status), or None if the argument doesn't exist.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Check if user has already voted
-        cursor.execute(
-            "SELECT vote_type FROM votes WHERE argument_id = %s AND user_id = %s",
-            (argument_id, str(user_id))
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            "SELECT vote_count, user_vote FROM toggle_vote(%s, %s, %s)",
+            (argument_id, str(user_id), vote_type)
         )
-        existing_vote = cursor.fetchone()
-        
-        if existing_vote:
-            existing_type = existing_vote[0]
-            if existing_type == 'upvote':
-                # User already upvoted, remove the vote (toggle off)
-                cursor.execute(
-                    "DELETE FROM votes WHERE argument_id = %s AND user_id = %s",
-                    (argument_id, str(user_id))
-                )
-                user_vote_status = None
-            else:
-                # User downvoted, change to upvote
-                cursor.execute(
-                    "UPDATE votes SET vote_type = 'upvote' WHERE argument_id = %s AND user_id = %s",
-                    (argument_id, str(user_id))
-                )
-                user_vote_status = 'upvote'
-        else:
-            # No existing vote, create new upvote
-            cursor.execute(
-                "INSERT INTO votes (argument_id, user_id, vote_type, created_at) VALUES (%s, %s, 'upvote', %s)",
-                (argument_id, str(user_id), datetime.now(timezone.utc))
-            )
-            user_vote_status = 'upvote'
-        
-        # Calculate vote count from votes table
-        cursor.execute("""
-            SELECT 
-                COUNT(CASE WHEN vote_type = 'upvote' THEN 1 END) - 
-                COUNT(CASE WHEN vote_type = 'downvote' THEN 1 END) as vote_count
-            FROM votes
-            WHERE argument_id = %s
-        """, (argument_id,))
-        result = cursor.fetchone()
-        vote_count = result[0] if result else 0
-        
-        # Update arguments.votes column to keep it in sync
-        cursor.execute(
-            "UPDATE arguments SET votes = %s WHERE id = %s",
-            (vote_count, argument_id)
+        row = await cursor.fetchone()
+    return (row[0], row[1]) if row else None
+
+async def record_vote(argument_id: int, user_id: UUID, vote_type: str) -> Optional[tuple[int, int, Optional[str]]]:
+    """
+    Apply a vote click to the votes table only, leaving arguments.votes untouched
+    (used by the write-behind vote buffer).
+    Returns (stored_vote_count, delta, user_vote_status), or None if the argument doesn't exist.
+    """
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            "SELECT vote_count, vote_delta, user_vote FROM record_vote(%s, %s, %s)",
+            (argument_id, str(user_id), vote_type)
+        )
+        row = await cursor.fetchone()
+    return (row[0], row[1], row[2]) if row else None
+
+async def apply_vote_deltas(deltas: dict[int, int]):
+    """Add buffered counter deltas to arguments.votes in one statement."""
+    if not deltas:
+        return
+
+    # Lock rows in id order so concurrent flushes from different workers can't deadlock
+    argument_ids = sorted(deltas)
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """WITH locked AS (
+                   SELECT id FROM arguments WHERE id = ANY(%s) ORDER BY id FOR UPDATE
+               )
+               UPDATE arguments AS a
+               SET votes = COALESCE(a.votes, 0) + d.delta
+               FROM unnest(%s::int[], %s::int[]) AS d(id, delta)
+               WHERE a.id = d.id AND a.id IN (SELECT id FROM locked)""",
+            (argument_ids, argument_ids, [deltas[argument_id] for argument_id in argument_ids])
         )
-        
-        conn.commit()
-        return vote_count, user_vote_status
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def downvote_argument(argument_id: int, user_id: UUID) -> tuple[int, Optional[str]]:
+
+async def upvote_argument(argument_id: int, user_id: UUID) -> Optional[tuple[int, Optional[str]]]:
+    """
+    Handle upvote for an argument by a user.
+    Returns tuple of (vote_count, user_vote_status) where user_vote_status is 'upvote', 'downvote', or None.
+    Returns None if the argument doesn't exist.
+    """
+    return await toggle_vote(argument_id, user_id, 'upvote')
+
+async def downvote_argument(argument_id: int, user_id: UUID) -> Optional[tuple[int, Optional[str]]]:
     """
     Handle downvote for an argument by a user.
     Returns tuple of (vote_count, user_vote_status) where user_vote_status is 'upvote', 'downvote', or None.
+    Returns None if the argument doesn't exist.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Check if user has already voted
-        cursor.execute(
-            "SELECT vote_type FROM votes WHERE argument_id = %s AND user_id = %s",
-            (argument_id, str(user_id))
-        )
-        existing_vote = cursor.fetchone()
-        
-        if existing_vote:
-            existing_type = existing_vote[0]
-            if existing_type == 'downvote':
-                # User already downvoted, remove the vote (toggle off)
-                cursor.execute(
-                    "DELETE FROM votes WHERE argument_id = %s AND user_id = %s",
-                    (argument_id, str(user_id))
-                )
-                user_vote_status = None
-            else:
-                # User upvoted, change to downvote
-                cursor.execute(
-                    "UPDATE votes SET vote_type = 'downvote' WHERE argument_id = %s AND user_id = %s",
-                    (argument_id, str(user_id))
-                )
-                user_vote_status = 'downvote'
-        else:
-            # No existing vote, create new downvote
-            cursor.execute(
-                "INSERT INTO votes (argument_id, user_id, vote_type, created_at) VALUES (%s, %s, 'downvote', %s)",
-                (argument_id, str(user_id), datetime.now(timezone.utc))
-            )
-            user_vote_status = 'downvote'
-        
-        # Calculate vote count from votes table
-        cursor.execute("""
-            SELECT 
-                COUNT(CASE WHEN vote_type = 'upvote' THEN 1 END) - 
-                COUNT(CASE WHEN vote_type = 'downvote' THEN 1 END) as vote_count
-            FROM votes
-            WHERE argument_id = %s
-        """, (argument_id,))
-        result = cursor.fetchone()
-        vote_count = result[0] if result else 0
-        
-        # Update arguments.votes column to keep it in sync
-        cursor.execute(
-            "UPDATE arguments SET votes = %s WHERE id = %s",
-            (vote_count, argument_id)
-        )
-        
-        conn.commit()
-        return vote_count, user_vote_status
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def create_comment(argument_id: int, comment: str, user_id: Optional[UUID] = None) -> int:
-    """Create a new comment for an argument and return the comment ID."""
-    conn = get_db_connection() 
-    cursor = conn.cursor()
+    return await toggle_vote(argument_id, user_id, 'downvote')
 
-    cursor.execute(
-        """INSERT INTO comments (argument_id, comment, user_id, created_at) VALUES (%s, %s, %s, %s) RETURNING id""",
-        (argument_id, comment, str(user_id) if user_id else None, datetime.now(timezone.utc))
-    )
+async def create_comment(argument_id: int, comment: str, user_id: Optional[UUID] = None) -> int:
+    """Create a new comment for an argument and return the comment ID."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """INSERT INTO comments (argument_id, comment, user_id, created_at) VALUES (%s, %s, %s, %s) RETURNING id""",
+            (argument_id, comment, str(user_id) if user_id else None, datetime.now(timezone.utc))
+        )
+        result = await cursor.fetchone()
 
-    result = cursor.fetchone()
     comment_id = result[0] if result else None
-    conn.commit()
-    cursor.close()
-    conn.close()
     return comment_id
 
-def get_comments(argument_id: int) -> list[dict]:
+async def get_comments(argument_id: int) -> list[dict]:
     """Get all comments for an argument, ordered by creation date (oldest first)."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT id, argument_id, comment, created_at
-        FROM comments
-        WHERE argument_id = %s
-        ORDER BY created_at ASC
-    """, (argument_id,))
-    
-    rows = cursor.fetchall()
+    async with get_cursor() as cursor:
+        await cursor.execute("""
+            SELECT id, argument_id, comment, created_at
+            FROM comments
+            WHERE argument_id = %s
+            ORDER BY created_at ASC
+        """, (argument_id,))
+        rows = await cursor.fetchall()
+
     comments = []
     for row in rows:
         comments.append({
@@ -875,181 +1275,492 @@ def get_comments(argument_id: int) -> list[dict]:
             'comment': row[2],
             'created_at': row[3].isoformat() if row[3] else None
         })
-    
-    cursor.close()
-    conn.close()
     return comments
 
 # User Profile Functions
 
-def create_user_profile(user_id: UUID, email: str, username: str, avatar_url: Optional[str] = None) -> dict:
+async def create_user_profile(user_id: UUID, email: str, username: str, avatar_url: Optional[str] = None) -> dict:
     """Create a new user profile or update existing one."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    try:
+    async with get_cursor(dict_rows=True) as cursor:
         # Try to update existing profile first
-        cursor.execute("""
-            UPDATE user_profiles 
+        await cursor.execute("""
+            UPDATE user_profiles
             SET username = %s, email = %s, avatar_url = %s, updated_at = %s
             WHERE id = %s
             RETURNING *
         """, (username, email, avatar_url, datetime.now(timezone.utc), str(user_id)))
-        
-        row = cursor.fetchone()
-        
+
+        row = await cursor.fetchone()
+
         if not row:
             # Create new profile if it doesn't exist
-            cursor.execute("""
+            await cursor.execute("""
                 INSERT INTO user_profiles (id, username, email, avatar_url, created_at, updated_at)
                 VALUES (%s, %s, %s, %s, %s, %s)
                 RETURNING *
             """, (str(user_id), username, email, avatar_url, datetime.now(timezone.utc), datetime.now(timezone.utc)))
-            row = cursor.fetchone()
-        
-        conn.commit()
-        
-        if row:
-            profile = dict(row)
-            profile['created_at'] = _format_datetime_to_iso(profile.get('created_at'))
-            profile['updated_at'] = _format_datetime_to_iso(profile.get('updated_at'))
-            return profile
-        return None
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-def get_user_profile(user_id: UUID) -> Optional[dict]:
+            row = await cursor.fetchone()
+
+    if row:
+        profile = dict(row)
+        profile['created_at'] = _format_datetime_to_iso(profile.get('created_at'))
+        profile['updated_at'] = _format_datetime_to_iso(profile.get('updated_at'))
+        return profile
+    return None
+
+async def get_user_profile(user_id: UUID) -> Optional[dict]:
     """Get a user profile by user_id."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    try:
-        cursor.execute("SELECT * FROM user_profiles WHERE id = %s", (str(user_id),))
-        row = cursor.fetchone()
-        
-        if row:
-            profile = dict(row)
-            profile['created_at'] = _format_datetime_to_iso(profile.get('created_at'))
-            profile['updated_at'] = _format_datetime_to_iso(profile.get('updated_at'))
-            return profile
-        return None
-    finally:
-        cursor.close()
-        conn.close()
-
-def get_or_create_user_profile(user_id: UUID, email: str, username: str, avatar_url: Optional[str] = None) -> dict:
-    """Get existing user profile or create a new one."""
-    profile = get_user_profile(user_id)
-    if profile:
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute("SELECT * FROM user_profiles WHERE id = %s", (str(user_id),))
+        row = await cursor.fetchone()
+
+    if row:
+        profile = dict(row)
+        profile['created_at'] = _format_datetime_to_iso(profile.get('created_at'))
+        profile['updated_at'] = _format_datetime_to_iso(profile.get('updated_at'))
         return profile
-    return create_user_profile(user_id, email, username, avatar_url)
+    return None
+
+async def get_or_create_user_profile(user_id: UUID, email: str, username: str, avatar_url: Optional[str] = None) -> dict:
+    """
+    Get existing user profile or create a new one.
+    Single round trip: the INSERT is skipped on conflict and the existing row returned instead.
+    """
+    now = datetime.now(timezone.utc)
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute("""
+            WITH inserted AS (
+                INSERT INTO user_profiles (id, username, email, avatar_url, created_at, updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (id) DO NOTHING
+                RETURNING *
+            )
+            SELECT * FROM inserted
+            UNION ALL
+            SELECT * FROM user_profiles WHERE id = %s
+        """, (str(user_id), username, email, avatar_url, now, now, str(user_id)))
+        row = await cursor.fetchone()
+
+    if not row:
+        # A concurrent request created the profile after this statement's snapshot
+        return await get_user_profile(user_id)
+    profile = dict(row)
+    profile['created_at'] = _format_datetime_to_iso(profile.get('created_at'))
+    profile['updated_at'] = _format_datetime_to_iso(profile.get('updated_at'))
+    return profile
 
-def delete_user_profile(user_id: UUID) -> bool:
+async def delete_user_profile(user_id: UUID) -> bool:
     """Delete a user profile and all associated data."""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    try:
-        # Check if profile exists
-        profile = get_user_profile(user_id)
-        if not profile:
-            return False
-        
+    async with get_cursor() as cursor:
         # Delete the user profile
         # Foreign keys are set to ON DELETE SET NULL, so topics, arguments, and comments
         # will have their user_id set to NULL automatically
-        cursor.execute("DELETE FROM user_profiles WHERE id = %s", (str(user_id),))
-        
-        conn.commit()
+        await cursor.execute("DELETE FROM user_profiles WHERE id = %s", (str(user_id),))
         return cursor.rowcount > 0
-    except Exception as e:
-        conn.rollback()
-        raise
-    finally:
-        cursor.close()
-        conn.close()
-
-
-def get_user_contribution_count(user_id: UUID) -> int:
-    """Get total count of topics + arguments created by a user."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
+
+
+async def get_user_contribution_count(user_id: UUID) -> int:
+    """Get total count of topics + arguments created by a user, including queued submissions."""
+    async with get_cursor() as cursor:
         # Count topics created by user
-        cursor.execute(
+        await cursor.execute(
             "SELECT COUNT(*) FROM topics WHERE user_id = %s",
             (str(user_id),)
         )
-        topic_count = cursor.fetchone()[0]
-        
+        topic_count = (await cursor.fetchone())[0]
+
         # Count arguments created by user
-        cursor.execute(
+        await cursor.execute(
             "SELECT COUNT(*) FROM arguments WHERE user_id = %s",
             (str(user_id),)
         )
-        argument_count = cursor.fetchone()[0]
-        
-        return topic_count + argument_count
-    finally:
-        cursor.close()
-        conn.close()
+        argument_count = (await cursor.fetchone())[0]
+
+        # Count argument submissions still waiting for fact-checking
+        await cursor.execute(
+            """SELECT COUNT(*) FROM jobs
+               WHERE user_id = %s AND job_type = 'submit_argument' AND status IN ('pending', 'running')""",
+            (str(user_id),)
+        )
+        queued_count = (await cursor.fetchone())[0]
+
+    return topic_count + argument_count + queued_count
+
+
+# Job Queue Functions
+
+def _format_job(row) -> dict:
+    """Convert a jobs row into a JSON-friendly dict."""
+    job = dict(row)
+    job['id'] = str(job['id'])  # Convert UUID to string
+    job['created_at'] = _format_datetime_to_iso(job.get('created_at'))
+    job['updated_at'] = _format_datetime_to_iso(job.get('updated_at'))
+    return job
+
+
+async def enqueue_job(
+    job_type: str,
+    payload: dict,
+    user_id: Optional[UUID] = None,
+    dedup_key: Optional[str] = None,
+    failure_backoff_seconds: int = 0
+) -> dict:
+    """
+    Add a job to the queue and return it.
+    When dedup_key is given and a pending or running job with the same type and key
+    already exists, that job is returned instead of queueing a duplicate. With
+    failure_backoff_seconds, a latest job for the key that failed less than that long
+    ago is returned (status 'failed') instead of queueing a retry.
+    """
+    async with get_cursor(dict_rows=True) as cursor:
+        row = None
+        if dedup_key is not None and failure_backoff_seconds > 0:
+            await cursor.execute(
+                """SELECT * FROM (
+                       SELECT * FROM jobs
+                       WHERE job_type = %s AND dedup_key = %s
+                       ORDER BY created_at DESC
+                       LIMIT 1
+                   ) latest
+                   WHERE status = 'failed'
+                     AND updated_at > CURRENT_TIMESTAMP - make_interval(secs => %s)""",
+                (job_type, dedup_key, failure_backoff_seconds)
+            )
+            row = await cursor.fetchone()
+        # Loop in case the conflicting job finishes between the INSERT and the SELECT
+        while row is None:
+            await cursor.execute(
+                """INSERT INTO jobs (job_type, payload, user_id, dedup_key)
+                   VALUES (%s, %s, %s, %s)
+                   ON CONFLICT (job_type, dedup_key)
+                       WHERE status IN ('pending', 'running') AND dedup_key IS NOT NULL
+                       DO NOTHING
+                   RETURNING *""",
+                (job_type, Jsonb(payload), str(user_id) if user_id else None, dedup_key)
+            )
+            row = await cursor.fetchone()
+            if row is None:
+                await cursor.execute(
+                    """SELECT * FROM jobs
+                       WHERE job_type = %s AND dedup_key = %s AND status IN ('pending', 'running')""",
+                    (job_type, dedup_key)
+                )
+                row = await cursor.fetchone()
+    return _format_job(row)
+
+
+async def get_job(job_id: str) -> Optional[dict]:
+    """Get a job by UUID."""
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute("SELECT * FROM jobs WHERE id = %s", (job_id,))
+        row = await cursor.fetchone()
+    return _format_job(row) if row else None
+
+
+async def claim_next_job() -> Optional[dict]:
+    """
+    Atomically claim the oldest pending job for this worker.
+    SKIP LOCKED lets concurrent workers claim different jobs without blocking each other.
+    """
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute("""
+            UPDATE jobs
+            SET status = 'running', attempts = attempts + 1, updated_at = CURRENT_TIMESTAMP
+            WHERE id = (
+                SELECT id FROM jobs
+                WHERE status = 'pending'
+                ORDER BY created_at
+                FOR UPDATE SKIP LOCKED
+                LIMIT 1
+            )
+            RETURNING *
+        """)
+        row = await cursor.fetchone()
+    return _format_job(row) if row else None
+
+
+async def finish_job(job_id: str, status: str, result: Optional[dict] = None, error: Optional[str] = None):
+    """Record the outcome of a job ('done', 'rejected' or 'failed')."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE jobs
+               SET status = %s, result = %s, error = %s, updated_at = CURRENT_TIMESTAMP
+               WHERE id = %s""",
+            (status, Jsonb(result) if result is not None else None, error, job_id)
+        )
+
+
+async def touch_job(job_id: str):
+    """Heartbeat for a running job, so requeue_stale_jobs doesn't take it from a live worker."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            "UPDATE jobs SET updated_at = CURRENT_TIMESTAMP WHERE id = %s AND status = 'running'",
+            (job_id,)
+        )
+
+
+async def requeue_stale_jobs(stale_after_seconds: int, max_attempts: int) -> int:
+    """
+    Return jobs left 'running' by a crashed worker to the queue.
+    Jobs that already used max_attempts are marked failed instead. Returns the number of jobs touched.
+    """
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE jobs
+               SET status = CASE WHEN attempts >= %s THEN 'failed' ELSE 'pending' END,
+                   error = CASE WHEN attempts >= %s THEN 'Worker stopped before finishing the job' ELSE error END,
+                   updated_at = CURRENT_TIMESTAMP
+               WHERE status = 'running'
+                 AND updated_at < CURRENT_TIMESTAMP - make_interval(secs => %s)""",
+            (max_attempts, max_attempts, stale_after_seconds)
+        )
+        return cursor.rowcount
+
+
+# Fact-Check Verdict Cache Functions
+
+async def get_cached_verdict(cache_key: str, max_age_seconds: int) -> Optional[dict]:
+    """Get a cached fact-check verdict if it is younger than max_age_seconds."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """SELECT verdict FROM fact_check_verdicts
+               WHERE cache_key = %s
+                 AND created_at > CURRENT_TIMESTAMP - make_interval(secs => %s)""",
+            (cache_key, max_age_seconds)
+        )
+        row = await cursor.fetchone()
+    return row[0] if row else None
+
+
+async def save_cached_verdict(cache_key: str, verdict: dict):
+    """Store (or refresh) a fact-check verdict in the shared cache."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """INSERT INTO fact_check_verdicts (cache_key, verdict, created_at)
+               VALUES (%s, %s, CURRENT_TIMESTAMP)
+               ON CONFLICT (cache_key)
+               DO UPDATE SET verdict = EXCLUDED.verdict, created_at = EXCLUDED.created_at""",
+            (cache_key, Jsonb(verdict))
+        )
+
+
+async def prune_verdict_cache(max_age_seconds: int) -> int:
+    """Delete expired verdicts. Returns the number of rows removed."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """DELETE FROM fact_check_verdicts
+               WHERE created_at <= CURRENT_TIMESTAMP - make_interval(secs => %s)""",
+            (max_age_seconds,)
+        )
+        return cursor.rowcount
+
+
+# Evidence Search Cache Functions
+
+async def get_cached_evidence(claim_key: str, signature: str, max_age_seconds: int) -> Optional[list]:
+    """
+    Get cached search results for a claim younger than max_age_seconds.
+    Prefers an exact claim match, then falls back to a near-duplicate with the same signature.
+    """
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """SELECT results FROM evidence_cache
+               WHERE (claim_key = %s OR signature = %s)
+                 AND created_at > CURRENT_TIMESTAMP - make_interval(secs => %s)
+               ORDER BY (claim_key = %s) DESC, created_at DESC
+               LIMIT 1""",
+            (claim_key, signature, max_age_seconds, claim_key)
+        )
+        row = await cursor.fetchone()
+    return row[0] if row else None
+
+
+async def save_cached_evidence(claim_key: str, signature: str, results: list):
+    """Store (or refresh) search results for a claim."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """INSERT INTO evidence_cache (claim_key, signature, results, created_at)
+               VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
+               ON CONFLICT (claim_key)
+               DO UPDATE SET signature = EXCLUDED.signature, results = EXCLUDED.results, created_at = EXCLUDED.created_at""",
+            (claim_key, signature, Jsonb(results))
+        )
+
+
+async def prune_evidence_cache(max_age_seconds: int) -> int:
+    """Delete expired search results. Returns the number of rows removed."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """DELETE FROM evidence_cache
+               WHERE created_at <= CURRENT_TIMESTAMP - make_interval(secs => %s)""",
+            (max_age_seconds,)
+        )
+        return cursor.rowcount
+
+
+# Single-Flight Lease Functions
+
+async def acquire_work_lease(lease_key: str, owner: str, lease_seconds: int) -> bool:
+    """
+    Try to become the one worker computing lease_key.
+    Succeeds if nobody holds the lease, or the previous holder finished or let it expire.
+    """
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """INSERT INTO work_leases (lease_key, owner, expires_at)
+               VALUES (%s, %s, CURRENT_TIMESTAMP + make_interval(secs => %s))
+               ON CONFLICT (lease_key) DO UPDATE
+               SET owner = EXCLUDED.owner,
+                   expires_at = EXCLUDED.expires_at,
+                   result = NULL,
+                   error = NULL,
+                   finished_at = NULL
+               WHERE work_leases.finished_at IS NOT NULL
+                  OR work_leases.expires_at < CURRENT_TIMESTAMP
+               RETURNING owner""",
+            (lease_key, owner, lease_seconds)
+        )
+        return await cursor.fetchone() is not None
+
+
+async def get_work_lease(lease_key: str) -> Optional[dict]:
+    """Get the current state of a lease, including whether it has expired."""
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute(
+            """SELECT owner, result, error, finished_at,
+                      expires_at < CURRENT_TIMESTAMP AS expired
+               FROM work_leases WHERE lease_key = %s""",
+            (lease_key,)
+        )
+        row = await cursor.fetchone()
+    return dict(row) if row else None
+
+
+async def finish_work_lease(lease_key: str, owner: str, result):
+    """Publish the result of a lease so waiting workers can pick it up."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE work_leases
+               SET result = %s, finished_at = CURRENT_TIMESTAMP
+               WHERE lease_key = %s AND owner = %s""",
+            (Jsonb(result), lease_key, owner)
+        )
+
+
+async def renew_work_lease(lease_key: str, owner: str, lease_seconds: int) -> bool:
+    """Extend a lease this owner still holds. Returns False if it was lost (expired and taken over)."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE work_leases
+               SET expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s)
+               WHERE lease_key = %s AND owner = %s AND finished_at IS NULL
+               RETURNING owner""",
+            (lease_seconds, lease_key, owner)
+        )
+        return await cursor.fetchone() is not None
+
+
+async def fail_work_lease(lease_key: str, owner: str, error: str):
+    """Publish that a lease's computation failed, so waiting workers raise instead of recomputing."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE work_leases
+               SET error = %s, finished_at = CURRENT_TIMESTAMP
+               WHERE lease_key = %s AND owner = %s""",
+            (error, lease_key, owner)
+        )
+
+
+async def release_work_lease(lease_key: str, owner: str):
+    """Give up a lease without a result, so a waiting worker takes over (the computation was cancelled)."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            "DELETE FROM work_leases WHERE lease_key = %s AND owner = %s",
+            (lease_key, owner)
+        )
+
+
+async def prune_work_leases(max_age_seconds: int) -> int:
+    """Delete finished or expired leases older than max_age_seconds. Returns the number of rows removed."""
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """DELETE FROM work_leases
+               WHERE expires_at <= CURRENT_TIMESTAMP - make_interval(secs => %s)""",
+            (max_age_seconds,)
+        )
+        return cursor.rowcount
 
 
 # API Usage Tracking Functions
 
-def get_api_call_count(api_name: str) -> int:
+async def get_api_call_count(api_name: str) -> int:
     """Get the current call count for an API."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute(
+    async with get_cursor() as cursor:
+        await cursor.execute(
             "SELECT call_count FROM api_usage WHERE api_name = %s",
             (api_name,)
         )
-        result = cursor.fetchone()
-        return result[0] if result else 0
-    finally:
-        cursor.close()
-        conn.close()
-
-
-def increment_api_call_count(api_name: str) -> int:
-    """Increment the call count for an API and return the new count."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Use upsert to handle first-time insertion
-        cursor.execute("""
-            INSERT INTO api_usage (api_name, call_count, last_reset)
-            VALUES (%s, 1, CURRENT_TIMESTAMP)
-            ON CONFLICT (api_name) 
-            DO UPDATE SET call_count = api_usage.call_count + 1
-            RETURNING call_count
-        """, (api_name,))
-        
-        result = cursor.fetchone()
-        conn.commit()
-        return result[0] if result else 1
-    finally:
-        cursor.close()
-        conn.close()
-
-
-def check_api_limit(api_name: str, limit: int = 750) -> bool:
-    """Check if an API is under its call limit. Returns True if under limit."""
-    current_count = get_api_call_count(api_name)
-    return current_count < limit
-
-
-if __name__ == '__main__':
-    # Test database connection
-    conn = get_db_connection()
-    print("Database connection successful!")
-    conn.close()
\ No newline at end of file
+        result = await cursor.fetchone()
+    return result[0] if result else 0
+
+
+async def reserve_api_calls(api_name: str, count: int, limit: int, window_seconds: int = 0) -> Optional[dict]:
+    """
+    Atomically reserve up to `count` calls against an API's global limit.
+    When window_seconds > 0 and the current window has elapsed, the count is reset first.
+    Returns {granted, call_count, window_start, window_remaining_seconds}; granted is 0 once
+    the limit is reached.
+    window_remaining_seconds is None when the count never resets.
+    """
+    query = """
+        UPDATE api_usage AS u
+        SET call_count = p.base_count + LEAST(%(count)s, GREATEST(%(limit)s - p.base_count, 0)),
+            last_reset = p.window_start
+        FROM (
+            SELECT api_name,
+                   CASE WHEN expired THEN 0 ELSE call_count END AS base_count,
+                   CASE WHEN expired THEN CURRENT_TIMESTAMP ELSE last_reset END AS window_start
+            FROM (
+                SELECT api_name, call_count, last_reset,
+                       %(window)s > 0
+                           AND last_reset <= CURRENT_TIMESTAMP - make_interval(secs => %(window)s) AS expired
+                FROM api_usage
+                WHERE api_name = %(api_name)s
+                FOR UPDATE
+            ) AS current
+        ) AS p
+        WHERE u.api_name = p.api_name
+        RETURNING u.call_count - p.base_count AS granted,
+                  u.call_count,
+                  u.last_reset AS window_start,
+                  CASE WHEN %(window)s > 0
+                       THEN EXTRACT(EPOCH FROM u.last_reset + make_interval(secs => %(window)s) - CURRENT_TIMESTAMP)::float
+                  END AS window_remaining_seconds
+    """
+    params = {'api_name': api_name, 'count': count, 'limit': limit, 'window': window_seconds}
+    async with get_cursor(dict_rows=True) as cursor:
+        await cursor.execute(query, params)
+        row = await cursor.fetchone()
+        if row is None:
+            # First use of this API: create its counter row and reserve again
+            await cursor.execute(
+                "INSERT INTO api_usage (api_name, call_count, last_reset) VALUES (%s, 0, CURRENT_TIMESTAMP) ON CONFLICT (api_name) DO NOTHING",
+                (api_name,)
+            )
+            await cursor.execute(query, params)
+            row = await cursor.fetchone()
+    return dict(row) if row else None
+
+
+async def release_api_calls(api_name: str, count: int, window_start: datetime):
+    """
+    Return unused reserved calls to an API's global count.
+    Skipped if the window they were reserved in (window_start) has since been reset.
+    """
+    async with get_cursor() as cursor:
+        await cursor.execute(
+            """UPDATE api_usage
+               SET call_count = GREATEST(call_count - %s, 0)
+               WHERE api_name = %s AND last_reset = %s""",
+            (count, api_name, window_start)
+        )
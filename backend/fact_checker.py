@@ -1,34 +1,124 @@
+import asyncio
 import json
 import re
+import hashlib
 import logging
 from typing import Dict, List, Optional
-from anthropic import Anthropic
-from tavily import TavilyClient
-from pydantic import BaseModel, Field
+import httpx
+from pydantic import BaseModel, Field, field_validator
+import api_quota
 import database
+import llm_gateway
 from config import config
+from utils.cache import TTLCache
+from utils.single_flight import single_flight
 
 logger = logging.getLogger(__name__)
 
-# Initialize API clients using immutable config
-claude_client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
-tavily_client = TavilyClient(api_key=config.TAVILY_API_KEY)
+# Initialize async search client using immutable config (Claude calls go through llm_gateway)
+tavily_client = httpx.AsyncClient(base_url="https://api.tavily.com", timeout=config.SEARCH_TIMEOUT_SECONDS)
+
+# Per-process concurrency budget so parallel fact-checks stay within Tavily's rate limits
+tavily_slots = asyncio.Semaphore(config.TAVILY_MAX_CONCURRENCY)
 
 # Use immutable config values
 CLAUDE_MODEL = config.CLAUDE_MODEL_FAST
-API_CALL_LIMIT = config.API_CALL_LIMIT
 
+# Bump whenever prompts, models or scoring rules change so stale verdicts are not reused
+PIPELINE_VERSION = "3"
 
-class ValidityVerdict(BaseModel):
-    """Pydantic model for fact-checking verdict."""
+# Static instructions for analyze_and_score, sent as a plain system prompt; the topic,
+# claim and search results follow in the user message. Not marked for prompt caching:
+# even with the tool schema it is well under the fast model's 2048-token cache minimum
+SCORING_RUBRIC = """You are fact-checking an argument in a debate. The user message gives the DEBATE TOPIC, the ORIGINAL CLAIM TO VERIFY and the SEARCH RESULTS found for it.
+
+FIRST, determine if this argument is RELEVANT to the debate topic.
+
+An argument is IRRELEVANT if it:
+- Contains no factual claims (only opinions like "this sucks" or "you guys are wrong")
+- Makes claims unrelated to the debate topic
+- Is just insults, rhetoric, or emotional statements
+- Contains nonsensical or random text with no meaning
+
+If IRRELEVANT:
+- Set is_relevant to false
+- Set validity_score to 1
+- Provide reasoning explaining why it's irrelevant. Be specific about what makes it irrelevant.
+
+If RELEVANT:
+- Set is_relevant to true
+- Verify whether the factual claims supporting their position are true
+- Score based on evidence quality (1-5 stars)
+
+CRITICAL: Your reasoning must be about the ORIGINAL CLAIM. Do NOT write reasoning about claims that are not in the ORIGINAL CLAIM. If the search results don't match the original claim, state that clearly.
+
+If RELEVANT, assign a validity score from 1-5 stars based on these criteria:
+
+- 5 stars: Fully supported by multiple high-quality sources (average relevance score > 0.8, at least 2-3 sources)
+- 4 stars: Mostly supported with good sources (average relevance score > 0.6, at least 2 sources)
+- 3 stars: Partially supported, mixed evidence (1-2 sources with moderate scores)
+- 2 stars: Limited support from few sources (only 1 source or low average score)
+- 1 star: No credible evidence, contradicted by sources
+
+IMPORTANT: These sources have already been filtered for quality (relevance score > 0.5).
+If very few sources pass this threshold, the validity score should be lower.
+
+Consider BOTH the number of sources AND their quality (relevance scores).
+
+Record your verdict with the record_verdict tool:
+- is_relevant: whether the argument is relevant to the debate topic
+- validity_score: 1-5
+- reasoning: 2-3 sentences explaining the score
+- key_urls: up to 3 URLs taken from the search results"""
+
+# Per-worker verdict cache in front of the shared fact_check_verdicts table
+verdict_cache = TTLCache(
+    max_entries=config.VERDICT_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.VERDICT_CACHE_TTL_SECONDS
+)
+verdict_cache_db_hits = 0
+
+# Per-topic warm sets of recent search results: proposition key -> TTLCache(signature -> results)
+WARM_TOPICS = 64
+WARM_CLAIMS_PER_TOPIC = 128
+evidence_warm_sets = TTLCache(max_entries=WARM_TOPICS, ttl_seconds=config.EVIDENCE_CACHE_TTL_SECONDS)
+evidence_cache_warm_hits = 0
+evidence_cache_db_hits = 0
+evidence_cache_misses = 0
+
+# Words ignored when building near-duplicate claim signatures. Negations and
+# comparatives (not, no, more, less, ...) are kept: dropping them would give a claim
+# and its opposite the same signature and share one's evidence with the other.
+_SIGNATURE_STOPWORDS = frozenset("""
+    a an the and or but of to in on at by for with from as is are was were be been being
+    it its this that these those there their they than then so such very can could would
+    should will may might has have had do does did also about into
+""".split())
+# Bump when the signature rules change so rows keyed by old signatures stop matching
+_SIGNATURE_VERSION = "2"
+# "can't" would otherwise normalize to the stopword "can" plus a dropped "t"
+_NEGATED_CONTRACTION = re.compile(r"n['’]t\b", re.IGNORECASE)
+
+
+class ValidityAssessment(BaseModel):
+    """The part of a verdict Claude fills in (schema of the record_verdict tool)."""
     is_relevant: bool = Field(..., description="Whether the argument is relevant to the debate topic")
     validity_score: int = Field(..., ge=1, le=5, description="Validity score from 1-5 stars (only meaningful if is_relevant=True)")
     reasoning: str = Field(..., description="Explanation for the validity score")
     key_urls: List[str] = Field(..., description="Top 3 most relevant source URLs")
+
+    @field_validator("key_urls")
+    @classmethod
+    def _top_three_urls(cls, key_urls: List[str]) -> List[str]:
+        return [url for url in key_urls if url][:3]
+
+
+class ValidityVerdict(ValidityAssessment):
+    """Pydantic model for fact-checking verdict."""
     source_count: int = Field(..., description="Number of sources found")
 
 
-def extract_core_claim(title: str, content: str, debate_proposition: str) -> str:
+async def extract_core_claim(title: str, content: str, debate_proposition: str) -> str:
     """
     STEP 1: Extract the core verifiable claim from an argument.
     
@@ -59,25 +149,7 @@ Return ONLY the core factual claim in 2 sentences or less. Remove all opinion, r
 If the argument contains no verifiable factual claims (only opinions, insults, emotional statements, or nonsensical text), return "NO VERIFIABLE FACTUAL CLAIMS"."""
 
     try:
-        # Check API limit before making call
-        if not database.check_api_limit("anthropic", API_CALL_LIMIT):
-            raise RuntimeError("Anthropic API call limit reached (750 calls). Please try again later.")
-        
-        message = claude_client.messages.create(
-            model=CLAUDE_MODEL,
-            max_tokens=200,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-        
-        # Increment counter after successful call
-        database.increment_api_call_count("anthropic")
-        
-        claim = message.content[0].text.strip()
+        claim = await llm_gateway.complete(prompt, model=CLAUDE_MODEL, max_tokens=200, hedge=True)
         logger.info(f"Extracted claim: '{claim}'")
         return claim
         
@@ -85,29 +157,91 @@ If the argument contains no verifiable factual claims (only opinions, insults, e
         raise RuntimeError(f"Failed to extract core claim: {str(e)}")
 
 
-def search_for_evidence(claim: str) -> List[Dict]:
+def _normalize_claim(claim: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return " ".join(re.sub(r"[^\w\s]", " ", claim.lower()).split())
+
+
+def claim_cache_keys(claim: str) -> tuple[str, str]:
+    """
+    Return (claim_key, signature) for a claim.
+    claim_key matches the exact normalized text; signature matches near-duplicates that
+    differ only in word order, punctuation or stopwords, but never in negation.
+    """
+    normalized = _normalize_claim(claim)
+    claim_key = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    tokens = sorted({
+        token for token in _normalize_claim(_NEGATED_CONTRACTION.sub(" not", claim)).split()
+        if token not in _SIGNATURE_STOPWORDS and len(token) > 1
+    })
+    signature = hashlib.sha256(f"{_SIGNATURE_VERSION}:{' '.join(tokens)}".encode("utf-8")).hexdigest()
+    return claim_key, signature
+
+
+def get_evidence_cache_stats() -> dict:
+    """Return evidence search cache counters for this worker."""
+    return {
+        "warm_topics": len(evidence_warm_sets),
+        "warm_hits": evidence_cache_warm_hits,
+        "db_hits": evidence_cache_db_hits,
+        "misses": evidence_cache_misses,
+    }
+
+
+async def search_for_evidence(claim: str, debate_proposition: Optional[str] = None) -> List[Dict]:
     """
     STEP 2: Search for evidence using Tavily API.
     
+    Results are cached by normalized claim text and near-duplicate signature
+    (per-topic warm set in memory, then the shared evidence_cache table), so
+    repeat claims skip Tavily entirely.
+    
     Args:
         claim: The extracted core claim to search for
+        debate_proposition: The debate proposition, used to scope the in-memory warm set
     
     Returns:
         List of search results from Tavily
     """
+    global evidence_cache_warm_hits, evidence_cache_db_hits, evidence_cache_misses
+    
+    claim_key, signature = claim_cache_keys(claim)
+    topic_key = _normalize_text(debate_proposition or "")
+    warm_set = evidence_warm_sets.get(topic_key)
+    if warm_set is None:
+        warm_set = TTLCache(max_entries=WARM_CLAIMS_PER_TOPIC, ttl_seconds=config.EVIDENCE_CACHE_TTL_SECONDS)
+        evidence_warm_sets.set(topic_key, warm_set)
+    
+    cached = warm_set.get(signature)
+    if cached is not None:
+        evidence_cache_warm_hits += 1
+        logger.info(f"Evidence warm-set hit for claim: '{claim}'")
+        return cached
+    
     try:
-        # Check API limit before making call
-        if not database.check_api_limit("tavily", API_CALL_LIMIT):
-            raise RuntimeError("Tavily API call limit reached (750 calls). Please try again later.")
-        
-        response = tavily_client.search(
-            query=claim,
-            max_results=10,
-            search_depth="advanced"
-        )
-        
-        # Increment counter after successful call
-        database.increment_api_call_count("tavily")
+        cached = await database.get_cached_evidence(claim_key, signature, config.EVIDENCE_CACHE_TTL_SECONDS)
+        if cached is not None:
+            evidence_cache_db_hits += 1
+            logger.info(f"Evidence cache hit for claim: '{claim}'")
+            warm_set.set(signature, cached)
+            return cached
+        
+        evidence_cache_misses += 1
+        
+        # Only searches that never reached Tavily (connection errors) are refunded to the quota
+        async with tavily_slots:
+            async with api_quota.reserve("tavily"):
+                http_response = await tavily_client.post(
+                    "/search",
+                    json={
+                        "api_key": config.TAVILY_API_KEY,
+                        "query": claim,
+                        "max_results": 10,
+                        "search_depth": "advanced"
+                    }
+                )
+            http_response.raise_for_status()
+        response = http_response.json()
         
         # Tavily returns results directly or in a 'results' key
         if isinstance(response, dict):
@@ -121,6 +255,8 @@ def search_for_evidence(claim: str) -> List[Dict]:
         if results:
             logger.info(f"First result title: '{results[0].get('title', 'N/A')}'")
         
+        await database.save_cached_evidence(claim_key, signature, results)
+        warm_set.set(signature, results)
         return results
         
     except Exception as e:
@@ -158,7 +294,7 @@ Content: {content}...
     return "\n".join(formatted)
 
 
-def analyze_and_score(original_claim: str, tavily_results: List[Dict], debate_proposition: str) -> ValidityVerdict:
+async def analyze_and_score(original_claim: str, tavily_results: List[Dict], debate_proposition: str) -> ValidityVerdict:
     """
     STEP 3: Analyze evidence and assign validity score.
     
@@ -181,228 +317,66 @@ def analyze_and_score(original_claim: str, tavily_results: List[Dict], debate_pr
         scores = [r.get('score', 0) for r in tavily_results]
         avg_score = sum(scores) / len(scores) if scores else 0.0
     
-    prompt = f"""You are fact-checking an argument in a debate about: {debate_proposition}
-
-FIRST, determine if this argument is RELEVANT to the debate topic.
-
-An argument is IRRELEVANT if it:
-- Contains no factual claims (only opinions like "this sucks" or "you guys are wrong")
-- Makes claims unrelated to the debate topic
-- Is just insults, rhetoric, or emotional statements
-- Contains nonsensical or random text with no meaning
-
-If IRRELEVANT:
-- Set is_relevant to false
-- Set validity_score to 1
-- Provide reasoning explaining why it's irrelevant. Be specific about what makes it irrelevant.
-
-If RELEVANT:
-- Set is_relevant to true
-- Verify whether the factual claims supporting their position are true
-- Score based on evidence quality (1-5 stars)
+    prompt = f"""DEBATE TOPIC:
+{debate_proposition}
 
 ORIGINAL CLAIM TO VERIFY:
 {original_claim}
 
-CRITICAL: Your reasoning must be about the ORIGINAL CLAIM above. Do NOT write reasoning about claims that are not in the ORIGINAL CLAIM. If the search results don't match the original claim, state that clearly.
-
 SEARCH RESULTS (pre-filtered for high-quality sources with relevance score > 0.5):
 {formatted_results}
 
-If RELEVANT, assign a validity score from 1-5 stars based on these criteria:
-
-- 5 stars: Fully supported by multiple high-quality sources (average relevance score > 0.8, at least 2-3 sources)
-- 4 stars: Mostly supported with good sources (average relevance score > 0.6, at least 2 sources)
-- 3 stars: Partially supported, mixed evidence (1-2 sources with moderate scores)
-- 2 stars: Limited support from few sources (only 1 source or low average score)
-- 1 star: No credible evidence, contradicted by sources
-
-IMPORTANT: These sources have already been filtered for quality (relevance score > 0.5). 
-If very few sources pass this threshold, the validity score should be lower.
-
-Consider BOTH the number of sources AND their quality (relevance scores).
-
 Average relevance score of sources: {avg_score:.3f}
-Number of high-quality sources found: {source_count}
-
-Return a JSON object with this exact structure. Make sure all strings are properly escaped:
-{{
-    "is_relevant": <boolean>,
-    "validity_score": <1-5>,
-    "reasoning": "<2-3 sentences explaining the score. Escape any quotes with backslash.>",
-    "key_urls": ["<url1>", "<url2>", "<url3>"]
-}}
-
-IMPORTANT: 
-- Return ONLY valid JSON, no markdown formatting or extra text
-- Escape all quotes in the reasoning field with backslashes
-- Include exactly 3 URLs or fewer from the search results above
-- Ensure all URLs are properly quoted and escaped"""
+Number of high-quality sources found: {source_count}"""
 
     try:
-        # Check API limit before making call
-        if not database.check_api_limit("anthropic", API_CALL_LIMIT):
-            raise RuntimeError("Anthropic API call limit reached (750 calls). Please try again later.")
-        
-        message = claude_client.messages.create(
+        assessment = await llm_gateway.structured(
+            prompt,
+            ValidityAssessment,
             model=CLAUDE_MODEL,
             max_tokens=1000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            tool_name="record_verdict",
+            tool_description="Record the fact-checking verdict for the claim.",
+            hedge=True,
+            system=SCORING_RUBRIC
         )
+        return ValidityVerdict(**assessment.model_dump(), source_count=source_count)
         
-        # Increment counter after successful call
-        database.increment_api_call_count("anthropic")
-        
-        response_text = message.content[0].text.strip()
-        
-        # Extract JSON from response - handle multiple formats
-        json_text = None
-        
-        # Try to find JSON in code blocks first
-        json_block_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-        if json_block_match:
-            json_text = json_block_match.group(1)
-        else:
-            # Try to find JSON object by matching braces
-            # Find the first { and match to the last }
-            start_idx = response_text.find('{')
-            if start_idx != -1:
-                brace_count = 0
-                end_idx = start_idx
-                for i in range(start_idx, len(response_text)):
-                    if response_text[i] == '{':
-                        brace_count += 1
-                    elif response_text[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            end_idx = i + 1
-                            break
-                if end_idx > start_idx:
-                    json_text = response_text[start_idx:end_idx]
-            else:
-                # Fallback: use entire response
-                json_text = response_text
-        
-        # Clean up the JSON text
-        if json_text:
-            json_text = json_text.strip()
-        
-        # Parse JSON with error handling
-        result = None
-        try:
-            result = json.loads(json_text)
-        except json.JSONDecodeError:
-            # If JSON parsing fails, extract fields manually using regex
-            # This handles cases where Claude returns malformed JSON (e.g., unescaped quotes)
-            
-            # Extract is_relevant (boolean)
-            is_relevant_match = re.search(r'"is_relevant"\s*:\s*(true|false)', json_text, re.IGNORECASE)
-            is_relevant = is_relevant_match.group(1).lower() == 'true' if is_relevant_match else True  # Default to True if not found
-            
-            validity_match = re.search(r'"validity_score"\s*:\s*(\d+)', json_text)
-            
-            validity_score = int(validity_match.group(1)) if validity_match else 3
-            if validity_score < 1 or validity_score > 5:
-                validity_score = 3
-            
-            # Extract reasoning - handle unescaped quotes by finding the field value manually
-            reasoning = "Unable to parse reasoning from response"
-            reasoning_start = json_text.find('"reasoning"')
-            if reasoning_start != -1:
-                # Find the colon after "reasoning"
-                colon_pos = json_text.find(':', reasoning_start)
-                if colon_pos != -1:
-                    # Find the opening quote
-                    quote_start = json_text.find('"', colon_pos)
-                    if quote_start != -1:
-                        # Parse character by character to find the closing quote
-                        # Skip escaped quotes
-                        i = quote_start + 1
-                        reasoning_end = -1
-                        while i < len(json_text):
-                            if json_text[i] == '\\' and i + 1 < len(json_text):
-                                i += 2  # Skip escaped character
-                                continue
-                            elif json_text[i] == '"':
-                                # Check if this is followed by comma or closing brace
-                                j = i + 1
-                                while j < len(json_text) and json_text[j] in ' \t\n\r':
-                                    j += 1
-                                if j < len(json_text) and json_text[j] in ',}':
-                                    reasoning_end = i
-                                    break
-                            i += 1
-                        
-                        if reasoning_end > quote_start:
-                            reasoning = json_text[quote_start + 1:reasoning_end]
-                            # Unescape common escape sequences
-                            reasoning = reasoning.replace('\\"', '"').replace('\\n', '\n').replace('\\t', '\t').replace('\\\\', '\\')
-            
-            # Extract URLs from the array
-            urls_match = re.search(r'"key_urls"\s*:\s*\[(.*?)\]', json_text, re.DOTALL)
-            key_urls = []
-            if urls_match:
-                urls_text = urls_match.group(1)
-                # Extract URLs, handling escaped quotes
-                url_matches = re.findall(r'"((?:[^"\\]|\\.)*)"', urls_text)
-                key_urls = [url.replace('\\"', '"').replace('\\\\', '\\') for url in url_matches if url][:3]
-            
-            result = {
-                'is_relevant': is_relevant,
-                'validity_score': validity_score,
-                'reasoning': reasoning,
-                'key_urls': key_urls
-            }
-        
-        # Validate and create verdict
-        is_relevant = result.get('is_relevant', True)
-        if not isinstance(is_relevant, bool):
-            is_relevant = str(is_relevant).lower() in ('true', '1', 'yes')
-        
-        validity_score = int(result.get('validity_score', 3))
-        if validity_score < 1 or validity_score > 5:
-            validity_score = 3  # Default to middle score if invalid
-        
-        # Ensure key_urls is a list and limit to 3
-        key_urls = result.get('key_urls', [])
-        if isinstance(key_urls, str):
-            key_urls = [key_urls]
-        elif not isinstance(key_urls, list):
-            key_urls = []
-        # Filter out empty strings and limit to 3
-        key_urls = [url for url in key_urls if url and isinstance(url, str)][:3]
-        
-        # Clean reasoning text
-        reasoning = result.get('reasoning', 'No reasoning provided')
-        if isinstance(reasoning, str):
-            # Remove any extra quotes or formatting
-            reasoning = reasoning.strip().strip('"').strip("'")
-        
-        verdict = ValidityVerdict(
-            is_relevant=is_relevant,
-            validity_score=validity_score,
-            reasoning=reasoning,
-            key_urls=key_urls,
-            source_count=source_count
-        )
-        
-        return verdict
-        
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse JSON from Claude response: {e}")
     except Exception as e:
         raise RuntimeError(f"Failed to analyze and score: {str(e)}")
 
 
-def verify_argument(title: str, content: str, debate_proposition: str) -> ValidityVerdict:
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace and case so cosmetic edits map to the same cache key."""
+    return " ".join(text.split()).lower()
+
+
+def verdict_cache_key(title: str, content: str, debate_proposition: str) -> str:
+    """Content-addressed cache key for a verdict: hash of the normalized inputs plus pipeline version."""
+    normalized = json.dumps([
+        PIPELINE_VERSION,
+        _normalize_text(title),
+        _normalize_text(content),
+        _normalize_text(debate_proposition)
+    ])
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def get_verdict_cache_stats() -> dict:
+    """Return verdict cache hit/miss counters for this worker."""
+    stats = verdict_cache.stats()
+    stats["db_hits"] = verdict_cache_db_hits
+    return stats
+
+
+async def verify_argument(title: str, content: str, debate_proposition: str) -> ValidityVerdict:
     """
     Main pipeline function that chains all 3 steps together.
     
+    Verdicts are cached by content hash (in process, then in Postgres), so identical
+    inputs are only fact-checked once per TTL. Failed runs are never cached.
+    Concurrent calls for the same content are coalesced into a single run.
+    
     Args:
         title: Argument title
         content: Argument content
@@ -413,52 +387,27 @@ def verify_argument(title: str, content: str, debate_proposition: str) -> Validi
     """
     logger.info(f"verify_argument called with - Title: '{title}', Content: '{content}', Proposition: '{debate_proposition}'")
     
+    cache_key = verdict_cache_key(title, content, debate_proposition)
+    cached = verdict_cache.get(cache_key)
+    if cached is not None:
+        return cached.model_copy()
+    
+    async def compute() -> dict:
+        global verdict_cache_db_hits
+        cached_row = await database.get_cached_verdict(cache_key, config.VERDICT_CACHE_TTL_SECONDS)
+        if cached_row is not None:
+            verdict_cache_db_hits += 1
+            return cached_row
+        
+        verdict = await _run_verification_pipeline(title, content, debate_proposition)
+        await database.save_cached_verdict(cache_key, verdict.model_dump())
+        return verdict.model_dump()
+    
     try:
-        # Step 1: Extract core claim
-        claim = extract_core_claim(title, content, debate_proposition)
-        
-        # If no verifiable claims found, return irrelevant verdict
-        if claim.upper() == "NO VERIFIABLE FACTUAL CLAIMS" or not claim.strip():
-            return ValidityVerdict(
-                is_relevant=False,
-                validity_score=1,
-                reasoning=f"This argument contains no verifiable factual claims related to the debate proposition: '{debate_proposition}'. It consists only of opinions, rhetoric, or emotional statements that cannot be fact-checked.",
-                key_urls=[],
-                source_count=0
-            )
-        
-        # Step 2: Search for evidence
-        all_search_results = search_for_evidence(claim)
-        
-        # Filter for high-quality sources only (score > 0.5)
-        filtered_results = [
-            r for r in all_search_results 
-            if r.get('score', 0) > 0.5
-        ]
-        
-        top_sources = filtered_results[:3]
-        
-        # If no sources pass the threshold, return low validity score (but still relevant if it has claims)
-        if not top_sources:
-            return ValidityVerdict(
-                is_relevant=True,  # Still relevant, just can't verify
-                validity_score=1,
-                reasoning="No high-quality sources found (all sources had relevance score ≤ 0.5). The claim cannot be verified with credible evidence.",
-                key_urls=[],
-                source_count=len(all_search_results)
-            )
-        
-        # Step 3: Analyze and score using only filtered high-quality sources
-        verdict = analyze_and_score(claim, top_sources, debate_proposition)
-        
-        # Extract URLs from top sources for key_urls (only high-quality sources with score > 0.5)
-        key_urls = [source.get('url', '') for source in top_sources if source.get('url')]
-        verdict.key_urls = key_urls[:3]  # Ensure max 3 URLs
-        
-        # Update source_count to reflect total sources found (before filtering)
-        verdict.source_count = len(all_search_results)
-        
-        return verdict
+        # Concurrent checks of the same argument (in any worker) share one pipeline run
+        verdict = ValidityVerdict(**await single_flight("verify_argument", cache_key, compute))
+        verdict_cache.set(cache_key, verdict)
+        return verdict.model_copy()
         
     except Exception as e:
         # Return a default verdict on error
@@ -470,3 +419,51 @@ def verify_argument(title: str, content: str, debate_proposition: str) -> Validi
             source_count=0
         )
 
+
+async def _run_verification_pipeline(title: str, content: str, debate_proposition: str) -> ValidityVerdict:
+    """Run extract -> search -> score without caching. Raises on failure."""
+    # Step 1: Extract core claim
+    claim = await extract_core_claim(title, content, debate_proposition)
+    
+    # If no verifiable claims found, return irrelevant verdict
+    if claim.upper() == "NO VERIFIABLE FACTUAL CLAIMS" or not claim.strip():
+        return ValidityVerdict(
+            is_relevant=False,
+            validity_score=1,
+            reasoning=f"This argument contains no verifiable factual claims related to the debate proposition: '{debate_proposition}'. It consists only of opinions, rhetoric, or emotional statements that cannot be fact-checked.",
+            key_urls=[],
+            source_count=0
+        )
+    
+    # Step 2: Search for evidence
+    all_search_results = await search_for_evidence(claim, debate_proposition)
+    
+    # Filter for high-quality sources only (score > 0.5)
+    filtered_results = [
+        r for r in all_search_results 
+        if r.get('score', 0) > 0.5
+    ]
+    
+    top_sources = filtered_results[:3]
+    
+    # If no sources pass the threshold, return low validity score (but still relevant if it has claims)
+    if not top_sources:
+        return ValidityVerdict(
+            is_relevant=True,  # Still relevant, just can't verify
+            validity_score=1,
+            reasoning="No high-quality sources found (all sources had relevance score ≤ 0.5). The claim cannot be verified with credible evidence.",
+            key_urls=[],
+            source_count=len(all_search_results)
+        )
+    
+    # Step 3: Analyze and score using only filtered high-quality sources
+    verdict = await analyze_and_score(claim, top_sources, debate_proposition)
+    
+    # Extract URLs from top sources for key_urls (only high-quality sources with score > 0.5)
+    key_urls = [source.get('url', '') for source in top_sources if source.get('url')]
+    verdict.key_urls = key_urls[:3]  # Ensure max 3 URLs
+    
+    # Update source_count to reflect total sources found (before filtering)
+    verdict.source_count = len(all_search_results)
+    
+    return verdict
@@ -0,0 +1,444 @@
+"""
+Single gateway for every Claude call.
+
+Owns one AsyncAnthropic client (and so one pooled set of HTTP connections) per
+process and wraps each request with:
+- the global API quota (api_quota) and the per-process ANTHROPIC_MAX_CONCURRENCY budget
+- a total deadline (LLM_DEADLINE_SECONDS) on top of the per-attempt LLM_TIMEOUT_SECONDS
+- jittered exponential backoff retries on 429, 5xx and connection errors,
+  honouring Retry-After when the API sends one
+- optional hedging: with LLM_HEDGE_AFTER_SECONDS set, a call made with hedge=True
+  sends a duplicate request if the first hasn't answered in time and uses
+  whichever finishes first
+- structured output: structured() forces a tool call whose input schema is a
+  Pydantic model and validates the reply straight into that model, with one
+  shared fallback parser for replies that come back as text
+- streaming: stream_tool_input() yields a forced tool call's JSON as it is
+  generated (no retries or hedging once a stream has started)
+- prompt caching: a static_prefix is sent as a system block marked with
+  cache_control, so repeated calls only pay full price for the dynamic suffix
+  (only worth it when system + tools reach the model's minimum cacheable
+  length: 1024 tokens for Sonnet/Opus, 2048 for Haiku)
+- per-model latency, token (uncached / cache write / cache read), retry and
+  hedge metrics (get_llm_stats)
+"""
+
+import asyncio
+import logging
+import random
+import re
+from collections import deque
+from typing import Any, AsyncIterator, Optional, TypeVar
+import httpx
+from anthropic import AsyncAnthropic, APIConnectionError, APIStatusError
+from pydantic import BaseModel
+import api_quota
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single backoff delay
+MAX_RETRY_DELAY_SECONDS = 10.0
+
+# Recent latencies kept per model for percentile metrics
+LATENCY_SAMPLES = 512
+
+client = AsyncAnthropic(
+    api_key=config.ANTHROPIC_API_KEY,
+    timeout=config.LLM_TIMEOUT_SECONDS,
+    max_retries=0,  # retries are handled here so they respect the deadline
+    http_client=httpx.AsyncClient(
+        timeout=config.LLM_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=config.ANTHROPIC_MAX_CONCURRENCY * 2,  # room for hedged requests
+            max_keepalive_connections=config.ANTHROPIC_MAX_CONCURRENCY
+        )
+    )
+)
+
+# Per-process concurrency budget so parallel callers stay within provider rate limits
+anthropic_slots = asyncio.Semaphore(config.ANTHROPIC_MAX_CONCURRENCY)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class StructuredOutputError(ValueError):
+    """Raised when a reply can't be validated against the requested schema."""
+
+
+class _ModelStats:
+    """Counters for one model."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.input_tokens = 0  # uncached input tokens
+        self.cache_creation_input_tokens = 0
+        self.cache_read_input_tokens = 0
+        self.output_tokens = 0
+        self.cache_hits = 0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.cached_latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.first_token_latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)  # streamed calls only
+
+    def as_dict(self) -> dict:
+        def percentile(samples: deque, fraction: float) -> Optional[float]:
+            if not samples:
+                return None
+            ordered = sorted(samples)
+            return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "input_tokens": self.input_tokens,
+            "cache_creation_input_tokens": self.cache_creation_input_tokens,
+            "cache_read_input_tokens": self.cache_read_input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_hits": self.cache_hits,
+            "latency_p50_seconds": percentile(self.latencies, 0.5),
+            "latency_p95_seconds": percentile(self.latencies, 0.95),
+            # Calls that read their prompt prefix from the cache, for comparison
+            "cached_latency_p50_seconds": percentile(self.cached_latencies, 0.5),
+            "cached_latency_p95_seconds": percentile(self.cached_latencies, 0.95),
+            "first_token_p50_seconds": percentile(self.first_token_latencies, 0.5),
+            "first_token_p95_seconds": percentile(self.first_token_latencies, 0.95),
+        }
+
+
+_stats: dict[str, _ModelStats] = {}
+
+
+def _model_stats(model: str) -> _ModelStats:
+    stats = _stats.get(model)
+    if stats is None:
+        stats = _stats[model] = _ModelStats()
+    return stats
+
+
+def get_llm_stats() -> dict:
+    """Return per-model call, latency and token metrics for this process."""
+    return {model: stats.as_dict() for model, stats in _stats.items()}
+
+
+# tool name -> {"calls", "fallbacks", "failures"}
+_structured_stats: dict[str, dict[str, int]] = {}
+
+
+def get_structured_output_stats() -> dict:
+    """Return per-tool structured output counts, including fallback and failure rates."""
+    return {
+        tool_name: {
+            **counts,
+            "fallback_rate": round(counts["fallbacks"] / counts["calls"], 4) if counts["calls"] else 0.0,
+            "failure_rate": round(counts["failures"] / counts["calls"], 4) if counts["calls"] else 0.0,
+        }
+        for tool_name, counts in _structured_stats.items()
+    }
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, APIConnectionError)
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """Full-jitter exponential backoff, or the server's Retry-After if it sent one."""
+    if isinstance(error, APIStatusError):
+        retry_after = error.response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_RETRY_DELAY_SECONDS)
+            except ValueError:
+                pass
+    return random.uniform(0, min(MAX_RETRY_DELAY_SECONDS, config.LLM_RETRY_BASE_SECONDS * 2 ** attempt))
+
+
+def _record_call(stats: _ModelStats, latency: float, usage: Any, output_tokens: Optional[int] = None):
+    """Count a completed call's latency and token usage."""
+    stats.calls += 1
+    stats.latencies.append(latency)
+    if usage is None:
+        return
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    stats.input_tokens += usage.input_tokens or 0
+    stats.cache_creation_input_tokens += getattr(usage, "cache_creation_input_tokens", None) or 0
+    stats.cache_read_input_tokens += cache_read
+    stats.output_tokens += output_tokens if output_tokens is not None else (usage.output_tokens or 0)
+    if cache_read:
+        stats.cache_hits += 1
+        stats.cached_latencies.append(latency)
+
+
+async def _send(request: dict, timeout: float):
+    """One Claude request, counted against the quota and the concurrency budget."""
+    # Take the slot first: a hedge cancelled while queued for a slot never touches the quota
+    async with anthropic_slots, api_quota.reserve("anthropic"):
+        return await client.messages.create(**request, timeout=timeout)
+
+
+async def _send_hedged(request: dict, timeout: float, stats: _ModelStats):
+    """Send a request; if it is still running after LLM_HEDGE_AFTER_SECONDS, race a duplicate."""
+    primary = asyncio.create_task(_send(request, timeout))
+    pending = {primary}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=config.LLM_HEDGE_AFTER_SECONDS)
+        if done:
+            return primary.result()
+
+        stats.hedges += 1
+        backup = asyncio.create_task(_send(request, timeout))
+        pending.add(backup)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is backup:
+                        stats.hedge_wins += 1
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        # The losing request (or both, if we were cancelled) is abandoned
+        for task in pending:
+            task.cancel()
+
+
+async def create_message(
+    model: str,
+    max_tokens: int,
+    messages: list[dict],
+    hedge: bool = False,
+    deadline_seconds: Optional[float] = None,
+    **params: Any
+):
+    """
+    Call messages.create through the gateway and return the Message.
+    Extra keyword arguments (system, temperature, ...) are passed through.
+    Raises the last API error once retries or the deadline are exhausted, and
+    api_quota.QuotaExceededError when the global limit has been reached.
+    """
+    stats = _model_stats(model)
+    request = {"model": model, "max_tokens": max_tokens, "messages": messages, **params}
+    hedged = hedge and config.LLM_HEDGE_AFTER_SECONDS > 0
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + (deadline_seconds or config.LLM_DEADLINE_SECONDS)
+    attempt = 0
+    while True:
+        remaining = deadline - loop.time()
+        timeout = min(config.LLM_TIMEOUT_SECONDS, remaining)
+        try:
+            if timeout <= 0:
+                raise asyncio.TimeoutError()
+            send = _send_hedged(request, timeout, stats) if hedged else _send(request, timeout)
+            message = await asyncio.wait_for(send, remaining)
+            break
+        except Exception as e:
+            delay = _retry_delay(attempt, e) if _is_retryable(e) else None
+            if delay is None or attempt >= config.LLM_MAX_RETRIES or loop.time() + delay >= deadline:
+                stats.errors += 1
+                raise
+            attempt += 1
+            stats.retries += 1
+            logger.warning(f"Claude {model} call failed ({e}); retry {attempt} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    _record_call(stats, loop.time() - started, getattr(message, "usage", None))
+    return message
+
+
+def cached_system(static_prefix: str) -> list[dict]:
+    """System blocks for a static prompt prefix, marked for provider-side caching."""
+    return [{"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}}]
+
+
+async def complete(
+    prompt: str,
+    model: str,
+    max_tokens: int,
+    hedge: bool = False,
+    static_prefix: Optional[str] = None,
+    **params: Any
+) -> str:
+    """
+    Send a single user prompt and return the stripped text of the reply.
+    static_prefix (instructions identical across calls) is sent ahead of the prompt
+    as a cached system block; keep everything request-specific in prompt.
+    """
+    if static_prefix:
+        params["system"] = cached_system(static_prefix)
+    message = await create_message(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}],
+        hedge=hedge,
+        **params
+    )
+    return message.content[0].text.strip()
+
+
+_FENCED_JSON = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
+
+def extract_json_text(text: str) -> str:
+    """
+    Pull the JSON document out of a model reply: the contents of a ```json fence if
+    present, otherwise the first balanced {...} object, otherwise the whole text.
+    """
+    fenced = _FENCED_JSON.search(text)
+    if fenced:
+        return fenced.group(1).strip()
+
+    start = text.find('{')
+    if start == -1:
+        return text.strip()
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == '{':
+            depth += 1
+        elif text[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return text[start:].strip()
+
+
+async def stream_tool_input(
+    prompt: str,
+    schema: type[BaseModel],
+    model: str,
+    max_tokens: int,
+    tool_name: str,
+    tool_description: str,
+    static_prefix: Optional[str] = None,
+    **params: Any
+) -> AsyncIterator[str]:
+    """
+    Like structured(), but stream the reply: yield the tool input's JSON text in
+    fragments as Claude generates it. Decoding and validation are left to the caller.
+    """
+    if static_prefix:
+        params["system"] = cached_system(static_prefix)
+    request = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "messages": [{"role": "user", "content": prompt}],
+        "tools": [{"name": tool_name, "description": tool_description, "input_schema": tool_input_schema(schema)}],
+        "tool_choice": {"type": "tool", "name": tool_name},
+        "stream": True,
+        **params
+    }
+    stats = _model_stats(model)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    first_token_at: Optional[float] = None
+    usage = None
+    output_tokens = None
+    try:
+        async with anthropic_slots, api_quota.reserve("anthropic"):
+            # Closing the stream releases the connection if the consumer stops early
+            async with await client.messages.create(**request, timeout=config.LLM_TIMEOUT_SECONDS) as stream:
+                async for event in stream:
+                    if event.type == "message_start":
+                        usage = event.message.usage
+                    elif event.type == "message_delta":
+                        output_tokens = event.usage.output_tokens
+                    elif event.type == "content_block_delta" and event.delta.type == "input_json_delta":
+                        if first_token_at is None:
+                            first_token_at = loop.time()
+                            stats.first_token_latencies.append(first_token_at - started)
+                        yield event.delta.partial_json
+    except Exception:
+        stats.errors += 1
+        raise
+    _record_call(stats, loop.time() - started, usage, output_tokens)
+
+
+def parse_structured_text(text: str, schema: type[ModelT]) -> ModelT:
+    """Fallback parser: validate the JSON document in a text reply against schema."""
+    return schema.model_validate_json(extract_json_text(text))
+
+
+_tool_schemas: dict[type, dict] = {}
+
+
+def tool_input_schema(schema: type[BaseModel]) -> dict:
+    """JSON schema for a Pydantic model with $defs references inlined."""
+    cached = _tool_schemas.get(schema)
+    if cached is not None:
+        return cached
+
+    json_schema = schema.model_json_schema()
+    definitions = json_schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    cached = _tool_schemas[schema] = inline(json_schema)
+    return cached
+
+
+async def structured(
+    prompt: str,
+    schema: type[ModelT],
+    model: str,
+    max_tokens: int,
+    tool_name: str,
+    tool_description: str,
+    hedge: bool = False,
+    static_prefix: Optional[str] = None,
+    **params: Any
+) -> ModelT:
+    """
+    Send a single user prompt and have Claude answer by calling a tool whose input
+    schema is `schema`; return the tool input validated into that model.
+    Raises StructuredOutputError if neither the tool call nor a text reply validates.
+    """
+    if static_prefix:
+        params["system"] = cached_system(static_prefix)
+    message = await create_message(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}],
+        hedge=hedge,
+        tools=[{"name": tool_name, "description": tool_description, "input_schema": tool_input_schema(schema)}],
+        tool_choice={"type": "tool", "name": tool_name},
+        **params
+    )
+
+    counts = _structured_stats.setdefault(tool_name, {"calls": 0, "fallbacks": 0, "failures": 0})
+    counts["calls"] += 1
+    error: Optional[Exception] = None
+    for block in message.content:
+        if block.type == "tool_use" and block.name == tool_name:
+            try:
+                return schema.model_validate(block.input)
+            except ValueError as e:
+                error = e
+            break
+
+    # No usable tool call; accept a JSON answer given as text instead
+    counts["fallbacks"] += 1
+    text = "".join(block.text for block in message.content if block.type == "text")
+    try:
+        return parse_structured_text(text, schema)
+    except ValueError as e:
+        counts["failures"] += 1
+        raise StructuredOutputError(f"{tool_name} reply did not match {schema.__name__}: {error or e}")
@@ -1,9 +1,18 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 import database
-from routes import topics, arguments, summaries, fact_checking, voting, auth
+import fact_checker
+import migrations
+import api_quota
+import llm_gateway
+import vote_buffer
+from routes import topics, arguments, summaries, fact_checking, voting, auth, jobs
+from utils.single_flight import get_single_flight_stats
+from middleware.auth import get_token_cache_stats
+from utils.user import get_profile_cache_stats
 import logging
 import os
 
@@ -14,17 +23,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize database
-database.init_db()
-# Run migration to add validity columns
-database.migrate_add_validity_columns()
-# Run migration to add votes column
-database.migrate_add_votes_column()
-# Reset all vote counts to 0 (disregard seeded baseline votes)
-database.migrate_reset_vote_counts()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the database pool on startup and close it on shutdown.
+    Schema migrations are applied separately with `python migrations.py`.
+    """
+    await database.open_pool()
+    pending = await migrations.get_pending_migrations()
+    if pending:
+        logger.warning(
+            f"Database schema is behind by {len(pending)} migration(s) "
+            f"({', '.join(name for _, name in pending)}); run `python migrations.py`"
+        )
+    # Start flushing buffered vote counters (no-op unless VOTE_BUFFER_ENABLED)
+    vote_buffer.start()
+    yield
+    await vote_buffer.stop()
+    await api_quota.stop()
+    await database.close_pool()
 
 # Create FastAPI app
-app = FastAPI(title="Debately API", version="1.0.0")
+app = FastAPI(title="Debately API", version="1.0.0", lifespan=lifespan)
 
 # Import HTTPException for exception handlers
 from fastapi import HTTPException
@@ -107,6 +127,7 @@ app.include_router(arguments.router)
 app.include_router(summaries.router)
 app.include_router(fact_checking.router)
 app.include_router(voting.router)
+app.include_router(jobs.router)
 
 @app.get("/")
 async def root():
@@ -119,9 +140,9 @@ async def health_check():
     from config import config, verify_config_integrity
     
     try:
-        # Check database connection
-        conn = database.get_db_connection()
-        conn.close()
+        # Check database connection (checked out from the shared pool)
+        async with database.get_cursor() as cursor:
+            await cursor.execute("SELECT 1")
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -146,6 +167,22 @@ async def health_check():
             }
         )
 
+@app.get("/metrics")
+async def metrics():
+    """Operational metrics for monitoring dashboards."""
+    return {
+        "db_pool": database.get_pool_stats(),
+        "verdict_cache": fact_checker.get_verdict_cache_stats(),
+        "evidence_cache": fact_checker.get_evidence_cache_stats(),
+        "single_flight": get_single_flight_stats(),
+        "auth_token_cache": get_token_cache_stats(),
+        "profile_cache": get_profile_cache_stats(),
+        "vote_buffer": vote_buffer.get_vote_buffer_stats(),
+        "api_quota": api_quota.get_api_quota_stats(),
+        "llm": llm_gateway.get_llm_stats(),
+        "structured_output": llm_gateway.get_structured_output_stats(),
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -3,14 +3,18 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 from uuid import UUID
 from supabase import create_client, Client
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwt
+import anyio
+import hashlib
 import httpx
+import time
 import sys
 from pathlib import Path
 
 # Add parent directory to path for config import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import config
+from utils.cache import TTLCache
 
 # Security scheme
 security = HTTPBearer()
@@ -18,19 +22,122 @@ security = HTTPBearer()
 # Supabase configuration from immutable config
 SUPABASE_URL = config.SUPABASE_URL
 SUPABASE_ANON_KEY = config.SUPABASE_ANON_KEY
+SUPABASE_JWT_SECRET = config.SUPABASE_JWT_SECRET
+
+# Supabase signs user access tokens for this audience
+JWT_AUDIENCE = "authenticated"
+
+# Accepted signing algorithms, fixed per key type (never taken from the token header)
+SHARED_SECRET_ALGORITHMS = ["HS256"]
+JWKS_ALGORITHMS = ["RS256", "ES256"]
+
+# Claims a token must carry; python-jose only checks aud when it is present unless required
+REQUIRED_CLAIMS_OPTIONS = {"require_aud": True, "require_exp": True, "require_sub": True}
+
+# Asymmetric signing keys published by Supabase, refreshed at most this often
+JWKS_REFRESH_SECONDS = 600
+
+# Verified tokens, keyed by SHA-256 of the token; entries never outlive the token's exp
+token_cache = TTLCache(
+    max_entries=config.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.AUTH_TOKEN_CACHE_TTL_SECONDS
+)
+local_verifications = 0
+remote_verifications = 0
+
+_jwks: dict = {}
+_jwks_fetched_at: Optional[float] = None
+_supabase_client: Optional[Client] = None
+
 
 def get_supabase_client() -> Optional[Client]:
-    """Get Supabase client for token verification."""
+    """Get the shared Supabase client for remote token verification."""
+    global _supabase_client
     if not SUPABASE_URL or not SUPABASE_ANON_KEY:
         return None
-    return create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+    if _supabase_client is None:
+        _supabase_client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+    return _supabase_client
+
+
+def get_token_cache_stats() -> dict:
+    """Return token cache size and hit/miss counters plus how tokens were verified."""
+    return {
+        **token_cache.stats(),
+        "local_verifications": local_verifications,
+        "remote_verifications": remote_verifications,
+    }
+
+
+async def _get_signing_key(kid: Optional[str]) -> Optional[dict]:
+    """Look up a Supabase JWKS signing key by kid, refetching the key set when it is unknown."""
+    global _jwks, _jwks_fetched_at
+    if kid in _jwks:
+        return _jwks[kid]
+    if not SUPABASE_URL:
+        return None
+    if _jwks_fetched_at is not None and time.monotonic() - _jwks_fetched_at < JWKS_REFRESH_SECONDS:
+        return None
+
+    _jwks_fetched_at = time.monotonic()
+    async with httpx.AsyncClient(timeout=10) as client:
+        response = await client.get(f"{SUPABASE_URL}/auth/v1/.well-known/jwks.json")
+        response.raise_for_status()
+    _jwks = {key['kid']: key for key in response.json().get('keys', []) if 'kid' in key}
+    return _jwks.get(kid)
+
+
+async def _verify_locally(token: str) -> Optional[dict]:
+    """
+    Check the token's signature, expiry, audience and subject without a network hop.
+    Returns the claims, or None if no local key is available for this token.
+    Raises JWTError if the token is invalid or lacks a required claim.
+    """
+    header = jwt.get_unverified_header(token)
+    # The header only picks which key to try; the allowed algorithms come from the key type
+    if header.get('alg') in SHARED_SECRET_ALGORITHMS:
+        key, algorithms = SUPABASE_JWT_SECRET, SHARED_SECRET_ALGORITHMS
+    else:
+        key, algorithms = await _get_signing_key(header.get('kid')), JWKS_ALGORITHMS
+    if not key:
+        return None
+    return jwt.decode(token, key, algorithms=algorithms, audience=JWT_AUDIENCE, options=REQUIRED_CLAIMS_OPTIONS)
+
+
+async def _verify_remotely(token: str) -> dict:
+    """Verify the token by asking Supabase for its user (one network round trip)."""
+    supabase = get_supabase_client()
+    if not supabase:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to initialize Supabase client"
+        )
+
+    # The Supabase client is synchronous; keep it off the event loop
+    response = await anyio.to_thread.run_sync(supabase.auth.get_user, token)
+    if not response.user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication token"
+        )
+    return {
+        'user_id': response.user.id,
+        'email': response.user.email,
+        'user_metadata': response.user.user_metadata or {}
+    }
+
 
 async def verify_token(token: str) -> dict:
     """
     Verify Supabase JWT token and return the decoded payload.
+    Tokens are verified locally with SUPABASE_JWT_SECRET (or Supabase's published
+    signing keys) and cached until they expire. Supabase is only called when
+    AUTH_REMOTE_FALLBACK is enabled and the token can't be verified locally.
     """
-    if not SUPABASE_URL or not SUPABASE_ANON_KEY:
-        missing = []
+    global local_verifications, remote_verifications
+
+    if not SUPABASE_JWT_SECRET and not (SUPABASE_URL and SUPABASE_ANON_KEY):
+        missing = ["SUPABASE_JWT_SECRET"]
         if not SUPABASE_URL:
             missing.append("SUPABASE_URL")
         if not SUPABASE_ANON_KEY:
@@ -39,38 +146,57 @@ async def verify_token(token: str) -> dict:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Supabase configuration missing: {', '.join(missing)}. Please add these environment variables to your backend/.env file. See SUPABASE_AUTH_SETUP.md for instructions."
         )
-    
+
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached = token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Use Supabase client to verify the token
-        supabase = get_supabase_client()
-        if not supabase:
+        claims = await _verify_locally(token)
+    except ExpiredSignatureError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication token has expired"
+        )
+    except (JWTError, httpx.HTTPError) as e:
+        if not config.AUTH_REMOTE_FALLBACK:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Token verification failed: {str(e)}"
+            )
+        claims = None
+
+    if claims is not None:
+        local_verifications += 1
+        user_data = {
+            'user_id': claims['sub'],
+            'email': claims.get('email'),
+            'user_metadata': claims.get('user_metadata') or {}
+        }
+        ttl = min(config.AUTH_TOKEN_CACHE_TTL_SECONDS, claims['exp'] - time.time())
+    else:
+        if not config.AUTH_REMOTE_FALLBACK:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to initialize Supabase client"
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token verification failed: no signing key available for this token"
             )
-        
-        # Verify token by getting user
-        response = supabase.auth.get_user(token)
-        
-        if not response.user:
+        try:
+            user_data = await _verify_remotely(token)
+        except Exception as e:
+            if isinstance(e, HTTPException):
+                raise
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication token"
+                detail=f"Token verification failed: {str(e)}"
             )
-        
-        # Return user data
-        return {
-            'user_id': response.user.id,
-            'email': response.user.email,
-            'user_metadata': response.user.user_metadata or {}
-        }
-    except Exception as e:
-        if isinstance(e, HTTPException):
-            raise
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Token verification failed: {str(e)}"
-        )
+        remote_verifications += 1
+        expires_at = jwt.get_unverified_claims(token).get('exp', 0)
+        ttl = min(config.AUTH_TOKEN_CACHE_TTL_SECONDS, expires_at - time.time())
+
+    if ttl > 0:
+        token_cache.set(cache_key, user_data, ttl_seconds=ttl)
+    return user_data
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -99,7 +225,3 @@ async def get_current_user_optional(
         return user_data
     except HTTPException:
         return None
-
-
-
-
@@ -0,0 +1,149 @@
+"""
+Versioned schema migrations for Debately.
+
+Each migration runs once per database, in version order, and is recorded in the
+`schema_version` table. A Postgres advisory lock makes sure only one process
+migrates at a time; everyone else waits and then finds nothing left to do.
+Every step is written to be idempotent, so a run interrupted between applying a
+step and recording it is safe to repeat.
+
+Run before starting the app (the Docker image does this automatically):
+    python migrations.py           # apply pending migrations
+    python migrations.py --status  # list applied and pending migrations
+
+To add a migration, write an idempotent async function in database.py and
+append it to MIGRATIONS with the next version number. Never renumber or
+remove existing entries.
+"""
+
+import argparse
+import asyncio
+import logging
+from psycopg import AsyncConnection
+import database
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Arbitrary application-wide key for pg_advisory_lock
+MIGRATION_LOCK_ID = 727_401_001
+
+# (version, name, migration) in the order they must be applied
+MIGRATIONS = [
+    (1, "initial schema", database.init_db),
+    (2, "argument validity columns", database.migrate_add_validity_columns),
+    (3, "argument vote counter column", database.migrate_add_votes_column),
+    (4, "argument matches table", database.migrate_create_argument_matches_table),
+    (5, "topic listing indexes", database.migrate_create_topic_listing_indexes),
+    (6, "jobs table", database.migrate_create_jobs_table),
+    (7, "fact-check verdict cache table", database.migrate_create_verdict_cache_table),
+    (8, "evidence cache table", database.migrate_create_evidence_cache_table),
+    (9, "single-flight lease table", database.migrate_create_work_leases_table),
+    (10, "vote toggle functions", database.migrate_create_toggle_vote_function),
+    (11, "resync vote counters from votes", database.migrate_resync_vote_counts),
+    (12, "hot path secondary indexes", database.migrate_create_hot_path_indexes),
+    (13, "key_urls and timeline_view as JSONB", database.migrate_json_columns_to_jsonb),
+    (14, "maintained topic stats columns", database.migrate_add_topic_stats_columns),
+    (15, "argument job key", database.migrate_add_argument_job_id),
+    (16, "latest job per dedup key index", database.migrate_create_jobs_latest_by_key_index),
+    (17, "single-flight lease errors", database.migrate_add_work_lease_error_column),
+    (18, "drop unused argument stats index", database.migrate_drop_topic_side_index),
+    (19, "topic search trigram index", database.migrate_create_topic_search_index),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+async def _ensure_version_table(conn: AsyncConnection):
+    """Create the schema_version table if it doesn't exist."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+async def _applied_versions(conn: AsyncConnection) -> set[int]:
+    """Return the versions already recorded in schema_version."""
+    cursor = await conn.execute("SELECT version FROM schema_version")
+    return {row[0] for row in await cursor.fetchall()}
+
+
+async def get_pending_migrations() -> list[tuple[int, str]]:
+    """Return (version, name) of migrations not yet applied. Uses the shared pool."""
+    async with database.get_cursor() as cursor:
+        await cursor.execute("SELECT to_regclass('schema_version') IS NOT NULL")
+        if not (await cursor.fetchone())[0]:
+            return [(version, name) for version, name, _ in MIGRATIONS]
+        await cursor.execute("SELECT version FROM schema_version")
+        applied = {row[0] for row in await cursor.fetchall()}
+    return [(version, name) for version, name, _ in MIGRATIONS if version not in applied]
+
+
+async def migrate() -> int:
+    """
+    Apply all pending migrations under an advisory lock. Returns the number applied.
+    Opens and closes the shared pool itself; migration steps run on pooled connections.
+    """
+    applied_count = 0
+    # Dedicated autocommit connection holds the session-level advisory lock for the whole run
+    async with await AsyncConnection.connect(database.CONNINFO, autocommit=True) as lock_conn:
+        logger.info("Waiting for migration lock")
+        await lock_conn.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+        try:
+            await _ensure_version_table(lock_conn)
+            applied = await _applied_versions(lock_conn)
+            pending = [migration for migration in MIGRATIONS if migration[0] not in applied]
+            if not pending:
+                logger.info(f"Schema is up to date (version {LATEST_VERSION})")
+                return 0
+
+            await database.open_pool()
+            try:
+                for version, name, migration in pending:
+                    logger.info(f"Applying migration {version}: {name}")
+                    await migration()
+                    await lock_conn.execute(
+                        "INSERT INTO schema_version (version, name) VALUES (%s, %s) ON CONFLICT (version) DO NOTHING",
+                        (version, name)
+                    )
+                    applied_count += 1
+            finally:
+                await database.close_pool()
+        finally:
+            await lock_conn.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+
+    logger.info(f"Applied {applied_count} migration(s); schema is at version {LATEST_VERSION}")
+    return applied_count
+
+
+async def print_status():
+    """Print every migration and whether it has been applied."""
+    async with await AsyncConnection.connect(database.CONNINFO, autocommit=True) as conn:
+        await _ensure_version_table(conn)
+        cursor = await conn.execute("SELECT version, applied_at FROM schema_version")
+        applied = {version: applied_at for version, applied_at in await cursor.fetchall()}
+
+    for version, name, _ in MIGRATIONS:
+        state = f"applied {applied[version].isoformat()}" if version in applied else "pending"
+        print(f"{version:>4}  {name:<40} {state}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply Debately database migrations.")
+    parser.add_argument("--status", action="store_true", help="list migrations without applying them")
+    args = parser.parse_args()
+
+    if args.status:
+        asyncio.run(print_status())
+    else:
+        asyncio.run(migrate())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 # Request Models
@@ -33,11 +33,16 @@ class TopicListItem(BaseModel):
     created_at: Optional[str] = None
     pro_avg_validity: Optional[float] = None
     con_avg_validity: Optional[float] = None
+    avg_validity: Optional[float] = None
     controversy_level: Optional[str] = None
 
     class Config:
         from_attributes = True
 
+class TopicListPage(BaseModel):
+    topics: List[TopicListItem]
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
+
 class ArgumentResponse(BaseModel):
     id: int
     topic_id: str  # UUID as string
@@ -64,17 +69,34 @@ class TopicDetailResponse(BaseModel):
     overall_summary: Optional[str] = None
     consensus_view: Optional[str] = None
     timeline_view: Optional[List[dict]] = None
+    analysis_status: str = "ready"  # "ready" | "pending" (background refresh queued) | "failed" (last refresh failed, backing off)
+    refresh_job_id: Optional[str] = None  # UUID as string
+    user_votes: Optional[Dict[int, str]] = None  # {argument_id: "upvote" | "downvote"}, authenticated callers only
 
     class Config:
         from_attributes = True
 
+class UserVotesResponse(BaseModel):
+    topic_id: str  # UUID as string
+    votes: Dict[int, str]  # {argument_id: "upvote" | "downvote"}; arguments without a vote are omitted
+
 class ArgumentCreateResponse(BaseModel):
     argument_id: int
 
+class JobResponse(BaseModel):
+    job_id: str  # UUID as string
+    status: str  # "pending" | "running" | "done" | "rejected" | "failed"
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
+class TimelineEntry(BaseModel):
+    period: str
+    description: str
+
 class SummaryResponse(BaseModel):
     overall_summary: str
     consensus_view: str
-    timeline_view: List[dict]
+    timeline_view: List[TimelineEntry]
 
 class ArgumentMatch(BaseModel):
     pro_id: int
@@ -1,25 +1,28 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 import database
-import fact_checker
 from middleware.auth import get_current_user
-from models import ArgumentCreate, ArgumentCreateResponse, ArgumentResponse
-from utils.user import ensure_user_profile
+from models import ArgumentCreate, ArgumentResponse, JobResponse
+from utils.user import ensure_user_profile, write_as_user
 
 router = APIRouter(prefix="/api/topics/{topic_id}/arguments", tags=["arguments"])
 
 # Contribution limit per user (topics + arguments combined)
 USER_CONTRIBUTION_LIMIT = 25
 
-@router.post("", response_model=ArgumentCreateResponse, status_code=201)
+@router.post("", response_model=JobResponse, status_code=202)
 async def create_argument(
     topic_id: str, 
     argument: ArgumentCreate,
     user_data: dict = Depends(get_current_user)
 ):
-    """Create a new argument for a topic."""
+    """
+    Submit a new argument for a topic.
+    The argument is fact-checked in the background and saved only if it is relevant;
+    poll GET /api/jobs/{job_id} for the verdict.
+    """
     # Validate topic exists
-    topic = database.get_topic(topic_id)
+    topic = await database.get_topic(topic_id)
     if not topic:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
@@ -27,10 +30,10 @@ async def create_argument(
     if argument.side not in ['pro', 'con']:
         raise HTTPException(status_code=400, detail="side must be either 'pro' or 'con'")
     
-    user_id, username = ensure_user_profile(user_data)
+    user_id, username = await ensure_user_profile(user_data)
     
-    # Check user's contribution quota BEFORE running expensive fact-checker
-    contribution_count = database.get_user_contribution_count(user_id)
+    # Check user's contribution quota BEFORE queueing the expensive fact-checker
+    contribution_count = await database.get_user_contribution_count(user_id)
     if contribution_count >= USER_CONTRIBUTION_LIMIT:
         raise HTTPException(
             status_code=403,
@@ -42,60 +45,44 @@ async def create_argument(
             }
         )
     
-    # Run fact-checker to verify relevance before saving
-    verdict = fact_checker.verify_argument(
-        title=argument.title,
-        content=argument.content,
-        debate_proposition=topic['proposition']
-    )
-    
-    # Reject irrelevant arguments
-    if not verdict.is_relevant:
-        raise HTTPException(status_code=400, detail={
-            "error": "Argument not relevant",
-            "reasoning": verdict.reasoning,
-            "message": f"This argument was rejected as not relevant to the debate proposition: '{topic['proposition']}'. Please submit an argument with factual claims related to the debate."
-        })
-    
-    # Create the argument
-    argument_id = database.create_argument(
-        topic_id=topic_id,
-        side=argument.side,
-        title=argument.title,
-        content=argument.content,
-        author=username,
-        sources=argument.sources,
-        user_id=user_id
-    )
-    
-    # Save validity score immediately
-    database.update_argument_validity(
-        argument_id=argument_id,
-        validity_score=verdict.validity_score,
-        validity_reasoning=verdict.reasoning,
-        key_urls=verdict.key_urls
+    job = await write_as_user(
+        user_data,
+        lambda user_id, username: database.enqueue_job(
+            job_type="submit_argument",
+            payload={
+                "topic_id": topic_id,
+                "proposition": topic['proposition'],
+                "side": argument.side,
+                "title": argument.title,
+                "content": argument.content,
+                "sources": argument.sources,
+                "author": username,
+                "user_id": str(user_id)
+            },
+            user_id=user_id
+        )
     )
     
-    return ArgumentCreateResponse(argument_id=argument_id)
+    return JobResponse(job_id=job['id'], status=job['status'])
 
 
 @router.put("/{argument_id}")
 async def update_argument(topic_id: str, argument_id: int, argument: ArgumentCreate):
     """Update an existing argument. Clearing persisted matches for the topic so they will be re-evaluated."""
     # Validate topic exists
-    topic = database.get_topic(topic_id)
+    topic = await database.get_topic(topic_id)
     if not topic:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
 
     # Validate argument exists
-    args = database.get_arguments(topic_id)
+    args = await database.get_arguments(topic_id)
     arg_exists = any(a['id'] == argument_id for a in args)
     if not arg_exists:
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found in topic {topic_id}")
 
-    database.update_argument(argument_id, argument.title, argument.content, argument.sources)
+    await database.update_argument(argument_id, argument.title, argument.content, argument.sources)
     # Clear persisted matches for this topic so they will be recomputed on next request
-    database.delete_argument_matches_for_topic(topic_id)
+    await database.delete_argument_matches_for_topic(topic_id)
     return {"status": "ok"}
 
 @router.get("", response_model=list[ArgumentResponse])
@@ -105,7 +92,7 @@ async def get_arguments(
 ):
     """Get arguments for a topic, optionally filtered by side."""
     # Validate topic exists
-    topic = database.get_topic(topic_id)
+    topic = await database.get_topic(topic_id)
     if not topic:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
@@ -114,6 +101,6 @@ async def get_arguments(
         raise HTTPException(status_code=400, detail="side query parameter must be 'pro', 'con', or 'both'")
     
     filter_side = None if (side is None or side == 'both') else side
-    arguments = database.get_arguments(topic_id, filter_side)
+    arguments = await database.get_arguments(topic_id, filter_side)
     return [ArgumentResponse(**arg) for arg in arguments]
 
@@ -3,7 +3,7 @@ from uuid import UUID
 import database
 from middleware.auth import get_current_user, get_current_user_optional
 from models import UserProfileResponse
-from utils.user import ensure_user_profile
+from utils.user import invalidate_user_profile, resolve_user_profile
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -13,8 +13,8 @@ async def sync_profile(user_data: dict = Depends(get_current_user)):
     Sync user profile from Supabase auth to user_profiles table.
     Called after OAuth login to create/update user profile.
     """
-    user_id, username = ensure_user_profile(user_data)
-    profile = database.get_user_profile(user_id)
+    invalidate_user_profile(UUID(user_data['user_id']))
+    profile = await resolve_user_profile(user_data)
     
     if not profile:
         raise HTTPException(status_code=500, detail="Failed to create user profile")
@@ -33,8 +33,7 @@ async def get_current_user_profile(user_data: dict = Depends(get_current_user)):
     """
     Get the current user's profile.
     """
-    user_id, _ = ensure_user_profile(user_data)
-    profile = database.get_user_profile(user_id)
+    profile = await resolve_user_profile(user_data)
     
     if not profile:
         raise HTTPException(status_code=404, detail="User profile not found")
@@ -70,7 +69,8 @@ async def delete_account(user_data: dict = Depends(get_current_user)):
     """
     user_id = UUID(user_data['user_id'])
     
-    success = database.delete_user_profile(user_id)
+    success = await database.delete_user_profile(user_id)
+    invalidate_user_profile(user_id)
     if not success:
         raise HTTPException(status_code=404, detail="User profile not found")
     
@@ -1,32 +1,42 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from datetime import datetime, timezone
 from typing import Optional
+import asyncio
+import json
+import anyio
 import database
 import fact_checker
+from config import config
 from models import ValidityVerdictResponse, ArgumentWithValidityResponse
 
 router = APIRouter(prefix="/api", tags=["fact-checking"])
 
+# verify-all saves finished verdicts every this many results, or sooner once this many seconds have passed
+VERIFY_ALL_SAVE_EVERY = 10
+VERIFY_ALL_SAVE_INTERVAL_SECONDS = 5
+
 @router.post("/arguments/{argument_id}/verify", response_model=ValidityVerdictResponse)
 async def verify_argument(argument_id: int):
     """
     Verify a single argument's validity.
     Runs the fact-checking pipeline and saves results to database.
     """
-    argument = database.get_argument(argument_id)
+    argument = await database.get_argument(argument_id)
     if not argument:
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
     
-    topic = database.get_topic(argument['topic_id'])
+    topic = await database.get_topic(argument['topic_id'])
     if not topic:
         raise HTTPException(status_code=404, detail=f"Topic for argument {argument_id} not found")
     
-    verdict = fact_checker.verify_argument(
+    verdict = await fact_checker.verify_argument(
         title=argument['title'],
         content=argument['content'],
         debate_proposition=topic['proposition']
     )
     
-    database.update_argument_validity(
+    await database.update_argument_validity(
         argument_id=argument_id,
         validity_score=verdict.validity_score,
         validity_reasoning=verdict.reasoning,
@@ -41,63 +51,104 @@ async def verify_argument(argument_id: int):
     )
 
 
-@router.post("/topics/{topic_id}/verify-all", response_model=dict)
-async def verify_all_arguments(topic_id: str):
+@router.post("/topics/{topic_id}/verify-all")
+async def verify_all_arguments(topic_id: str, resume_from: Optional[datetime] = None):
     """
     Verify all arguments for a topic in batch.
-    Returns a summary of verification results.
+
+    Arguments are checked concurrently (bounded by FACT_CHECK_BATCH_CONCURRENCY) and
+    progress is streamed as NDJSON: a "started" line, one "result" line per argument,
+    and a final "done" summary. Finished verdicts are saved in bulk updates of up to
+    VERIFY_ALL_SAVE_EVERY results (at least every VERIFY_ALL_SAVE_INTERVAL_SECONDS),
+    so a crash or restart only loses the last few. Pass the "batch_started_at" value
+    from the "started" line as resume_from to skip arguments the earlier run already verified.
     """
     # Validate topic exists
-    topic = database.get_topic(topic_id)
+    topic = await database.get_topic(topic_id)
     if not topic:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
-    # Get all arguments for the topic
-    arguments = database.get_arguments(topic_id)
-    if not arguments:
+    batch_started_at = resume_from or datetime.now(timezone.utc)
+    arguments = await database.get_arguments_pending_verification(topic_id, resume_from)
+    if not arguments and not resume_from:
         raise HTTPException(status_code=400, detail="Topic has no arguments to verify")
     
-    results = {
-        "total_arguments": len(arguments),
-        "verified": 0,
-        "failed": 0,
-        "results": []
-    }
-    
-    for arg in arguments:
-        try:
-            verdict = fact_checker.verify_argument(
-                title=arg['title'],
-                content=arg['content'],
-                debate_proposition=topic['proposition']
-            )
-            
-            # Save results to database
-            database.update_argument_validity(
-                argument_id=arg['id'],
-                validity_score=verdict.validity_score,
-                validity_reasoning=verdict.reasoning,
-                key_urls=verdict.key_urls
-            )
-            
-            results["verified"] += 1
-            results["results"].append({
-                "argument_id": arg['id'],
-                "title": arg['title'],
-                "validity_score": verdict.validity_score,
-                "status": "success"
-            })
-            
-        except Exception as e:
-            results["failed"] += 1
-            results["results"].append({
-                "argument_id": arg['id'],
-                "title": arg['title'],
-                "status": "failed",
-                "error": str(e)
-            })
-    
-    return results
+    return StreamingResponse(
+        _stream_verify_all(topic['proposition'], arguments, batch_started_at),
+        media_type="application/x-ndjson"
+    )
+
+
+async def _stream_verify_all(proposition: str, arguments: list, batch_started_at: datetime):
+    """Run a verify-all batch and yield one NDJSON line per event."""
+    semaphore = asyncio.Semaphore(config.FACT_CHECK_BATCH_CONCURRENCY)
+    # Verdicts not yet written to the database
+    verdicts = []
+    loop = asyncio.get_running_loop()
+    last_saved = loop.time()
+
+    async def save():
+        nonlocal last_saved
+        last_saved = loop.time()
+        batch = verdicts[:]
+        if batch:
+            await database.update_arguments_validity_bulk(batch)
+            # Checks still running may have appended more while the update ran
+            del verdicts[:len(batch)]
+
+    async def check(arg: dict) -> dict:
+        async with semaphore:
+            try:
+                verdict = await fact_checker.verify_argument(
+                    title=arg['title'],
+                    content=arg['content'],
+                    debate_proposition=proposition
+                )
+            except Exception as e:
+                return {
+                    "argument_id": arg['id'],
+                    "title": arg['title'],
+                    "status": "failed",
+                    "error": str(e)
+                }
+        verdicts.append({
+            "argument_id": arg['id'],
+            "validity_score": verdict.validity_score,
+            "validity_reasoning": verdict.reasoning,
+            "key_urls": verdict.key_urls
+        })
+        return {
+            "argument_id": arg['id'],
+            "title": arg['title'],
+            "validity_score": verdict.validity_score,
+            "status": "success"
+        }
+
+    tasks = [asyncio.create_task(check(arg)) for arg in arguments]
+    summary = {"total_arguments": len(arguments), "verified": 0, "failed": 0}
+    try:
+        yield json.dumps({
+            "event": "started",
+            "batch_started_at": batch_started_at.isoformat(),
+            "total_arguments": len(arguments)
+        }) + "\n"
+
+        for next_result in asyncio.as_completed(tasks):
+            result = await next_result
+            summary["verified" if result["status"] == "success" else "failed"] += 1
+            if len(verdicts) >= VERIFY_ALL_SAVE_EVERY or loop.time() - last_saved >= VERIFY_ALL_SAVE_INTERVAL_SECONDS:
+                await save()
+            yield json.dumps({"event": "result", **result}) + "\n"
+
+        await save()
+        yield json.dumps({"event": "done", **summary}) + "\n"
+    finally:
+        # Client disconnected mid-batch: stop outstanding checks but keep finished verdicts
+        for task in tasks:
+            task.cancel()
+        if verdicts:
+            with anyio.CancelScope(shield=True):
+                await save()
 
 
 @router.get("/topics/{topic_id}/arguments/verified", response_model=list[ArgumentWithValidityResponse])
@@ -109,13 +160,13 @@ async def get_arguments_sorted_by_validity(
     Get arguments sorted by validity score (highest first, unverified at end).
     Optionally filter by side (pro/con).
     """
-    topic = database.get_topic(topic_id)
+    topic = await database.get_topic(topic_id)
     if not topic:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
     if side and side not in ['pro', 'con']:
         raise HTTPException(status_code=400, detail="side query parameter must be 'pro' or 'con'")
     
-    arguments = database.get_arguments_sorted_by_validity(topic_id, side)
+    arguments = await database.get_arguments_sorted_by_validity(topic_id, side)
     return [ArgumentWithValidityResponse(**arg) for arg in arguments]
 
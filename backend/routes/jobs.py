@@ -0,0 +1,20 @@
+from fastapi import APIRouter, HTTPException
+from uuid import UUID
+import database
+from models import JobResponse
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: UUID):
+    """Get the status of a background job and, once finished, its result."""
+    job = await database.get_job(str(job_id))
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job with id {job_id} not found")
+    
+    return JobResponse(
+        job_id=job['id'],
+        status=job['status'],
+        result=job.get('result'),
+        error=job.get('error')
+    )
@@ -1,39 +1,70 @@
+import json
+import logging
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 import database
 import claude_service
 from models import SummaryResponse
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/topics/{topic_id}", tags=["summaries"])
 
-@router.post("/generate-summary", response_model=SummaryResponse)
-async def generate_summary(topic_id: str):
-    """Generate summary, consensus view, and timeline view using Claude."""
-    topic_data = database.get_topic_with_arguments(topic_id)
+
+async def _get_summarizable_topic(topic_id: str) -> dict:
+    """Load a topic with its arguments; 404 if missing, 400 unless both sides have an argument."""
+    topic_data = await database.get_topic_with_arguments(topic_id)
     if not topic_data:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
-    pro_arguments = topic_data['pro_arguments']
-    con_arguments = topic_data['con_arguments']
-    
-    if not pro_arguments or not con_arguments:
+    if not topic_data['pro_arguments'] or not topic_data['con_arguments']:
         raise HTTPException(
             status_code=400,
             detail="Topic must have at least one pro argument and one con argument to generate summary"
         )
+    return topic_data
+
+
+@router.post("/generate-summary", response_model=SummaryResponse)
+async def generate_summary(topic_id: str):
+    """Generate summary, consensus view, and timeline view using Claude."""
+    topic_data = await _get_summarizable_topic(topic_id)
     
-    result = claude_service.generate_summary(
-        proposition=topic_data['proposition'],
-        pro_arguments=pro_arguments,
-        con_arguments=con_arguments
-    )
-    
-    database.update_topic_analysis(
-        topic_id=topic_id,
-        overall_summary=result['overall_summary'],
-        consensus_view=result['consensus_view'],
-        timeline_view=result['timeline_view']
-    )
+    result = await claude_service.summarize_topic(topic_id, topic_data)
     
     return SummaryResponse(**result)
 
 
+@router.post("/generate-summary/stream")
+async def stream_summary(topic_id: str):
+    """
+    Generate the summary like /generate-summary, streamed as Server-Sent Events.
+
+    Events: "overall_summary" and "consensus_view" ({"text": ...}) as soon as each is
+    written, one "timeline_entry" ({"period", "description"}) per timeline item, then
+    "done" with the full saved result - or "error" ({"detail": ...}) if generation fails.
+    """
+    topic_data = await _get_summarizable_topic(topic_id)
+    
+    return StreamingResponse(
+        _stream_summary_events(topic_id, topic_data),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _stream_summary_events(topic_id: str, topic_data: dict):
+    """Yield one SSE frame per summary event."""
+    try:
+        async for event in claude_service.stream_summary(topic_id, topic_data):
+            name = event.pop("event")
+            yield _sse(name, event)
+    except Exception as e:
+        # Headers are already sent, so failures are reported in-band
+        logger.exception(f"Streaming summary failed for topic {topic_id}")
+        detail = str(e) if isinstance(e, (ValueError, RuntimeError)) else "Internal server error"
+        yield _sse("error", {"detail": detail})
@@ -1,22 +1,54 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+import base64
+import json
 import database
-import fact_checker
-import claude_service
+import vote_buffer
+from config import config
 from validate_proposition import validate_proposition
-from middleware.auth import get_current_user
-from models import PropositionValidateRequest, PropositionValidationResponse, TopicCreate, TopicResponse, TopicListItem, TopicDetailResponse
-from utils.user import ensure_user_profile
+from middleware.auth import get_current_user, get_current_user_optional
+from models import PropositionValidateRequest, PropositionValidationResponse, TopicCreate, TopicResponse, TopicListItem, TopicListPage, TopicDetailResponse, UserVotesResponse
+from utils.user import ensure_user_profile, write_as_user
 
 router = APIRouter(prefix="/api/topics", tags=["topics"])
 
 # Contribution limit per user (topics + arguments combined)
 USER_CONTRIBUTION_LIMIT = 25
 
-@router.post("/validate-proposition", tags=["topics"])
+# Topic listing page sizes
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+CONTROVERSY_LEVELS = ["Highly Contested", "Moderately Contested", "Clear Consensus"]
+
+def _encode_cursor(topic: dict) -> str:
+    """Encode the (created_at, id) keyset position of a topic as an opaque cursor."""
+    raw = json.dumps([topic['created_at'], topic['id']])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _append_json_fields(document: str, **fields) -> str:
+    """Add fields to a serialized JSON object without parsing it."""
+    extra = "".join(f', {json.dumps(key)}: {json.dumps(value)}' for key, value in fields.items())
+    return document[:document.rindex("}")] + extra + "}"
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode an opaque cursor back into its (created_at, id) keyset position. Raises 400 if malformed."""
+    try:
+        created_at, topic_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        position = datetime.fromisoformat(created_at), UUID(topic_id)
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # created_at is a naive TIMESTAMP column, so cursors never carry an offset
+    if position[0].tzinfo is not None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return position
+
+@router.post("/validate-proposition", response_model=PropositionValidationResponse, tags=["topics"])
 async def validate_proposition_endpoint(request: PropositionValidateRequest):
     """Validate a proposition and return suggestions"""
-    result = validate_proposition(request.proposition)
-    return PropositionValidationResponse(**result)
+    return await validate_proposition(request.proposition)
 
 @router.post("", response_model=TopicResponse, status_code=201, tags=["topics"])
 async def create_topic(
@@ -24,10 +56,10 @@ async def create_topic(
     user_data: dict = Depends(get_current_user)
 ):
     """Create a new debate topic."""
-    user_id, username = ensure_user_profile(user_data)
+    user_id, username = await ensure_user_profile(user_data)
     
     # Check user's contribution quota
-    contribution_count = database.get_user_contribution_count(user_id)
+    contribution_count = await database.get_user_contribution_count(user_id)
     if contribution_count >= USER_CONTRIBUTION_LIMIT:
         raise HTTPException(
             status_code=403,
@@ -39,10 +71,13 @@ async def create_topic(
             }
         )
     
-    topic_data = database.create_topic(
-        proposition=topic.proposition,
-        created_by=username,
-        user_id=user_id
+    topic_data = await write_as_user(
+        user_data,
+        lambda user_id, username: database.create_topic(
+            proposition=topic.proposition,
+            created_by=username,
+            user_id=user_id
+        )
     )
     if not topic_data:
         raise HTTPException(status_code=500, detail="Failed to create topic")
@@ -54,84 +89,102 @@ async def create_topic(
         created_at=topic_data.get('created_at')
     )
 
-@router.get("", response_model=list[TopicListItem])
-async def get_topics():
-    """Get all topics with pro/con argument counts."""
-    topics = database.get_all_topics()
-    return [TopicListItem(**topic) for topic in topics]
+@router.get("", response_model=TopicListPage)
+async def get_topics(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    controversy_level: Optional[str] = Query(None, description="Filter by controversy level"),
+    min_validity: Optional[float] = Query(None, ge=1, le=5, description="Minimum average validity score"),
+    created_by: Optional[str] = Query(None, description="Filter by creator username"),
+    search: Optional[str] = Query(
+        None,
+        max_length=200,
+        description=f"Case-insensitive text to find in the proposition (at least {database.SEARCH_MIN_LENGTH} characters)"
+    )
+):
+    """Get a page of topics (newest first) with pro/con argument counts."""
+    if controversy_level and controversy_level not in CONTROVERSY_LEVELS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"controversy_level must be one of: {', '.join(CONTROVERSY_LEVELS)}"
+        )
+    search = search.strip() if search else None
+    if search and len(search) < database.SEARCH_MIN_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"search must be at least {database.SEARCH_MIN_LENGTH} characters"
+        )
+    
+    topics = await database.get_topics_page(
+        limit=limit,
+        after=_decode_cursor(cursor) if cursor else None,
+        controversy_level=controversy_level,
+        min_validity=min_validity,
+        created_by=created_by,
+        search=search
+    )
+    
+    # One extra row is fetched to detect whether another page exists
+    has_more = len(topics) > limit
+    topics = topics[:limit]
+    return TopicListPage(
+        topics=[TopicListItem(**topic) for topic in topics],
+        next_cursor=_encode_cursor(topics[-1]) if has_more else None
+    )
 
 @router.get("/{topic_id}", response_model=TopicDetailResponse)
-async def get_topic(topic_id: str):
+async def get_topic(
+    topic_id: str,
+    user_data: Optional[dict] = Depends(get_current_user_optional)
+):
     """
     Get a topic with its arguments and analysis.
-    Automatically verifies arguments and generates Claude analysis if missing.
+    Returns the stored data immediately; if arguments are unverified or the Claude
+    analysis is missing, a background refresh job is queued and analysis_status is
+    "pending" until it finishes. After a refresh fails, analysis_status is "failed"
+    and no new refresh is queued for TOPIC_REFRESH_FAILURE_BACKOFF_SECONDS.
     Arguments are always sorted by validity score (highest first).
+    Authenticated callers also get their own vote on each argument in user_votes.
+    The response body is assembled by Postgres and is not re-validated here.
     """
-    topic_data = database.get_topic_with_arguments(topic_id)
-    if not topic_data:
+    async with vote_buffer.counter_read():
+        detail = await database.get_topic_detail_json(
+            topic_id,
+            user_id=UUID(user_data['user_id']) if user_data else None,
+            # Include vote counter changes this worker hasn't flushed yet
+            vote_deltas=vote_buffer.pending_deltas() if config.VOTE_BUFFER_ENABLED else None
+        )
+    if not detail:
         raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
+    body, needs_verification, needs_analysis = detail
     
-    # Check if any arguments need verification
-    all_arguments = topic_data['pro_arguments'] + topic_data['con_arguments']
-    needs_verification = any(
-        arg.get('validity_score') is None for arg in all_arguments
-    )
-    
-    # Auto-verify all arguments if needed
-    if needs_verification and all_arguments:
-        for arg in all_arguments:
-            if arg.get('validity_score') is None:
-                try:
-                    verdict = fact_checker.verify_argument(
-                        title=arg['title'],
-                        content=arg['content'],
-                        debate_proposition=topic_data['proposition']
-                    )
-                    database.update_argument_validity(
-                        argument_id=arg['id'],
-                        validity_score=verdict.validity_score,
-                        validity_reasoning=verdict.reasoning,
-                        key_urls=verdict.key_urls
-                    )
-                except Exception:
-                    # Continue even if verification fails for one argument
-                    pass
-        
-        # Refetch topic data with updated validity scores
-        topic_data = database.get_topic_with_arguments(topic_id)
-    
-    # Check if Claude analysis is missing
-    needs_analysis = (
-        not topic_data.get('overall_summary') or
-        not topic_data.get('consensus_view') or
-        not topic_data.get('timeline_view')
-    )
+    # Serve what we have and let the worker fill in the rest
+    analysis_status, refresh_job_id = 'ready', None
+    if needs_verification or needs_analysis:
+        job = await database.enqueue_job(
+            "refresh_topic",
+            {"topic_id": topic_id},
+            dedup_key=topic_id,
+            failure_backoff_seconds=config.TOPIC_REFRESH_FAILURE_BACKOFF_SECONDS
+        )
+        analysis_status = 'failed' if job['status'] == 'failed' else 'pending'
+        refresh_job_id = job['id']
     
-    # Auto-generate Claude analysis if needed
-    if needs_analysis:
-        pro_args = topic_data['pro_arguments']
-        con_args = topic_data['con_arguments']
-        
-        if pro_args and con_args:
-            try:
-                result = claude_service.generate_summary(
-                    proposition=topic_data['proposition'],
-                    pro_arguments=pro_args,
-                    con_arguments=con_args
-                )
-                database.update_topic_analysis(
-                    topic_id=topic_id,
-                    overall_summary=result['overall_summary'],
-                    consensus_view=result['consensus_view'],
-                    timeline_view=result['timeline_view']
-                )
-                # Update topic_data with new analysis
-                topic_data['overall_summary'] = result['overall_summary']
-                topic_data['consensus_view'] = result['consensus_view']
-                topic_data['timeline_view'] = result['timeline_view']
-            except Exception:
-                # Continue even if analysis generation fails
-                pass
+    # The document is already shaped like TopicDetailResponse; send it as-is
+    body = _append_json_fields(body, analysis_status=analysis_status, refresh_job_id=refresh_job_id)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/{topic_id}/votes", response_model=UserVotesResponse)
+async def get_my_votes(topic_id: str, user_data: dict = Depends(get_current_user)):
+    """
+    Get the current user's vote on every argument in a topic. Requires authentication.
+    Arguments the user hasn't voted on are omitted.
+    """
+    topic = await database.get_topic(topic_id)
+    if not topic:
+        raise HTTPException(status_code=404, detail=f"Topic with id {topic_id} not found")
     
-    return TopicDetailResponse(**topic_data)
+    votes = await database.get_user_votes_for_topic(topic_id, UUID(user_data['user_id']))
+    return UserVotesResponse(topic_id=topic_id, votes=votes)
 
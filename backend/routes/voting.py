@@ -1,21 +1,30 @@
 from fastapi import APIRouter, HTTPException, Depends
 import database
+import vote_buffer
+from config import config
 from middleware.auth import get_current_user
 from models import CommentCreate, CommentCreateResponse, CommentResponse
-from utils.user import ensure_user_profile
+from utils.user import write_as_user
 from uuid import UUID
 
 router = APIRouter(prefix="/api/arguments", tags=["arguments"])
 
+async def _vote(argument_id: int, user_id: UUID, vote_type: str):
+    """Toggle a vote through the write-behind buffer when enabled, else directly in Postgres."""
+    if config.VOTE_BUFFER_ENABLED:
+        return await vote_buffer.record_vote(argument_id, user_id, vote_type)
+    if vote_type == 'upvote':
+        return await database.upvote_argument(argument_id, user_id)
+    return await database.downvote_argument(argument_id, user_id)
+
 @router.post("/{argument_id}/upvote")
 async def upvote_argument(argument_id: int, user_data: dict = Depends(get_current_user)):
     """Upvote an argument. Requires authentication. Returns vote count and user's vote status."""
-    argument = database.get_argument(argument_id)
-    if not argument:
+    result = await write_as_user(user_data, lambda user_id, _: _vote(argument_id, user_id, 'upvote'))
+    if result is None:
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
     
-    user_id, _ = ensure_user_profile(user_data)
-    votes, user_vote_status = database.upvote_argument(argument_id, user_id)
+    votes, user_vote_status = result
     return {
         "argument_id": argument_id,
         "votes": votes,
@@ -25,12 +34,11 @@ async def upvote_argument(argument_id: int, user_data: dict = Depends(get_curren
 @router.post("/{argument_id}/downvote")
 async def downvote_argument(argument_id: int, user_data: dict = Depends(get_current_user)):
     """Downvote an argument. Requires authentication. Returns vote count and user's vote status."""
-    argument = database.get_argument(argument_id)
-    if not argument:
+    result = await write_as_user(user_data, lambda user_id, _: _vote(argument_id, user_id, 'downvote'))
+    if result is None:
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
     
-    user_id, _ = ensure_user_profile(user_data)
-    votes, user_vote_status = database.downvote_argument(argument_id, user_id)
+    votes, user_vote_status = result
     return {
         "argument_id": argument_id,
         "votes": votes,
@@ -40,11 +48,11 @@ async def downvote_argument(argument_id: int, user_data: dict = Depends(get_curr
 @router.get("/{argument_id}/comments", response_model=list[CommentResponse])
 async def get_comments(argument_id: int):
     """Get all comments for an argument."""
-    argument = database.get_argument(argument_id)
+    argument = await database.get_argument(argument_id)
     if not argument:
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
 
-    return database.get_comments(argument_id)
+    return await database.get_comments(argument_id)
 
 @router.post("/{argument_id}/comment", response_model=CommentCreateResponse, status_code=201)
 async def comment_on_argument(
@@ -53,10 +61,12 @@ async def comment_on_argument(
     user_data: dict = Depends(get_current_user)
 ):
     """Create a new comment on an argument."""
-    argument = database.get_argument(argument_id)
+    argument = await database.get_argument(argument_id)
     if not argument:
         raise HTTPException(status_code=404, detail=f"Argument with id {argument_id} not found")
 
-    user_id, _ = ensure_user_profile(user_data)
-    comment_id = database.create_comment(argument_id, comment.comment, user_id=user_id)
+    comment_id = await write_as_user(
+        user_data,
+        lambda user_id, _: database.create_comment(argument_id, comment.comment, user_id=user_id)
+    )
     return CommentCreateResponse(comment_id=comment_id)
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Incremental decoding of a streamed JSON object.
+
+Feed the text of one top-level JSON object in arbitrary chunks (for example the
+partial_json deltas of a streamed tool call) and get events as soon as each part
+is complete:
+- ("item", key, value) for every element of a top-level array field
+- ("field", key, value) when a top-level field's value is complete
+
+Values are decoded with json.JSONDecoder.raw_decode, so nothing is re-parsed once
+it has been emitted.
+"""
+
+import json
+from typing import Any, Optional
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class JsonObjectStream:
+    """Event-producing parser for a single top-level JSON object."""
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"  # start -> key -> colon -> value -> (array) -> comma -> ... -> end
+        self._key: Optional[str] = None
+        self._items: list = []
+
+    @property
+    def finished(self) -> bool:
+        return self._state == "end"
+
+    def feed(self, chunk: str) -> list[tuple[str, str, Any]]:
+        """Add text and return the events it completed. Raises ValueError on invalid JSON."""
+        self._buffer += chunk
+        events = []
+        while self._step(events):
+            pass
+        return events
+
+    def _skip_whitespace(self) -> Optional[str]:
+        """Advance past whitespace; return the next character, or None if more input is needed."""
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else None
+
+    def _decode_value(self) -> tuple[bool, Any]:
+        """Decode one complete JSON value at the current position."""
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            # Incomplete so far; invalid input surfaces once the object should be complete
+            return False, None
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and end >= len(self._buffer):
+            # A number at the end of the buffer may still have more digits coming
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, allowed: str) -> Optional[str]:
+        char = self._skip_whitespace()
+        if char is not None and char not in allowed:
+            raise ValueError(f"Unexpected {char!r} at position {self._pos} in streamed JSON")
+        return char
+
+    def _close_array(self, events: list):
+        self._pos += 1
+        events.append(("field", self._key, self._items))
+        self._state = "comma"
+
+    def _step(self, events: list) -> bool:
+        """Consume one token if possible; return False when more input is needed."""
+        if self._state == "start":
+            if self._expect("{") is None:
+                return False
+            self._pos += 1
+            self._state = "key"
+        elif self._state == "key":
+            char = self._expect('"}')
+            if char is None:
+                return False
+            if char == "}":
+                self._pos += 1
+                self._state = "end"
+                return False
+            complete, self._key = self._decode_value()
+            if not complete:
+                return False
+            self._state = "colon"
+        elif self._state == "colon":
+            if self._expect(":") is None:
+                return False
+            self._pos += 1
+            self._state = "value"
+        elif self._state == "value":
+            char = self._skip_whitespace()
+            if char is None:
+                return False
+            if char == "[":
+                self._pos += 1
+                self._items = []
+                self._state = "item"
+                return True
+            complete, value = self._decode_value()
+            if not complete:
+                return False
+            events.append(("field", self._key, value))
+            self._state = "comma"
+        elif self._state == "item":
+            char = self._skip_whitespace()
+            if char is None:
+                return False
+            if char == "]" and not self._items:
+                self._close_array(events)
+                return True
+            complete, value = self._decode_value()
+            if not complete:
+                return False
+            self._items.append(value)
+            events.append(("item", self._key, value))
+            self._state = "item_comma"
+        elif self._state == "item_comma":
+            char = self._expect("],")
+            if char is None:
+                return False
+            if char == "]":
+                self._close_array(events)
+            else:
+                self._pos += 1
+                self._state = "item"
+        elif self._state == "comma":
+            char = self._expect(",}")
+            if char is None:
+                return False
+            self._pos += 1
+            self._state = "key" if char == "," else "end"
+            return char == ","
+        else:
+            return False
+        return True
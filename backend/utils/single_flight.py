@@ -0,0 +1,132 @@
+"""
+Single-flight coalescing of duplicate expensive work.
+
+Concurrent callers asking for the same (operation, key) share one computation:
+inside a process they await the same task, and across worker processes the
+first caller takes a lease in the `work_leases` table while the others poll for
+the result it publishes there. Results must be JSON-serializable.
+
+The computation runs in its own task, so a caller that is cancelled (for example
+a client disconnecting) stops waiting without cancelling the work for everyone
+else; the task finishes and publishes its result. While it runs, the lease is
+renewed every third of SINGLE_FLIGHT_LEASE_SECONDS, so the lease only expires if
+the holder's process dies.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+import anyio
+import database
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting worker checks whether the lease holder has finished
+LEASE_POLL_INTERVAL_SECONDS = 0.5
+
+_inflight: dict[str, asyncio.Task] = {}
+
+leader_runs = 0
+local_joins = 0
+remote_joins = 0
+lease_renewals = 0
+
+
+class RemoteComputationError(RuntimeError):
+    """Raised in a waiting worker when the worker holding the lease failed."""
+
+
+def get_single_flight_stats() -> dict:
+    """Return how often work was computed versus shared."""
+    return {
+        "in_flight": len(_inflight),
+        "leader_runs": leader_runs,
+        "local_joins": local_joins,
+        "remote_joins": remote_joins,
+        "lease_renewals": lease_renewals,
+    }
+
+
+async def single_flight(operation: str, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run compute() once for all concurrent callers of (operation, key) and return its result.
+    If the computation fails, every waiting caller sees the exception (callers in other
+    workers get a RemoteComputationError carrying its message).
+    """
+    global local_joins
+
+    flight_key = f"{operation}:{key}"
+    task = _inflight.get(flight_key)
+    if task is not None:
+        local_joins += 1
+    else:
+        task = asyncio.create_task(_run_with_lease(flight_key, compute))
+        _inflight[flight_key] = task
+        task.add_done_callback(lambda done: _finish_flight(flight_key, done))
+    # Shielded: cancelling this caller must not cancel work other callers are waiting on
+    return await asyncio.shield(task)
+
+
+def _finish_flight(flight_key: str, task: asyncio.Task):
+    if _inflight.get(flight_key) is task:
+        del _inflight[flight_key]
+    # Every caller may have been cancelled; retrieve the outcome so it isn't logged as unhandled
+    if not task.cancelled():
+        task.exception()
+
+
+async def _run_with_lease(flight_key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Compute under a cross-worker lease, or wait for the worker that holds it."""
+    global leader_runs, remote_joins
+
+    owner = uuid4().hex
+    while True:
+        if await database.acquire_work_lease(flight_key, owner, config.SINGLE_FLIGHT_LEASE_SECONDS):
+            leader_runs += 1
+            heartbeat = asyncio.create_task(_renew_lease(flight_key, owner))
+            try:
+                result = await compute()
+            except asyncio.CancelledError:
+                # Not a failure of the work itself; let a waiting worker take over
+                with anyio.CancelScope(shield=True):
+                    await database.release_work_lease(flight_key, owner)
+                raise
+            except Exception as e:
+                with anyio.CancelScope(shield=True):
+                    await database.fail_work_lease(flight_key, owner, str(e) or type(e).__name__)
+                raise
+            finally:
+                heartbeat.cancel()
+            await database.finish_work_lease(flight_key, owner, result)
+            return result
+
+        remote_joins += 1
+        logger.info(f"Waiting on another worker for {flight_key}")
+        while True:
+            await asyncio.sleep(LEASE_POLL_INTERVAL_SECONDS)
+            lease = await database.get_work_lease(flight_key)
+            if lease is None or (lease['expired'] and lease['finished_at'] is None):
+                # Holder was cancelled or died; try to take over
+                break
+            if lease['finished_at'] is not None:
+                if lease['error'] is not None:
+                    raise RemoteComputationError(lease['error'])
+                return lease['result']
+
+
+async def _renew_lease(flight_key: str, owner: str):
+    """Keep extending a held lease until cancelled."""
+    global lease_renewals
+
+    while True:
+        await asyncio.sleep(config.SINGLE_FLIGHT_LEASE_SECONDS / 3)
+        try:
+            if await database.renew_work_lease(flight_key, owner, config.SINGLE_FLIGHT_LEASE_SECONDS):
+                lease_renewals += 1
+            else:
+                logger.warning(f"Lost single-flight lease for {flight_key}")
+                return
+        except Exception:
+            logger.exception(f"Renewing single-flight lease for {flight_key} failed")
@@ -1,24 +1,52 @@
 """User utility functions for ensuring user profiles exist."""
 
+from typing import Awaitable, Callable, TypeVar
 from uuid import UUID
+from psycopg.errors import ForeignKeyViolation
 import database
+from config import config
+from utils.cache import TTLCache
 
+# Resolved profiles keyed by user id. Invalidated locally on sync/delete; other
+# workers see changes once the TTL lapses, so writes go through write_as_user,
+# which treats a deleted profile (user_id foreign-key violation) as a cache miss.
+profile_cache = TTLCache(
+    max_entries=config.PROFILE_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.PROFILE_CACHE_TTL_SECONDS
+)
 
-def ensure_user_profile(user_data: dict) -> tuple[UUID, str]:
+T = TypeVar("T")
+
+
+def get_profile_cache_stats() -> dict:
+    """Return profile cache size and hit/miss counters."""
+    return profile_cache.stats()
+
+
+def invalidate_user_profile(user_id: UUID):
+    """Drop a cached profile so the next request re-reads it from the database."""
+    profile_cache.invalidate(user_id)
+
+
+async def resolve_user_profile(user_data: dict) -> dict:
     """
-    Ensure a user profile exists for the authenticated user.
-    Creates the profile if it doesn't exist.
+    Return the profile for the authenticated user, creating it if it doesn't exist.
+    Served from the in-process cache when possible.
     
     Args:
         user_data: The user data dict from get_current_user middleware
         
     Returns:
-        Tuple of (user_id, username)
+        The user_profiles row as a dict
         
     Raises:
         ValueError: If user_id is invalid
     """
     user_id = UUID(user_data['user_id'])
+    profile = profile_cache.get(user_id)
+    if profile is not None:
+        return profile
+    
     user_metadata = user_data.get('user_metadata', {})
     email = user_data.get('email', '')
     
@@ -31,13 +59,55 @@ def ensure_user_profile(user_data: dict) -> tuple[UUID, str]:
     
     # Ensure user profile exists (creates if it doesn't exist)
     # This is required because tables have foreign key constraints on user_id
-    profile = database.get_or_create_user_profile(
+    profile = await database.get_or_create_user_profile(
         user_id=user_id,
         email=email,
         username=username,
         avatar_url=user_metadata.get('avatar_url')
     )
+    profile_cache.set(user_id, profile)
+    return profile
+
+
+async def ensure_user_profile(user_data: dict) -> tuple[UUID, str]:
+    """
+    Ensure a user profile exists for the authenticated user.
+    Creates the profile if it doesn't exist.
+    
+    Args:
+        user_data: The user data dict from get_current_user middleware
+        
+    Returns:
+        Tuple of (user_id, username)
+        
+    Raises:
+        ValueError: If user_id is invalid
+    """
+    profile = await resolve_user_profile(user_data)
     
     # Return user_id and username from profile (may have been updated)
-    return user_id, profile['username']
+    return UUID(user_data['user_id']), profile['username']
+
+
+def _is_user_fk_violation(error: ForeignKeyViolation) -> bool:
+    """True if the missing key is a user profile (constraint names vary between tables)."""
+    # e.g. Key (user_id)=(...) is not present in table "user_profiles".
+    return '"user_profiles"' in (error.diag.message_detail or '')
 
+
+async def write_as_user(user_data: dict, write: Callable[[UUID, str], Awaitable[T]]) -> T:
+    """
+    Run write(user_id, username) for the authenticated user and return its result.
+    If the cached profile was deleted meanwhile (DELETE /api/auth/account handled by
+    another worker), the write fails with a foreign-key violation on user_id; the
+    cache entry is dropped, the profile is re-resolved, and the write is retried once.
+    """
+    user_id, username = await ensure_user_profile(user_data)
+    try:
+        return await write(user_id, username)
+    except ForeignKeyViolation as e:
+        if not _is_user_fk_violation(e):
+            raise
+        invalidate_user_profile(user_id)
+        user_id, username = await ensure_user_profile(user_data)
+        return await write(user_id, username)
@@ -1,16 +1,13 @@
-import json
 from typing import List, Dict
-from anthropic import Anthropic
 import logging
-import database
+import llm_gateway
 from config import config
+from models import PropositionValidationResponse
 
 logger = logging.getLogger(__name__)
 
-# Initialize Claude client using immutable config
-client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+# Use immutable config values (Claude calls go through llm_gateway)
 MODEL = config.CLAUDE_MODEL_STANDARD
-API_CALL_LIMIT = config.API_CALL_LIMIT
 
 response_json = """
     {
@@ -27,7 +24,8 @@ response_json = """
     }
 """
 
-prompt_template = """
+# Static instructions, identical for every request and sent as a cached prefix
+system_prompt_template = """
     <role>
     You are a debate proposition formatter. Your task is to take a user's input—whether it's a question, a vague topic, or a rough statement—and REFORMULATE it into formal debate propositions suitable for a speech and debate competition. You must preserve the core topic and intent of the original input, only changing the wording and structure to make it debatable.
     </role>
@@ -57,12 +55,8 @@ prompt_template = """
     Fact: Asserts something is true or will occur. Example: "Artificial intelligence will displace more jobs than it creates."
     </proposition_types>
 
-    <user_proposition>
-    {proposition}
-    </user_proposition>
-
     <output_format>
-    Respond with valid JSON only, no markdown code fences or explanation. Fields for you to fill it appropriately enclosed as <>.
+    Return your answer by calling the record_propositions tool. Its fields are described below, with the values for you to fill in enclosed as <>.
     {response_json}
     </output_format>
 
@@ -87,58 +81,38 @@ prompt_template = """
     - Do NOT introduce new concepts, angles, or topics that weren't in the original input
     - If the input is a question, convert it to a statement format that preserves the original question's intent
     </requirements>
+
+    The user's input follows in <user_proposition> tags.
+"""
+
+system_prompt = system_prompt_template.format(response_json=response_json)
+
+# The only per-request part of the prompt
+user_prompt_template = """
+    <user_proposition>
+    {proposition}
+    </user_proposition>
 """
 
-def validate_proposition(proposition: str):
+async def validate_proposition(proposition: str) -> PropositionValidationResponse:
     try:
-        # Check API limit before making call
-        if not database.check_api_limit("anthropic", API_CALL_LIMIT):
-            raise RuntimeError("Anthropic API call limit reached (750 calls). Please try again later.")
+        # Only the user's proposition varies between requests
+        formatted_prompt = user_prompt_template.format(proposition=proposition)
         
-        # Format the prompt template with the user's proposition
-        formatted_prompt = prompt_template.format(
-            proposition=proposition,
-            response_json=response_json
-        )
-        
-        message = client.messages.create(
+        result = await llm_gateway.structured(
+            formatted_prompt,
+            PropositionValidationResponse,
             model=MODEL,
             max_tokens=4096,
-            messages=[
-                {
-                    "role": "user",
-                    "content": formatted_prompt
-                }
-            ]
+            tool_name="record_propositions",
+            tool_description="Record whether the input is debatable and the reformulated propositions.",
+            static_prefix=system_prompt
         )
-        
-        # Increment counter after successful call
-        database.increment_api_call_count("anthropic")
-
-        response_text = message.content[0].text.strip()
-        
-        # Try to parse JSON from the response
-        # Claude might wrap JSON in markdown code blocks
-        # TODO standardize JSON unpacking from Claude API.
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-        
-        result = json.loads(response_text)
-
-        if not all(key in result for key in ['original_input', 'is_valid', 'rejection_reason', 'interpretation', 'suggestions']):
-            raise ValueError("Missing required fields in Claude response")
-        
-        if not isinstance(result['suggestions'], list):
-            raise ValueError("suggestions must be a list")
-
-        logger.info(f"Successfully unpacked Claude proposition validation response: {json.dumps(result, indent=2)}")
-
+        logger.info(f"Proposition validation result: {result.model_dump_json(indent=2)}")
         return result
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse JSON from Claude response: {e}")
+    except llm_gateway.StructuredOutputError as e:
+        raise ValueError(f"Failed to parse Claude response: {e}")
 
     except Exception as e:
-        raise RuntimeError(f"Claude API error: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Claude API error: {e}")
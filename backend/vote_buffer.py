@@ -0,0 +1,188 @@
+"""
+Write-behind buffer for vote counters (enabled with VOTE_BUFFER_ENABLED).
+
+Each vote click still writes the voter's own row in `votes` immediately, so the
+vote itself is durable. Only the shared `arguments.votes` counter, the row every
+voter on a hot argument would otherwise serialize on, is updated later: deltas
+accumulate in memory and are flushed in one batched UPDATE every
+VOTE_FLUSH_INTERVAL_SECONDS.
+
+If a process dies, at most one flush interval of counter deltas is lost. The
+counters can be rebuilt from `votes` with database.migrate_resync_vote_counts()
+while no buffering process is running (it only rewrites mismatched rows).
+Vote responses and topic reads served by this process add its unflushed deltas,
+so a voter sees their own vote right away as long as the same process serves
+them. Other processes (and any client routed to them) only see the new count
+after this process flushes, up to VOTE_FLUSH_INTERVAL_SECONDS later.
+
+Reads that combine stored counters with pending deltas run inside
+counter_read(), and a flush waits for those reads to finish and holds new ones
+back until its batch has committed and left the buffer. A read therefore sees
+a batch either in the buffer or in the stored counters, never in both or in
+neither.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from uuid import UUID
+import anyio
+import database
+from config import config
+
+logger = logging.getLogger(__name__)
+
+_pending: dict[int, int] = {}
+_oldest_pending_at: Optional[float] = None
+_flush_task: Optional[asyncio.Task] = None
+
+# Counter reads in progress, and whether a flush is applying a batch
+_active_reads = 0
+_no_active_reads = asyncio.Event()
+_no_active_reads.set()
+_flush_idle = asyncio.Event()
+_flush_idle.set()
+
+flush_count = 0
+flush_failures = 0
+flushed_deltas = 0
+last_batch_size = 0
+max_batch_size = 0
+last_flush_lag_seconds = 0.0
+max_flush_lag_seconds = 0.0
+
+
+def get_vote_buffer_stats() -> dict:
+    """Return pending deltas, batch sizes and flush lag (age of the oldest delta when flushed)."""
+    return {
+        "enabled": config.VOTE_BUFFER_ENABLED,
+        "pending_arguments": len(_pending),
+        "flushing": not _flush_idle.is_set(),
+        "pending_age_seconds": round(time.monotonic() - _oldest_pending_at, 3) if _oldest_pending_at else 0.0,
+        "flushes": flush_count,
+        "flush_failures": flush_failures,
+        "flushed_deltas": flushed_deltas,
+        "last_batch_size": last_batch_size,
+        "max_batch_size": max_batch_size,
+        "last_flush_lag_seconds": round(last_flush_lag_seconds, 3),
+        "max_flush_lag_seconds": round(max_flush_lag_seconds, 3),
+    }
+
+
+@asynccontextmanager
+async def counter_read() -> AsyncIterator[None]:
+    """
+    Hold while reading stored vote counters and adding pending deltas to them,
+    so no flush commits in between. Waits for a running flush to finish first.
+    """
+    global _active_reads
+
+    while not _flush_idle.is_set():
+        await _flush_idle.wait()
+    _active_reads += 1
+    _no_active_reads.clear()
+    try:
+        yield
+    finally:
+        _active_reads -= 1
+        if _active_reads == 0:
+            _no_active_reads.set()
+
+
+def pending_delta(argument_id: int) -> int:
+    """Unflushed counter change for an argument (call inside counter_read)."""
+    return _pending.get(argument_id, 0)
+
+
+def pending_deltas() -> dict[int, int]:
+    """Snapshot of all unflushed counter changes as {argument_id: delta} (call inside counter_read)."""
+    return dict(_pending)
+
+
+async def record_vote(argument_id: int, user_id: UUID, vote_type: str) -> Optional[tuple[int, Optional[str]]]:
+    """
+    Record a vote click and buffer its counter delta.
+    Returns (vote_count, user_vote_status) including unflushed deltas, or None if the argument doesn't exist.
+    """
+    global _oldest_pending_at
+
+    async with counter_read():
+        result = await database.record_vote(argument_id, user_id, vote_type)
+        if result is None:
+            return None
+
+        stored_count, delta, user_vote = result
+        if delta:
+            if _oldest_pending_at is None:
+                _oldest_pending_at = time.monotonic()
+            _pending[argument_id] = _pending.get(argument_id, 0) + delta
+        return stored_count + pending_delta(argument_id), user_vote
+
+
+async def flush():
+    """Write all buffered deltas in one batch; on failure they are kept for the next attempt."""
+    global _pending, _oldest_pending_at
+    global flush_count, flush_failures, flushed_deltas
+    global last_batch_size, max_batch_size, last_flush_lag_seconds, max_flush_lag_seconds
+
+    if not _pending or not _flush_idle.is_set():
+        return
+
+    _flush_idle.clear()
+    try:
+        # Let reads that may already hold stored counts finish before they change
+        await _no_active_reads.wait()
+        batch = {argument_id: delta for argument_id, delta in _pending.items() if delta}
+        batch_started_at = _oldest_pending_at
+        _pending = {}
+        _oldest_pending_at = None
+        try:
+            # Shielded so a cancelled flush can't leave it unknown whether the batch committed
+            with anyio.CancelScope(shield=True):
+                await database.apply_vote_deltas(batch)
+        except Exception:
+            flush_failures += 1
+            logger.exception(f"Failed to flush {len(batch)} vote counter deltas; retrying next interval")
+            for argument_id, delta in batch.items():
+                _pending[argument_id] = _pending.get(argument_id, 0) + delta
+            _oldest_pending_at = batch_started_at
+            return
+    finally:
+        _flush_idle.set()
+
+    flush_count += 1
+    flushed_deltas += len(batch)
+    last_batch_size = len(batch)
+    max_batch_size = max(max_batch_size, last_batch_size)
+    last_flush_lag_seconds = time.monotonic() - batch_started_at
+    max_flush_lag_seconds = max(max_flush_lag_seconds, last_flush_lag_seconds)
+
+
+async def _flush_loop():
+    """Flush buffered deltas every VOTE_FLUSH_INTERVAL_SECONDS until cancelled."""
+    while True:
+        await asyncio.sleep(config.VOTE_FLUSH_INTERVAL_SECONDS)
+        await flush()
+
+
+def start():
+    """Start the background flush loop (call once the database pool is open)."""
+    global _flush_task
+    if config.VOTE_BUFFER_ENABLED and _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_loop())
+
+
+async def stop():
+    """Stop the flush loop and write whatever is still buffered."""
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+    with anyio.CancelScope(shield=True):
+        await flush()
@@ -0,0 +1,214 @@
+"""
+Background job worker for Debately.
+
+Claims jobs from the Postgres `jobs` queue (FOR UPDATE SKIP LOCKED, so any number
+of worker processes can run side by side) and runs the slow LLM pipelines outside
+the request path.
+
+Run with:
+    python worker.py
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+import api_quota
+import database
+import fact_checker
+import claude_service
+from config import config
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Jobs whose heartbeat is older than this are assumed to belong to a dead worker
+STALE_JOB_SECONDS = 600
+MAX_JOB_ATTEMPTS = 3
+# How often a running job's heartbeat is refreshed, and how often stale jobs are swept
+JOB_HEARTBEAT_SECONDS = 60
+STALE_JOB_SWEEP_SECONDS = 60
+# Pause after a database error in a worker loop before claiming again
+WORKER_ERROR_BACKOFF_SECONDS = 5
+
+
+async def handle_submit_argument(job_id: str, payload: dict) -> tuple[str, dict]:
+    """
+    Fact-check a submitted argument and save it if it is relevant.
+    Returns (status, result) where status is 'done' or 'rejected'.
+    Safe to retry: the argument is keyed on the job, so a rerun after a crash
+    returns the argument the first attempt saved.
+    """
+    verdict = await fact_checker.verify_argument(
+        title=payload['title'],
+        content=payload['content'],
+        debate_proposition=payload['proposition']
+    )
+
+    # Reject irrelevant arguments
+    if not verdict.is_relevant:
+        return 'rejected', {
+            "error": "Argument not relevant",
+            "reasoning": verdict.reasoning,
+            "message": f"This argument was rejected as not relevant to the debate proposition: '{payload['proposition']}'. Please submit an argument with factual claims related to the debate."
+        }
+
+    argument_id = await database.create_argument_for_job(
+        job_id=job_id,
+        topic_id=payload['topic_id'],
+        side=payload['side'],
+        title=payload['title'],
+        content=payload['content'],
+        author=payload['author'],
+        validity_score=verdict.validity_score,
+        validity_reasoning=verdict.reasoning,
+        key_urls=verdict.key_urls,
+        sources=payload.get('sources'),
+        user_id=UUID(payload['user_id']) if payload.get('user_id') else None
+    )
+
+    return 'done', {
+        "argument_id": argument_id,
+        "validity_score": verdict.validity_score,
+        "reasoning": verdict.reasoning,
+        "key_urls": verdict.key_urls
+    }
+
+
+async def handle_refresh_topic(job_id: str, payload: dict) -> tuple[str, dict]:
+    """
+    Fill in the derived data a topic page is missing: validity scores for
+    unverified arguments, then the Claude summary once both sides have arguments.
+    """
+    topic_data = await database.get_topic_with_arguments(payload['topic_id'])
+    if not topic_data:
+        return 'failed', {"error": f"Topic {payload['topic_id']} not found"}
+
+    all_arguments = topic_data['pro_arguments'] + topic_data['con_arguments']
+    unverified = [arg for arg in all_arguments if arg.get('validity_score') is None]
+    semaphore = asyncio.Semaphore(config.FACT_CHECK_BATCH_CONCURRENCY)
+
+    async def check(arg: dict) -> dict:
+        async with semaphore:
+            verdict = await fact_checker.verify_argument(
+                title=arg['title'],
+                content=arg['content'],
+                debate_proposition=topic_data['proposition']
+            )
+        arg['validity_score'] = verdict.validity_score
+        return {
+            "argument_id": arg['id'],
+            "validity_score": verdict.validity_score,
+            "validity_reasoning": verdict.reasoning,
+            "key_urls": verdict.key_urls
+        }
+
+    verdicts = await asyncio.gather(*(check(arg) for arg in unverified))
+    await database.update_arguments_validity_bulk(verdicts)
+
+    summarized = False
+    needs_analysis = (
+        not topic_data.get('overall_summary') or
+        not topic_data.get('consensus_view') or
+        not topic_data.get('timeline_view')
+    )
+    if needs_analysis and topic_data['pro_arguments'] and topic_data['con_arguments']:
+        await claude_service.summarize_topic(payload['topic_id'], topic_data)
+        summarized = True
+
+    return 'done', {"verified": len(verdicts), "summarized": summarized}
+
+
+JOB_HANDLERS = {
+    "submit_argument": handle_submit_argument,
+    "refresh_topic": handle_refresh_topic,
+}
+
+
+async def process_job(job: dict):
+    """Run a claimed job and record its outcome."""
+    handler = JOB_HANDLERS.get(job['job_type'])
+    if not handler:
+        await database.finish_job(job['id'], 'failed', error=f"Unknown job type: {job['job_type']}")
+        return
+
+    heartbeat = asyncio.create_task(_heartbeat(job['id']))
+    try:
+        status, result = await handler(job['id'], job['payload'])
+        await database.finish_job(job['id'], status, result=result)
+        logger.info(f"Job {job['id']} ({job['job_type']}) finished: {status}")
+    except Exception as e:
+        logger.exception(f"Job {job['id']} ({job['job_type']}) failed")
+        try:
+            await database.finish_job(job['id'], 'failed', error=str(e))
+        except Exception:
+            # Left as 'running'; requeue_stale_jobs retries it once the heartbeat goes stale
+            logger.exception(f"Could not record failure of job {job['id']}")
+    finally:
+        heartbeat.cancel()
+
+
+async def _heartbeat(job_id: str):
+    """Keep a running job's updated_at fresh until cancelled."""
+    while True:
+        await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+        try:
+            await database.touch_job(job_id)
+        except Exception:
+            logger.exception(f"Heartbeat for job {job_id} failed")
+
+
+async def requeue_loop():
+    """Periodically hand jobs abandoned by dead workers back to the queue."""
+    while True:
+        try:
+            requeued = await database.requeue_stale_jobs(STALE_JOB_SECONDS, MAX_JOB_ATTEMPTS)
+            if requeued:
+                logger.info(f"Recovered {requeued} stale jobs")
+        except Exception:
+            logger.exception("Stale job sweep failed")
+        await asyncio.sleep(STALE_JOB_SWEEP_SECONDS)
+
+
+async def worker_loop(worker_number: int):
+    """Claim and process jobs until cancelled, sleeping while the queue is empty."""
+    logger.info(f"Worker loop {worker_number} started")
+    while True:
+        try:
+            job = await database.claim_next_job()
+            if job is None:
+                await asyncio.sleep(config.JOB_POLL_INTERVAL_SECONDS)
+                continue
+            await process_job(job)
+        except Exception:
+            # A transient database error must not take down the whole worker process
+            logger.exception(f"Worker loop {worker_number} failed; retrying")
+            await asyncio.sleep(WORKER_ERROR_BACKOFF_SECONDS)
+
+
+async def main():
+    """Open the pool, prune caches, and run the worker loops alongside the stale job sweep."""
+    await database.open_pool()
+    try:
+        pruned = await database.prune_verdict_cache(config.VERDICT_CACHE_TTL_SECONDS)
+        if pruned:
+            logger.info(f"Pruned {pruned} expired fact-check verdicts")
+        pruned = await database.prune_evidence_cache(config.EVIDENCE_CACHE_TTL_SECONDS)
+        if pruned:
+            logger.info(f"Pruned {pruned} expired evidence search results")
+        pruned = await database.prune_work_leases(STALE_JOB_SECONDS)
+        if pruned:
+            logger.info(f"Pruned {pruned} old single-flight leases")
+        await asyncio.gather(
+            requeue_loop(),
+            *(worker_loop(worker_number) for worker_number in range(config.JOB_WORKER_CONCURRENCY))
+        )
+    finally:
+        await api_quota.stop()
+        await database.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
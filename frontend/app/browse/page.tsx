@@ -6,7 +6,7 @@ import { Input } from '@/components/ui/input'
 import { Header } from '@/components/Header'
 import { useAuth } from '@/contexts/AuthContext'
 import { ArrowLeft, Plus, Loader2, Star, Brain, Search } from 'lucide-react'
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import Link from 'next/link'
 import { useRouter } from 'next/navigation'
 import { 
@@ -14,31 +14,70 @@ import {
   type TopicListItem 
 } from '@/src/api'
 
+// Wait this long after the last keystroke before searching
+const SEARCH_DEBOUNCE_MS = 300
+// Shorter terms can't use the server's trigram index, so they aren't sent
+const SEARCH_MIN_LENGTH = 3
+
+const toSearchTerm = (query: string): string | undefined => {
+  const term = query.trim()
+  return term.length >= SEARCH_MIN_LENGTH ? term : undefined
+}
+
 export default function BrowsePage() {
   const router = useRouter()
   const { user, loading: authLoading, signIn } = useAuth()
   const [topics, setTopics] = useState<TopicListItem[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [searchQuery, setSearchQuery] = useState<string>('')
   const [loading, setLoading] = useState(false)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [error, setError] = useState<string | null>(null)
+  // Ignore responses for searches the user has already replaced
+  const requestId = useRef(0)
+  const searchTerm = toSearchTerm(searchQuery)
 
-  const fetchTopics = async () => {
+  const fetchTopics = async (search: string | undefined) => {
+    const id = ++requestId.current
     setLoading(true)
     setError(null)
     try {
-      const data = await getTopics()
-      setTopics(data)
+      const data = await getTopics({ search })
+      if (id !== requestId.current) return
+      setTopics(data.topics)
+      setNextCursor(data.next_cursor)
     } catch (err) {
+      if (id !== requestId.current) return
       setError(err instanceof Error ? err.message : 'Failed to fetch topics')
       console.error('Error fetching topics:', err)
     } finally {
-      setLoading(false)
+      if (id === requestId.current) setLoading(false)
+    }
+  }
+
+  const loadMore = async () => {
+    if (!nextCursor) return
+    const id = requestId.current
+    setLoadingMore(true)
+    setError(null)
+    try {
+      const data = await getTopics({ cursor: nextCursor, search: searchTerm })
+      if (id !== requestId.current) return
+      setTopics(prev => [...prev, ...data.topics])
+      setNextCursor(data.next_cursor)
+    } catch (err) {
+      if (id !== requestId.current) return
+      setError(err instanceof Error ? err.message : 'Failed to fetch topics')
+      console.error('Error fetching more topics:', err)
+    } finally {
+      setLoadingMore(false)
     }
   }
 
   useEffect(() => {
-    fetchTopics()
-  }, [])
+    const timer = setTimeout(() => fetchTopics(searchTerm), searchTerm ? SEARCH_DEBOUNCE_MS : 0)
+    return () => clearTimeout(timer)
+  }, [searchTerm])
 
   return (
     <div className="relative min-h-screen overflow-hidden text-text-primary">
@@ -105,17 +144,10 @@ export default function BrowsePage() {
             <Loader2 className="w-8 h-8 animate-spin text-white" />
           </div>
         ) : (() => {
-          // Filter topics based on search query
-          const filteredTopics = searchQuery.trim() === '' 
-            ? topics 
-            : topics.filter(topic => 
-                topic.proposition.toLowerCase().includes(searchQuery.toLowerCase())
-              )
-          
-          if (filteredTopics.length === 0) {
+          if (topics.length === 0) {
             return (
               <Card className="glass-panel p-12 text-center">
-                {searchQuery.trim() === '' ? (
+                {!searchTerm ? (
                   <p className="text-text-secondary text-lg">No topics yet. Be the first to start a debate!</p>
                 ) : (
                   <>
@@ -135,7 +167,7 @@ export default function BrowsePage() {
 
           return (
             <div className="space-y-6">
-              {filteredTopics.map((topic, index) => (
+              {topics.map((topic, index) => (
               <div key={topic.id}>
                 <Card 
                   className="card card-hover p-8 cursor-pointer"
@@ -219,6 +251,19 @@ export default function BrowsePage() {
               </Card>
               </div>
               ))}
+              {nextCursor && (
+                <div className="flex justify-center pt-4">
+                  <Button
+                    variant="outline"
+                    className="rounded-full border-white/20 hover:bg-white/10 hover:text-white text-text-secondary"
+                    onClick={loadMore}
+                    disabled={loadingMore}
+                  >
+                    {loadingMore && <Loader2 className="w-4 h-4 mr-2 animate-spin" />}
+                    Load more
+                  </Button>
+                </div>
+              )}
             </div>
           )
         })()}
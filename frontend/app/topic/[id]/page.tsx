@@ -21,6 +21,8 @@ import {
   type CommentResponse
 } from '@/src/api'
 
+const TOPIC_REFRESH_INTERVAL_MS = 3000
+
 export default function TopicPage() {
   const params = useParams()
   const topicId = params.id as string  // UUID is a string
@@ -56,17 +58,26 @@ export default function TopicPage() {
     }
   }
 
-  const fetchTopicDetails = async (id: string) => {
-    setLoading(true)
-    setError(null)
+  const fetchTopicDetails = async (id: string, background = false) => {
+    if (!background) {
+      setLoading(true)
+      setError(null)
+    }
     try {
       const data = await getTopic(id)
       setSelectedTopic(data)
+      if (data.user_votes) {
+        setUserVotes(data.user_votes)
+      }
     } catch (err) {
-      setError(err instanceof Error ? err.message : 'Failed to fetch topic details')
+      if (!background) {
+        setError(err instanceof Error ? err.message : 'Failed to fetch topic details')
+      }
       console.error('Error fetching topic:', err)
     } finally {
-      setLoading(false)
+      if (!background) {
+        setLoading(false)
+      }
     }
   }
 
@@ -76,6 +87,13 @@ export default function TopicPage() {
     }
   }, [topicId])
 
+  // Verification and analysis run in the background; refresh until they land (or the refresh fails)
+  useEffect(() => {
+    if (!selectedTopic || selectedTopic.analysis_status !== 'pending') return
+    const timer = setTimeout(() => fetchTopicDetails(selectedTopic.id, true), TOPIC_REFRESH_INTERVAL_MS)
+    return () => clearTimeout(timer)
+  }, [selectedTopic])
+
   const handleAddArgument = async (side: 'pro' | 'con') => {
     if (!selectedTopic || !newArgument.title.trim() || !newArgument.content.trim()) return
     
@@ -921,7 +939,7 @@ export default function TopicPage() {
             )}
           </div>
           
-          {loading && !selectedTopic.overall_summary ? (
+          {(loading || selectedTopic.analysis_status === 'pending') && !selectedTopic.overall_summary ? (
             <div className="flex items-center gap-2 text-purple-400">
               <Loader2 className="w-4 h-4 animate-spin text-white" />
               <span>Generating analysis...</span>
@@ -957,6 +975,8 @@ export default function TopicPage() {
               <p className="text-text-secondary">
                 {selectedTopic.pro_arguments.length === 0 || selectedTopic.con_arguments.length === 0
                   ? 'Add at least one pro and one con argument to generate analysis'
+                  : selectedTopic.analysis_status === 'failed'
+                  ? 'Analysis could not be generated right now. It will be retried in a few minutes.'
                   : 'Analysis will be generated automatically...'}
               </p>
             </div>
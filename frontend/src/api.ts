@@ -45,9 +45,24 @@ export interface TopicListItem {
   created_at?: string;
   pro_avg_validity?: number | null;
   con_avg_validity?: number | null;
+  avg_validity?: number | null;
   controversy_level?: string | null;
 }
 
+export interface TopicListPage {
+  topics: TopicListItem[];
+  next_cursor: string | null;
+}
+
+export interface TopicListParams {
+  limit?: number;
+  cursor?: string;
+  controversy_level?: string;
+  min_validity?: number;
+  created_by?: string;
+  search?: string;  // at least 3 characters
+}
+
 export interface ArgumentCreate {
   side: 'pro' | 'con';
   title: string;
@@ -80,12 +95,31 @@ export interface TopicDetailResponse {
   overall_summary?: string | null;
   consensus_view?: string | null;
   timeline_view?: Array<{ period: string; description: string }> | null;
+  analysis_status: 'ready' | 'pending' | 'failed';  // 'pending' while a background refresh runs, 'failed' if the last one failed recently
+  refresh_job_id?: string | null;
+  user_votes?: Record<number, 'upvote' | 'downvote'> | null;  // only for signed-in callers
+}
+
+export interface UserVotesResponse {
+  topic_id: string;  // UUID as string
+  votes: Record<number, 'upvote' | 'downvote'>;
 }
 
 export interface ArgumentCreateResponse {
   argument_id: number;
 }
 
+export interface JobResponse {
+  job_id: string;  // UUID as string
+  status: 'pending' | 'running' | 'done' | 'rejected' | 'failed';
+  result?: Record<string, any> | null;
+  error?: string | null;
+}
+
+const JOB_POLL_INTERVAL_MS = 1500;
+// Give up waiting on a job after this long (it keeps running on the server)
+const JOB_POLL_TIMEOUT_MS = 5 * 60 * 1000;
+
 export interface SummaryResponse {
   overall_summary: string;
   consensus_view: string;
@@ -189,16 +223,23 @@ export async function createTopic(data: TopicCreate): Promise<TopicResponse> {
 }
 
 /**
- * Get all topics with pro/con argument counts
- * GET /api/topics
+ * Get a page of topics with pro/con argument counts
+ * GET /api/topics?limit=&cursor=&controversy_level=&min_validity=&created_by=&search=
  */
-export async function getTopics(): Promise<TopicListItem[]> {
+export async function getTopics(params: TopicListParams = {}): Promise<TopicListPage> {
   const headers = await getAuthHeaders()
-  const response = await fetch(`${API_BASE_URL}/api/topics`, {
+  const query = new URLSearchParams()
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== '') {
+      query.set(key, String(value))
+    }
+  })
+  const queryString = query.toString() ? `?${query.toString()}` : ''
+  const response = await fetch(`${API_BASE_URL}/api/topics${queryString}`, {
     method: 'GET',
     headers,
   });
-  return handleResponse<TopicListItem[]>(response);
+  return handleResponse<TopicListPage>(response);
 }
 
 /**
@@ -214,9 +255,37 @@ export async function getTopic(topicId: string): Promise<TopicDetailResponse> {
   return handleResponse<TopicDetailResponse>(response);
 }
 
+/**
+ * Get the current user's vote on every argument in a topic
+ * GET /api/topics/{topic_id}/votes
+ */
+export async function getMyVotes(topicId: string): Promise<UserVotesResponse> {
+  const headers = await getAuthHeaders()
+  const response = await fetch(`${API_BASE_URL}/api/topics/${topicId}/votes`, {
+    method: 'GET',
+    headers,
+  });
+  return handleResponse<UserVotesResponse>(response);
+}
+
+/**
+ * Get the status of a background job
+ * GET /api/jobs/{job_id}
+ */
+export async function getJob(jobId: string): Promise<JobResponse> {
+  const headers = await getAuthHeaders()
+  const response = await fetch(`${API_BASE_URL}/api/jobs/${jobId}`, {
+    method: 'GET',
+    headers,
+  });
+  return handleResponse<JobResponse>(response);
+}
+
 /**
  * Add an argument to a topic
- * POST /api/topics/{topic_id}/arguments
+ * POST /api/topics/{topic_id}/arguments (202 + job), then polls the fact-check job.
+ * Rejected arguments throw the same 400-shaped error as before; a job still
+ * unfinished after JOB_POLL_TIMEOUT_MS throws a 504-shaped error.
  */
 export async function createArgument(
   topicId: string,
@@ -228,7 +297,30 @@ export async function createArgument(
     headers,
     body: JSON.stringify(data),
   });
-  return handleResponse<ArgumentCreateResponse>(response);
+  let job = await handleResponse<JobResponse>(response);
+  const deadline = Date.now() + JOB_POLL_TIMEOUT_MS;
+  while (job.status === 'pending' || job.status === 'running') {
+    if (Date.now() >= deadline) {
+      const detail = 'Fact-checking is taking longer than expected. Your argument will appear on the topic if it passes; check back in a few minutes.';
+      const error: any = new Error(detail);
+      error.status = 504;
+      error.detail = detail;
+      error.response = { data: { detail }, status: 504 };
+      throw error;
+    }
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    job = await getJob(job.job_id);
+  }
+  if (job.status === 'done' && job.result) {
+    return { argument_id: job.result.argument_id };
+  }
+  const status = job.status === 'rejected' ? 400 : 500;
+  const detail = job.status === 'rejected' ? job.result : (job.error || 'Fact-checking failed');
+  const error: any = new Error(typeof detail === 'string' ? detail : detail?.message || 'Argument rejected');
+  error.status = status;
+  error.detail = detail;
+  error.response = { data: { detail }, status };
+  throw error;
 }
 
 /**
@@ -261,6 +353,71 @@ export async function generateSummary(topicId: string): Promise<SummaryResponse>
   return handleResponse<SummaryResponse>(response);
 }
 
+export type SummaryStreamEvent =
+  | { event: 'overall_summary'; text: string }
+  | { event: 'consensus_view'; text: string }
+  | { event: 'timeline_entry'; period: string; description: string }
+  | ({ event: 'done' } & SummaryResponse)
+  | { event: 'error'; detail: string };
+
+/**
+ * Generate a topic summary, streamed as Server-Sent Events
+ * POST /api/topics/{topic_id}/generate-summary/stream
+ *
+ * onEvent receives the summary, consensus view and each timeline entry as soon as
+ * they are written. Resolves with the saved result; rejects if generation fails.
+ */
+export async function generateSummaryStream(
+  topicId: string,
+  onEvent?: (event: SummaryStreamEvent) => void
+): Promise<SummaryResponse> {
+  const headers = await getAuthHeaders()
+  const response = await fetch(`${API_BASE_URL}/api/topics/${topicId}/generate-summary/stream`, {
+    method: 'POST',
+    headers,
+  });
+  if (!response.ok || !response.body) {
+    return handleResponse(response);
+  }
+
+  let result: SummaryResponse | null = null;
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  const handleFrame = (frame: string) => {
+    let name = '';
+    let data = '';
+    for (const line of frame.split('\n')) {
+      if (line.startsWith('event:')) name = line.slice(6).trim();
+      else if (line.startsWith('data:')) data += line.slice(5).trim();
+    }
+    if (!name || !data) return;
+    const event = { event: name, ...JSON.parse(data) } as SummaryStreamEvent;
+    onEvent?.(event);
+    if (event.event === 'done') {
+      const { event: _, ...summary } = event;
+      result = summary;
+    } else if (event.event === 'error') {
+      throw new Error(event.detail);
+    }
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const frames = buffer.split('\n\n');
+    buffer = frames.pop() ?? '';
+    frames.forEach(handleFrame);
+  }
+  handleFrame(buffer);
+  if (!result) {
+    throw new Error('Summary stream ended before the summary was complete');
+  }
+  return result;
+}
+
 /**
  * Verify a single argument's validity
  * POST /api/arguments/{argument_id}/verify
@@ -274,28 +431,77 @@ export async function verifyArgument(argumentId: number): Promise<ValidityVerdic
   return handleResponse<ValidityVerdictResponse>(response);
 }
 
+export interface VerifyAllResult {
+  argument_id: number;
+  title: string;
+  validity_score?: number;
+  status: string;
+  error?: string;
+}
+
+export type VerifyAllEvent =
+  | { event: 'started'; batch_started_at: string; total_arguments: number }
+  | ({ event: 'result' } & VerifyAllResult)
+  | { event: 'done'; total_arguments: number; verified: number; failed: number };
+
 /**
  * Verify all arguments for a topic
- * POST /api/topics/{topic_id}/verify-all
+ * POST /api/topics/{topic_id}/verify-all?resume_from=...
+ *
+ * The backend streams NDJSON progress events; onEvent receives each one as it
+ * arrives. Pass a previous batch_started_at as resumeFrom to continue an
+ * interrupted batch.
  */
-export async function verifyAllArguments(topicId: string): Promise<{
+export async function verifyAllArguments(
+  topicId: string,
+  onEvent?: (event: VerifyAllEvent) => void,
+  resumeFrom?: string
+): Promise<{
   total_arguments: number;
   verified: number;
   failed: number;
-  results: Array<{
-    argument_id: number;
-    title: string;
-    validity_score?: number;
-    status: string;
-    error?: string;
-  }>;
+  results: VerifyAllResult[];
 }> {
   const headers = await getAuthHeaders()
-  const response = await fetch(`${API_BASE_URL}/api/topics/${topicId}/verify-all`, {
+  const query = resumeFrom ? `?resume_from=${encodeURIComponent(resumeFrom)}` : '';
+  const response = await fetch(`${API_BASE_URL}/api/topics/${topicId}/verify-all${query}`, {
     method: 'POST',
     headers,
   });
-  return handleResponse(response);
+  if (!response.ok || !response.body) {
+    return handleResponse(response);
+  }
+
+  const summary = { total_arguments: 0, verified: 0, failed: 0, results: [] as VerifyAllResult[] };
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  const handleLine = (line: string) => {
+    if (!line.trim()) return;
+    const event = JSON.parse(line) as VerifyAllEvent;
+    onEvent?.(event);
+    if (event.event === 'started') {
+      summary.total_arguments = event.total_arguments;
+    } else if (event.event === 'result') {
+      const { event: _, ...result } = event;
+      summary.results.push(result);
+    } else {
+      summary.verified = event.verified;
+      summary.failed = event.failed;
+    }
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop() ?? '';
+    lines.forEach(handleLine);
+  }
+  handleLine(buffer);
+  return summary;
 }
 
 /**